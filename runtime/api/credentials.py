@@ -6,18 +6,66 @@ including storing, retrieving, updating, and deleting authentication secrets.
 """
 
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Request, Response, status, Depends
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
 from core.secret_factory import get_secret_storage
-from core.secrets import SecretType, SecretNotFoundError, SecretStorageError, generate_secret_name
+from core.secrets import (
+    SecretStorageInterface, SecretType, SecretNotFoundError, SecretStorageError, generate_secret_name
+)
 from models.manifest import ApiKeyAuth, OAuth2ClientCredentialsAuth
 
 
 router = APIRouter(prefix="/v1/credentials", tags=["credentials"])
 
 
+def _model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize a response model straight to JSON.
+    
+    Returning a Response skips FastAPI's re-validation of a model the endpoint
+    has already built; response_model still documents the schema.
+    """
+    return Response(content=model.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
+async def get_credential_storage(request: Request) -> SecretStorageInterface:
+    """
+    Dependency providing the secret storage backend for the credential endpoints.
+    
+    A backend set on ``app.state.secret_storage`` takes precedence over the
+    process-wide storage from the secret factory. Storage failures are reported
+    as HTTP 500 responses, matching the endpoints' own error handling.
+    """
+    storage = getattr(request.app.state, "secret_storage", None)
+    if storage is not None:
+        return storage
+    
+    try:
+        return await get_secret_storage()
+    except SecretStorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to access secret storage: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unexpected error: {str(e)}"
+        )
+
+
+# (required, allowed) credential fields per supported auth_type
+_CREDENTIAL_FIELDS = {
+    "api_key": (frozenset({"value"}), frozenset({"value", "key_name", "location", "scheme"})),
+    "oauth2_client_credentials": (
+        frozenset({"client_id", "client_secret"}),
+        frozenset({"client_id", "client_secret", "token_url", "scopes"})
+    ),
+}
+
+
 class CredentialRequest(BaseModel):
     """Request model for storing credentials."""
     
@@ -58,9 +106,8 @@ class CredentialRequest(BaseModel):
     @classmethod
     def validate_auth_type(cls, v):
         """Validate that auth_type is supported."""
-        supported_types = {"api_key", "oauth2_client_credentials"}
-        if v not in supported_types:
-            raise ValueError(f"Unsupported auth_type. Must be one of: {supported_types}")
+        if v not in _CREDENTIAL_FIELDS:
+            raise ValueError(f"Unsupported auth_type. Must be one of: {set(_CREDENTIAL_FIELDS)}")
         return v
 
     @field_validator('credentials')
@@ -71,24 +118,18 @@ class CredentialRequest(BaseModel):
         data = info.data if hasattr(info, 'data') else {}
         auth_type = data.get('auth_type')
         
-        if auth_type == "api_key":
-            required_fields = {"value"}
-            optional_fields = {"key_name", "location", "scheme"}
-        elif auth_type == "oauth2_client_credentials":
-            required_fields = {"client_id", "client_secret"}
-            optional_fields = {"token_url", "scopes"}
-        else:
+        if auth_type not in _CREDENTIAL_FIELDS:
             # Should not reach here due to auth_type validation
             raise ValueError("Invalid auth_type")
+        required_fields, all_allowed = _CREDENTIAL_FIELDS[auth_type]
         
         # Check required fields
-        missing_fields = required_fields - set(v.keys())
+        missing_fields = {field for field in required_fields if field not in v}
         if missing_fields:
             raise ValueError(f"Missing required fields for {auth_type}: {missing_fields}")
         
         # Check for unexpected fields
-        all_allowed = required_fields | optional_fields
-        unexpected_fields = set(v.keys()) - all_allowed
+        unexpected_fields = {field for field in v if field not in all_allowed}
         if unexpected_fields:
             raise ValueError(f"Unexpected fields for {auth_type}: {unexpected_fields}")
         
@@ -140,7 +181,10 @@ class CredentialListResponse(BaseModel):
 
 
 @router.post("/", response_model=CredentialResponse, status_code=status.HTTP_201_CREATED)
-async def store_credentials(request: CredentialRequest):
+async def store_credentials(
+    request: CredentialRequest,
+    storage: SecretStorageInterface = Depends(get_credential_storage)
+):
     """
     Store credentials for a connector.
     
@@ -148,8 +192,6 @@ async def store_credentials(request: CredentialRequest):
     calling tools from the specified connector.
     """
     try:
-        storage = await get_secret_storage()
-        
         # Store secrets based on auth type
         if request.auth_type == "api_key":
             # Store the API key value
@@ -200,7 +242,7 @@ async def store_credentials(request: CredentialRequest):
                 expires_at=request.expires_at
             )
         
-        return CredentialResponse(
+        credential = CredentialResponse(
             name=generate_secret_name(request.connector_name, SecretType.API_KEY if request.auth_type == "api_key" else SecretType.OAUTH2_CLIENT_ID),
             connector_name=request.connector_name,
             auth_type=request.auth_type,
@@ -209,6 +251,7 @@ async def store_credentials(request: CredentialRequest):
             expires_at=request.expires_at,
             has_credentials=True
         )
+        return _model_response(credential, status.HTTP_201_CREATED)
         
     except SecretStorageError as e:
         raise HTTPException(
@@ -225,7 +268,8 @@ async def store_credentials(request: CredentialRequest):
 @router.get("/", response_model=CredentialListResponse)
 async def list_credentials(
     connector_name: Optional[str] = None,
-    auth_type: Optional[str] = None
+    auth_type: Optional[str] = None,
+    storage: SecretStorageInterface = Depends(get_credential_storage)
 ):
     """
     List stored credentials with optional filtering.
@@ -234,8 +278,6 @@ async def list_credentials(
     credential values.
     """
     try:
-        storage = await get_secret_storage()
-        
         # Convert auth_type to SecretType for filtering
         secret_type_filter = None
         if auth_type:
@@ -281,10 +323,11 @@ async def list_credentials(
         
         credentials_list = list(credentials_map.values())
         
-        return CredentialListResponse(
+        credential_list = CredentialListResponse(
             credentials=credentials_list,
             total=len(credentials_list)
         )
+        return _model_response(credential_list)
         
     except SecretStorageError as e:
         raise HTTPException(
@@ -298,8 +341,12 @@ async def list_credentials(
         )
 
 
-@router.get("/{connector_name}", response_model=CredentialResponse)
-async def get_credentials(connector_name: str):
+# ":path" lets scoped names such as "@github/api" through as one parameter
+@router.get("/{connector_name:path}", response_model=CredentialResponse)
+async def get_credentials(
+    connector_name: str,
+    storage: SecretStorageInterface = Depends(get_credential_storage)
+):
     """
     Get credential metadata for a specific connector.
     
@@ -307,15 +354,13 @@ async def get_credentials(connector_name: str):
     credential values.
     """
     try:
-        storage = await get_secret_storage()
-        
         # Try to find API key first
         api_key_name = generate_secret_name(connector_name, SecretType.API_KEY)
         oauth_client_id_name = generate_secret_name(connector_name, SecretType.OAUTH2_CLIENT_ID)
         
         if await storage.secret_exists(api_key_name):
             secret_value = await storage.get_secret(api_key_name)
-            return CredentialResponse(
+            credential = CredentialResponse(
                 name=secret_value.metadata.name,
                 connector_name=secret_value.metadata.connector_name,
                 auth_type="api_key",
@@ -324,9 +369,10 @@ async def get_credentials(connector_name: str):
                 expires_at=secret_value.metadata.expires_at,
                 has_credentials=True
             )
+            return _model_response(credential)
         elif await storage.secret_exists(oauth_client_id_name):
             secret_value = await storage.get_secret(oauth_client_id_name)
-            return CredentialResponse(
+            credential = CredentialResponse(
                 name=secret_value.metadata.name,
                 connector_name=secret_value.metadata.connector_name,
                 auth_type="oauth2_client_credentials",
@@ -335,12 +381,15 @@ async def get_credentials(connector_name: str):
                 expires_at=secret_value.metadata.expires_at,
                 has_credentials=True
             )
+            return _model_response(credential)
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No credentials found for connector: {connector_name}"
             )
             
+    except HTTPException:
+        raise
     except SecretNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -358,16 +407,17 @@ async def get_credentials(connector_name: str):
         )
 
 
-@router.delete("/{connector_name}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_credentials(connector_name: str):
+@router.delete("/{connector_name:path}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_credentials(
+    connector_name: str,
+    storage: SecretStorageInterface = Depends(get_credential_storage)
+):
     """
     Delete all credentials for a specific connector.
     
     This will remove all stored authentication secrets for the connector.
     """
     try:
-        storage = await get_secret_storage()
-        
         # Try to delete both API key and OAuth2 credentials
         secrets_deleted = 0
         
@@ -395,6 +445,8 @@ async def delete_credentials(connector_name: str):
                 detail=f"No credentials found for connector: {connector_name}"
             )
         
+    except HTTPException:
+        raise
     except SecretNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -6,9 +6,11 @@ for tool discovery, execution, and protocol compliance.
 """
 
 import logging
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
 
 from core.config import Settings, get_settings
@@ -59,27 +61,17 @@ class MCPCapabilitiesResponse(BaseModel):
     serverInfo: Dict[str, str]
 
 
-@router.get("/capabilities", response_model=MCPCapabilitiesResponse)
-async def get_capabilities(
-    request: Request,
-    settings: Settings = Depends(get_settings)
-):
+@lru_cache(maxsize=1)
+def _capabilities_body(version: str) -> bytes:
     """
-    Get MCP server capabilities.
+    Serialize the capabilities response once per server version.
     
-    Returns the capabilities supported by this MCP server instance,
-    including available tools and protocol features.
+    Args:
+        version: Server version reported in serverInfo
+        
+    Returns:
+        JSON-encoded MCPCapabilitiesResponse
     """
-    tenant_id = getattr(request.state, "tenant_id", None)
-    
-    logger.info(
-        "MCP capabilities requested",
-        extra={
-            "tenant_id": tenant_id,
-            "correlation_id": getattr(request.state, "correlation_id", None)
-        }
-    )
-    
     capabilities = {
         "tools": {
             "listChanged": True,
@@ -97,15 +89,67 @@ async def get_capabilities(
     
     server_info = {
         "name": "MCP Runtime Orchestrator",
-        "version": settings.VERSION
+        "version": version
     }
     
-    return MCPCapabilitiesResponse(
+    return orjson.dumps(MCPCapabilitiesResponse(
         capabilities=capabilities,
         serverInfo=server_info
+    ).model_dump())
+
+
+@lru_cache(maxsize=1)
+def _builtin_mcp_tools() -> Tuple[MCPTool, ...]:
+    """
+    Convert the fixed set of built-in tools to MCP tool definitions once.
+    
+    Callers must not mutate the cached instances; the tools endpoint hands
+    out copies.
+    """
+    return tuple(
+        MCPTool(
+            name=tool.name,
+            description=tool.description,
+            parameters=[
+                MCPToolParameter(
+                    name=param.name,
+                    type=param.type,
+                    description=param.description,
+                    required=param.required
+                )
+                for param in tool.parameters
+            ]
+        )
+        for tool in builtin_tool_handler.list_tools()
     )
 
 
+# The body is pre-serialized and returned as-is, so the model only documents
+# the response schema; FastAPI does not validate a returned Response
+@router.get("/capabilities", responses={200: {"model": MCPCapabilitiesResponse}})
+async def get_capabilities(
+    request: Request,
+    settings: Settings = Depends(get_settings)
+):
+    """
+    Get MCP server capabilities.
+    
+    Returns the capabilities supported by this MCP server instance,
+    including available tools and protocol features.
+    """
+    tenant_id = getattr(request.state, "tenant_id", None)
+    
+    logger.info(
+        "MCP capabilities requested",
+        extra={
+            "tenant_id": tenant_id,
+            "correlation_id": getattr(request.state, "correlation_id", None)
+        }
+    )
+    
+    return Response(content=_capabilities_body(settings.VERSION), media_type="application/json")
+
+
 @router.get("/tools", response_model=MCPToolsResponse)
 async def list_tools(
     request: Request,
@@ -132,7 +176,7 @@ async def list_tools(
         }
     )
     
-    all_tools = []
+    all_tools: List[MCPTool] = []
 
     # Optionally perform hot-reload before listing tools
     try:
@@ -199,21 +243,13 @@ async def list_tools(
         )
 
     # Get built-in tools
-    for tool in builtin_tool_handler.list_tools():
-        mcp_params = []
-        for param in tool.parameters:
-            mcp_params.append(MCPToolParameter(
-                name=param.name,
-                type=param.type,
-                description=param.description,
-                required=param.required
-            ))
-        
-        all_tools.append(MCPTool(
-            name=tool.name,
-            description=tool.description,
-            parameters=mcp_params
-        ))
+    builtin_tools = _builtin_mcp_tools()
+    # Copies skip validation; each gets its own parameters list so no request
+    # can change the cached definitions
+    all_tools.extend(
+        tool.model_copy(update={"parameters": list(tool.parameters)})
+        for tool in builtin_tools
+    )
     
     # Get connector-provided tools
     registry = get_registry()
@@ -264,7 +300,7 @@ async def list_tools(
         extra={
             "tenant_id": tenant_id,
             "project_id": project_id,
-            "builtin_tools_count": len(builtin_tool_handler.list_tools()),
+            "builtin_tools_count": len(builtin_tools),
             "connector_tools_count": connector_tools_count,
             "total_tools_count": len(all_tools),
             "correlation_id": getattr(request.state, "correlation_id", None)
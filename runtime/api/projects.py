@@ -8,7 +8,6 @@ configuration, connector management, and runtime instances.
 import logging
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
-import yaml
 import os
 import asyncio
 from datetime import datetime
@@ -294,10 +293,8 @@ def _load_connector_manifest(connector_id: str, settings: Settings) -> Optional[
             logger.warning(f"Connector manifest not found: {manifest_path}")
             return None
             
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest_data = yaml.safe_load(f)
-            
-        return ConnectorManifest.from_yaml_dict(manifest_data)
+        with open(manifest_path, 'rb') as f:
+            return ConnectorManifest.from_yaml_bytes(f.read())
         
     except Exception as e:
         logger.error(
@@ -630,6 +627,10 @@ async def invoke_tool(
     - Implement rate limiting and retry logic
     - Provide real-time execution monitoring
     - Support streaming responses for long-running operations
+    
+    Errors carry a string ``detail`` like every other endpoint, plus a stable
+    ``X-Error-Code`` header: PROJECT_NOT_FOUND, INVALID_TOOL_NAME or
+    CONNECTOR_NOT_ENABLED.
     """
     tenant_id = getattr(request.state, "tenant_id", None)
     correlation_id = getattr(request.state, "correlation_id", None)
@@ -653,13 +654,21 @@ async def invoke_tool(
         # Validate project exists and belongs to tenant
         # TODO: Implement actual database query
         if project_id != "project-1":
-            raise HTTPException(status_code=404, detail="Project not found")
+            raise HTTPException(
+                status_code=404,
+                detail="Project not found",
+                headers={"X-Error-Code": "PROJECT_NOT_FOUND"}
+            )
         
         # Parse tool name to extract connector and tool
         try:
             connector_id, tool_name = _parse_tool_name(invoke_request.tool_name)
         except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+            raise HTTPException(
+                status_code=400,
+                detail=str(e),
+                headers={"X-Error-Code": "INVALID_TOOL_NAME"}
+            )
         
         # Check if connector is enabled for this project
         # TODO: Implement actual database query for project connectors
@@ -667,8 +676,9 @@ async def invoke_tool(
         enabled_connectors = {"weather-api", "calculator"}
         if connector_id not in enabled_connectors:
             raise HTTPException(
-                status_code=403, 
-                detail=f"Connector '{connector_id}' is not enabled for this project"
+                status_code=403,
+                detail=f"Connector '{connector_id}' is not enabled for this project",
+                headers={"X-Error-Code": "CONNECTOR_NOT_ENABLED"}
             )
         
         # Execute the tool
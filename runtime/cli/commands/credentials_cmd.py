@@ -16,7 +16,8 @@ import yaml
 
 # Add the parent directory to the path for package imports
 runtime_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(runtime_dir))
+if str(runtime_dir) not in sys.path:
+    sys.path.insert(0, str(runtime_dir))
 
 from core.secret_factory import get_secret_storage, close_secret_storage
 from core.secrets import SecretType, SecretNotFoundError, SecretStorageError, generate_secret_name
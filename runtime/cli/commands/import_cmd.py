@@ -6,7 +6,7 @@ This command imports OpenAPI specifications and converts them to MCP connector m
 
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import json
 import re
 
@@ -19,9 +19,13 @@ from openapi_spec_validator.exceptions import OpenAPISpecValidatorError
 
 # Add parent directory to path for imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
 
-from models.manifest import ConnectorManifest, ConnectorTool, ToolAuth
+# Where manifests go when no --output is given; tests point this elsewhere
+DEFAULT_OUTPUT_DIR = parent_dir / "samples"
+
+from models.manifest import YAML_DUMPER, YAML_LOADER, ConnectorManifest, ConnectorTool, ToolAuth
 
 
 @click.command(
@@ -36,7 +40,7 @@ from models.manifest import ConnectorManifest, ConnectorTool, ToolAuth
 @click.option(
     "--output", "-o",
     type=click.Path(path_type=Path),
-    help="Output file path for generated manifest (default: saved to samples directory)"
+    help="Output file path for generated manifest; a .json suffix writes JSON (default: YAML in samples directory)"
 )
 @click.option(
     "--name", "-n",
@@ -158,7 +162,7 @@ def import_command(
             safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', connector_name)
             
             # Save to samples directory by default
-            samples_dir = parent_dir / "samples"
+            samples_dir = DEFAULT_OUTPUT_DIR
             samples_dir.mkdir(exist_ok=True)  # Ensure samples directory exists
             output = samples_dir / f"{safe_name}.yaml"
         
@@ -167,15 +171,19 @@ def import_command(
             click.echo(click.style(f"Output file {output} already exists. Use --force to overwrite.", fg='red'))
             sys.exit(1)
         
-        # Step 8: Save manifest
+        # Step 8: Save manifest (JSON for .json outputs, YAML otherwise)
         with open(output, 'w', encoding='utf-8') as f:
-            yaml.dump(manifest, f, default_flow_style=False, sort_keys=False, indent=2)
+            if output.suffix.lower() == '.json':
+                json.dump(manifest, f, indent=2)
+            else:
+                yaml.dump(manifest, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False, indent=2)
         
         # Step 9: Success message
         tools_count = len(manifest["connector"]["tools"])
         click.echo(click.style(f"✓ Successfully generated MCP connector manifest!", fg='green', bold=True))
         click.echo(f"  Output file: {output}")
-        click.echo(f"  Saved to samples directory: {output.relative_to(parent_dir)}")
+        if output.resolve().is_relative_to(parent_dir.resolve()):
+            click.echo(f"  Saved to samples directory: {output.resolve().relative_to(parent_dir.resolve())}")
         click.echo(f"  Connector name: {manifest['connector']['name']}")
         click.echo(f"  Connector version: {manifest['connector']['version']}")
         click.echo(f"  Tools generated: {tools_count}")
@@ -208,12 +216,12 @@ def load_openapi_spec(source: str, verbose: bool) -> Dict[str, Any]:
         click.echo(f"  Loading from source: {source}")
     
     if source == '-':
-        # Read from stdin
-        content = sys.stdin.read()
+        # Read raw bytes from stdin; both parsers accept bytes directly
+        content = sys.stdin.buffer.read()
         try:
             return json.loads(content)
         except json.JSONDecodeError:
-            return yaml.safe_load(content)
+            return yaml.load(content, Loader=YAML_LOADER)
     
     elif source.startswith(('http://', 'https://')):
         # Fetch from URL
@@ -224,7 +232,7 @@ def load_openapi_spec(source: str, verbose: bool) -> Dict[str, Any]:
         if 'json' in content_type:
             return response.json()
         else:
-            return yaml.safe_load(response.text)
+            return yaml.load(response.text, Loader=YAML_LOADER)
     
     else:
         # Load from local file
@@ -239,7 +247,7 @@ def load_openapi_spec(source: str, verbose: bool) -> Dict[str, Any]:
         if source_path.suffix.lower() == '.json':
             return json.loads(content)
         else:
-            return yaml.safe_load(content)
+            return yaml.load(content, Loader=YAML_LOADER)
 
 
 def resolve_openapi_references(spec_data: Dict[str, Any], verbose: bool) -> Dict[str, Any]:
@@ -414,6 +422,22 @@ def extract_base_url(spec_data: Dict[str, Any], source_url: Optional[str], verbo
     return None
 
 
+def compile_path_filter(patterns: Optional[List[str]]) -> Tuple[re.Pattern, ...]:
+    """
+    Compile path filter patterns once for reuse across every path.
+    
+    Each pattern is compiled on its own so inline flags and group
+    references keep their per-pattern meaning.
+    
+    Args:
+        patterns: Regex patterns from --include-path/--exclude-path
+        
+    Returns:
+        Tuple of compiled patterns, empty when there are none
+    """
+    return tuple(re.compile(pattern) for pattern in patterns or ())
+
+
 def convert_openapi_to_mcp(
     spec_data: Dict[str, Any],
     name_override: Optional[str] = None,
@@ -468,12 +492,14 @@ def convert_openapi_to_mcp(
     # Extract and convert paths to tools
     tools = []
     paths = spec_data.get('paths', {})
+    include_re = compile_path_filter(include_patterns)
+    exclude_re = compile_path_filter(exclude_patterns)
     
     for path, path_item in paths.items():
         # Apply include/exclude filters
-        if include_patterns and not any(re.search(pattern, path) for pattern in include_patterns):
+        if include_re and not any(p.search(path) for p in include_re):
             continue
-        if exclude_patterns and any(re.search(pattern, path) for pattern in exclude_patterns):
+        if exclude_re and any(p.search(path) for p in exclude_re):
             continue
         
         # Convert each HTTP method to a tool
@@ -5,9 +5,11 @@ This command validates MCP connector manifests using the schema validation
 that's already implemented in models.manifest.
 """
 
+import copy
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import click
 import yaml
@@ -15,9 +17,34 @@ from pydantic_core import ValidationError
 
 # Add parent directory to path for imports
 parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
 
-from models.manifest import ConnectorManifest
+from models.manifest import YAML_LOADER, ConnectorManifest
+
+
+@lru_cache(maxsize=128)
+def _parse_manifest_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a manifest file; mtime and size are part of the cache key so edits re-parse."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def load_manifest_yaml(manifest_file: Path) -> Any:
+    """
+    Load a manifest's YAML content, reusing the parse of an unchanged file.
+    
+    Args:
+        manifest_file: Path to the manifest file
+        
+    Returns:
+        Parsed YAML document, a copy the caller may mutate freely
+    """
+    # Resolve so relative and absolute spellings of one file share a cache entry
+    path = manifest_file.resolve()
+    stat = path.stat()
+    # The model keeps nested schema dicts as-is, so hand out a copy of the cached parse
+    return copy.deepcopy(_parse_manifest_yaml(str(path), stat.st_mtime_ns, stat.st_size))
 
 
 @click.command(
@@ -120,8 +147,7 @@ def validate_single_manifest(manifest_file: Path, strict: bool, verbose: bool) -
         if verbose:
             click.echo(f"  Loading YAML file: {manifest_file}")
             
-        with open(manifest_file, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
+        yaml_data = load_manifest_yaml(manifest_file)
         
         if not isinstance(yaml_data, dict):
             result["errors"].append("YAML file must contain a dictionary/object at root level")
@@ -10,7 +10,8 @@ from pathlib import Path
 
 # Add parent directory to path for imports
 parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
 
 import click
 from cli.commands.import_cmd import import_command
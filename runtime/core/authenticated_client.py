@@ -8,21 +8,77 @@ configurations.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Union
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Union
 import httpx
-import json
+import orjson
 
 from .credential_resolver import get_credential_resolver, CredentialResolutionError, ResolvedCredentials
-from models.manifest import ConnectorTool
+from models.manifest import ConnectorTool, get_schema_validator
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the shared client used for tool calls
+HTTP_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
+# Default number of tool calls execute_tools keeps in flight at once
+DEFAULT_TOOL_CONCURRENCY = 40
+
+# Matches {name} placeholders in tool URL templates
+_URL_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
+
+@lru_cache(maxsize=1024)
+def _compile_url_template(template: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    Compile a URL template into a function that fills its {name} placeholders.
+    
+    The template is scanned once; placeholders with no matching input are left
+    in the URL unchanged.
+    
+    Args:
+        template: URL containing {name} placeholders
+        
+    Returns:
+        Function mapping input data to the substituted URL
+    """
+    # re.split alternates literal text and placeholder names
+    parts = _URL_PLACEHOLDER_RE.split(template)
+    if len(parts) == 1:
+        return lambda input_data: template
+    
+    literals = parts[0::2]
+    fields = parts[1::2]
+    
+    def render(input_data: Dict[str, Any]) -> str:
+        pieces = [literals[0]]
+        for field, literal in zip(fields, literals[1:]):
+            pieces.append(str(input_data[field]) if field in input_data else f"{{{field}}}")
+            pieces.append(literal)
+        return "".join(pieces)
+    
+    return render
+
+
+@dataclass
+class ToolCall:
+    """A single tool invocation for ToolExecutionClient.execute_tools."""
+    
+    tool: ConnectorTool
+    connector_name: str
+    input_data: Dict[str, Any]
+    base_url: Optional[str] = None
+
 
 class AuthenticatedHttpClient:
     """
     HTTP client that automatically applies authentication for connector tools.
     
-    This client wraps httpx.AsyncClient and automatically resolves and applies
+    This client wraps a long-lived httpx.AsyncClient, so connections are kept
+    alive and reused across tool calls, and automatically resolves and applies
     authentication credentials based on the tool's auth configuration.
     """
 
@@ -37,6 +93,24 @@ class AuthenticatedHttpClient:
         self.timeout = timeout
         self.max_redirects = max_redirects
         self._credential_resolver = get_credential_resolver()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared httpx client, creating it on first use or after it was closed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                max_redirects=self.max_redirects,
+                limits=HTTP_CLIENT_LIMITS
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared httpx client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def request(
         self,
@@ -86,16 +160,11 @@ class AuthenticatedHttpClient:
             logger.info(f"Making authenticated {method} request to {url}")
             logger.debug(f"Auth summary: {credentials.redacted_summary()}")
             
-            # Make the request
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                max_redirects=self.max_redirects
-            ) as client:
-                response = await client.request(method, url, **kwargs)
-                
-                logger.info(f"Request completed: {response.status_code} {response.reason_phrase}")
-                return response
+            # Make the request on the shared client
+            response = await self._get_client().request(method, url, **kwargs)
+            
+            logger.info(f"Request completed: {response.status_code} {response.reason_phrase}")
+            return response
                 
         except CredentialResolutionError:
             logger.error(f"Failed to resolve credentials for {method} {url}")
@@ -201,16 +270,46 @@ class ToolExecutionClient:
                 logger.debug(f"Exception attributes: {e.__dict__}")
             raise
 
+    async def execute_tools(
+        self,
+        calls: List[ToolCall],
+        concurrency: int = DEFAULT_TOOL_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several tool calls concurrently, with at most `concurrency` in flight.
+        
+        Args:
+            calls: Tool calls to execute
+            concurrency: Maximum number of calls running at the same time
+            
+        Returns:
+            Tool execution results, in the same order as `calls`
+            
+        Raises:
+            The first exception raised by any call, as execute_tool would
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def execute_one(call: ToolCall) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.execute_tool(
+                    tool=call.tool,
+                    connector_name=call.connector_name,
+                    input_data=call.input_data,
+                    base_url=call.base_url
+                )
+        
+        return await asyncio.gather(*(execute_one(call) for call in calls))
+
     def _validate_input_data(self, tool: ConnectorTool, input_data: Dict[str, Any]) -> None:
         """Validate input data against tool's input schema with automatic type conversion."""
-        from jsonschema import Draft7Validator, ValidationError as JSONSchemaValidationError
+        from jsonschema import ValidationError as JSONSchemaValidationError
         
         # First, apply type coercion based on schema
         coerced_data = self._coerce_input_types(tool, input_data)
         
         try:
-            validator = Draft7Validator(tool.input_schema)
-            validator.validate(coerced_data)
+            get_schema_validator(tool.input_schema).validate(coerced_data)
             
             # Update the original input_data dict with coerced values
             input_data.clear()
@@ -311,14 +410,9 @@ class ToolExecutionClient:
             logger.error(f"Cannot build URL for tool '{tool.name}': no base URL provided and endpoint is not a full URL")
             raise ValueError(f"Cannot build URL for tool '{tool.name}': no base URL provided")
         
-        # Simple URL parameter substitution (MVP implementation)
-        # In a full implementation, this would be more sophisticated
+        # Substitute {name} placeholders from the input data
         original_url = url
-        for key, value in input_data.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in url:
-                url = url.replace(placeholder, str(value))
-                logger.debug(f"Replaced placeholder '{placeholder}' with '{value}' in URL")
+        url = _compile_url_template(url)(input_data)
         
         if url != original_url:
             logger.debug(f"URL after parameter substitution: {url}")
@@ -350,12 +444,17 @@ class ToolExecutionClient:
         """Prepare request data based on HTTP method."""
         logger.debug(f"Preparing request data for method '{method}' with input data: {input_data}")
         
-        kwargs = {}
+        kwargs: Dict[str, Any] = {}
         
         if method in ["POST", "PUT", "PATCH"]:
             # For write operations, send data as JSON body
-            kwargs["json"] = input_data
-            kwargs["headers"] = {"Content-Type": "application/json"}
+            try:
+                kwargs["content"] = orjson.dumps(input_data, option=orjson.OPT_NON_STR_KEYS)
+                kwargs["headers"] = {"Content-Type": "application/json"}
+            except orjson.JSONEncodeError:
+                # orjson rejects values such as integers wider than 64 bits;
+                # let httpx encode those with the standard json module
+                kwargs["json"] = input_data
             logger.debug(f"Using JSON body for {method} request: {input_data}")
         else:
             # For read operations, check if any parameters are path parameters
@@ -400,7 +499,7 @@ class ToolExecutionClient:
         # Parse response data
         try:
             if response.headers.get("content-type", "").startswith("application/json"):
-                result_data = response.json()
+                result_data = orjson.loads(response.content)
             else:
                 # For non-JSON responses, wrap in a simple structure
                 result_data = {
@@ -408,7 +507,7 @@ class ToolExecutionClient:
                     "content_type": response.headers.get("content-type", ""),
                     "status_code": response.status_code
                 }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # If JSON parsing fails, return text content
             result_data = {
                 "content": response.text,
@@ -427,17 +526,17 @@ class ToolExecutionClient:
 
     def _validate_output_data(self, tool: ConnectorTool, output_data: Dict[str, Any]) -> None:
         """Validate output data against tool's output schema."""
-        from jsonschema import Draft7Validator, ValidationError as JSONSchemaValidationError
+        from jsonschema import ValidationError as JSONSchemaValidationError
         
         try:
-            validator = Draft7Validator(tool.output_schema)
-            validator.validate(output_data)
+            get_schema_validator(tool.output_schema).validate(output_data)
         except JSONSchemaValidationError as e:
             raise ValueError(f"Output validation failed for tool '{tool.name}': {e.message}")
 
 
 # Global tool execution client instance
 _tool_execution_client: Optional[ToolExecutionClient] = None
+_tool_execution_client_lock = threading.Lock()
 
 
 def get_tool_execution_client() -> ToolExecutionClient:
@@ -449,8 +548,12 @@ def get_tool_execution_client() -> ToolExecutionClient:
     """
     global _tool_execution_client
     
+    # Double-checked so the common path takes no lock and threads racing on
+    # first use still build a single instance
     if _tool_execution_client is None:
-        _tool_execution_client = ToolExecutionClient()
+        with _tool_execution_client_lock:
+            if _tool_execution_client is None:
+                _tool_execution_client = ToolExecutionClient()
     
     return _tool_execution_client
 
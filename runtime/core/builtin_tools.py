@@ -7,14 +7,20 @@ that don't require external connectors.
 
 import datetime
 import logging
-from typing import Any, Dict, List
-
-from pydantic import BaseModel
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-class ToolParameter(BaseModel):
+def _text_content(text: str) -> List[Dict[str, Any]]:
+    """Build a single MCP text content block."""
+    return [{"type": "text", "text": text}]
+
+
+@dataclass(slots=True)
+class ToolParameter:
     """Tool parameter definition."""
     name: str
     type: str
@@ -23,7 +29,8 @@ class ToolParameter(BaseModel):
     default: Any = None
 
 
-class BuiltinTool(BaseModel):
+@dataclass(slots=True)
+class BuiltinTool:
     """Built-in tool definition."""
     name: str
     description: str
@@ -31,8 +38,13 @@ class BuiltinTool(BaseModel):
     category: str = "builtin"
 
 
-class ToolExecutionResult(BaseModel):
-    """Result of tool execution."""
+@dataclass(slots=True)
+class ToolExecutionResult:
+    """Result of tool execution.
+    
+    Built only by the handler itself, so it is a plain dataclass rather than a
+    validated model; API responses copy its fields into their own schemas.
+    """
     content: List[Dict[str, Any]]
     is_error: bool = False
     execution_time_ms: int = 0
@@ -41,9 +53,24 @@ class ToolExecutionResult(BaseModel):
 class BuiltinToolHandler:
     """Handler for built-in tools."""
     
-    def __init__(self):
-        """Initialize the built-in tool handler."""
+    # Formatters for the get_time tool, keyed by the accepted 'format' values
+    _TIME_FORMATTERS: Dict[str, Callable[[datetime.datetime], str]] = {
+        "iso": lambda now: now.isoformat(),
+        "timestamp": lambda now: str(int(now.timestamp())),
+        "human": lambda now: now.strftime("%A, %B %d, %Y at %I:%M:%S %p"),
+    }
+    
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        """
+        Initialize the built-in tool handler.
+        
+        Args:
+            clock: Nanosecond clock used to measure tool execution time
+        """
+        self._clock = clock
         self._tools = self._register_builtin_tools()
+        # The tool set is fixed after registration, so listings share one tuple
+        self._tools_tuple: Tuple[BuiltinTool, ...] = tuple(self._tools.values())
     
     def _register_builtin_tools(self) -> Dict[str, BuiltinTool]:
         """Register all built-in tools."""
@@ -95,15 +122,16 @@ class BuiltinToolHandler:
         
         return tools
     
-    def list_tools(self) -> List[BuiltinTool]:
+    def list_tools(self) -> Tuple[BuiltinTool, ...]:
         """Get all available built-in tools."""
-        return list(self._tools.values())
+        return self._tools_tuple
     
     def get_tool(self, name: str) -> BuiltinTool:
         """Get a specific built-in tool by name."""
-        if name not in self._tools:
-            raise ValueError(f"Built-in tool '{name}' not found")
-        return self._tools[name]
+        try:
+            return self._tools[name]
+        except KeyError:
+            raise ValueError(f"Built-in tool '{name}' not found") from None
     
     def has_tool(self, name: str) -> bool:
         """Check if a built-in tool exists."""
@@ -111,7 +139,7 @@ class BuiltinToolHandler:
     
     async def execute_tool(self, name: str, arguments: Dict[str, Any]) -> ToolExecutionResult:
         """Execute a built-in tool."""
-        start_time = datetime.datetime.now()
+        start_ns = self._clock()
         
         try:
             if not self.has_tool(name):
@@ -130,8 +158,7 @@ class BuiltinToolHandler:
                 raise ValueError(f"No handler implemented for tool '{name}'")
             
             # Calculate execution time
-            end_time = datetime.datetime.now()
-            execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            execution_time_ms = (self._clock() - start_ns) // 1_000_000
             
             logger.info(
                 f"Built-in tool '{name}' executed successfully",
@@ -146,8 +173,7 @@ class BuiltinToolHandler:
             
         except Exception as e:
             # Calculate execution time even for errors
-            end_time = datetime.datetime.now()
-            execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            execution_time_ms = (self._clock() - start_ns) // 1_000_000
             
             logger.error(
                 f"Built-in tool '{name}' execution failed",
@@ -160,10 +186,7 @@ class BuiltinToolHandler:
             )
             
             return ToolExecutionResult(
-                content=[{
-                    "type": "text",
-                    "text": f"Error executing built-in tool '{name}': {str(e)}"
-                }],
+                content=_text_content(f"Error executing built-in tool '{name}': {str(e)}"),
                 is_error=True,
                 execution_time_ms=execution_time_ms
             )
@@ -176,10 +199,7 @@ class BuiltinToolHandler:
             raise ValueError("The 'text' parameter must be a string")
         
         return ToolExecutionResult(
-            content=[{
-                "type": "text",
-                "text": text
-            }],
+            content=_text_content(text),
             is_error=False
         )
     
@@ -194,10 +214,7 @@ class BuiltinToolHandler:
         greeting = f"Hello, {name}! Welcome to the MCP Runtime Orchestrator. I'm here to help you execute tools and manage API connectors."
         
         return ToolExecutionResult(
-            content=[{
-                "type": "text",
-                "text": greeting
-            }],
+            content=_text_content(greeting),
             is_error=False
         )
     
@@ -205,22 +222,14 @@ class BuiltinToolHandler:
         """Handle get_time tool execution."""
         time_format = arguments.get("format", "iso").lower()
         
-        now = datetime.datetime.now()
-        
-        if time_format == "iso":
-            time_str = now.isoformat()
-        elif time_format == "timestamp":
-            time_str = str(int(now.timestamp()))
-        elif time_format == "human":
-            time_str = now.strftime("%A, %B %d, %Y at %I:%M:%S %p")
-        else:
+        formatter = self._TIME_FORMATTERS.get(time_format)
+        if formatter is None:
             raise ValueError(f"Invalid time format '{time_format}'. Use 'iso', 'timestamp', or 'human'")
         
+        time_str = formatter(datetime.datetime.now())
+        
         return ToolExecutionResult(
-            content=[{
-                "type": "text",
-                "text": f"Current time ({time_format}): {time_str}"
-            }],
+            content=_text_content(f"Current time ({time_format}): {time_str}"),
             is_error=False
         )
 
@@ -7,20 +7,34 @@ applied based on the tool's auth configuration.
 """
 
 import asyncio
-from typing import Dict, Optional, Any, List
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, DefaultDict, Dict, Optional, Any, List, Tuple
 import logging
 from dataclasses import dataclass
 
+import httpx
+
 from .secret_factory import get_secret_storage
-from .secrets import SecretType, SecretNotFoundError, SecretStorageError, generate_secret_name
+from .secrets import (
+    SecretStorageInterface, SecretType, SecretValue, SecretNotFoundError, SecretStorageError, generate_secret_name
+)
 from models.manifest import ConnectorTool, ApiKeyAuth, OAuth2ClientCredentialsAuth, NoAuth
 
 logger = logging.getLogger(__name__)
 
+# Tokens are treated as expired this many seconds before the IdP says they are
+OAUTH_TOKEN_EXPIRY_MARGIN_SECONDS = 300
+DEFAULT_OAUTH_TOKEN_LIFETIME_SECONDS = 3600
+# Cached tokens this close to expiry are refreshed in the background
+OAUTH_TOKEN_REFRESH_WINDOW_SECONDS = 120
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolvedCredentials:
-    """Container for resolved credential data."""
+    """Container for resolved credential data; immutable once resolved."""
     
     auth_type: str
     headers: Dict[str, str]
@@ -40,9 +54,9 @@ class ResolvedCredentials:
             "has_query_params": bool(self.query_params),
             "has_cookies": bool(self.cookies),
             "has_oauth_token": bool(self.oauth_token),
-            "header_names": list(self.headers.keys()) if self.headers else [],
-            "query_param_names": list(self.query_params.keys()) if self.query_params else [],
-            "cookie_names": list(self.cookies.keys()) if self.cookies else []
+            "header_names": list(self.headers),
+            "query_param_names": list(self.query_params),
+            "cookie_names": list(self.cookies)
         }
 
 
@@ -61,7 +75,34 @@ class CredentialResolver:
 
     def __init__(self):
         """Initialize the credential resolver."""
-        self._oauth_token_cache: Dict[str, str] = {}  # Simple in-memory cache for OAuth tokens
+        # OAuth tokens by cache key, stored with their monotonic expiry time
+        self._oauth_token_cache: Dict[str, Tuple[str, float]] = {}
+        # One lock per cache key so concurrent cold calls share a single token request
+        self._oauth_token_locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Background token refreshes in flight, by cache key
+        self._oauth_refresh_tasks: Dict[str, asyncio.Task] = {}
+        # Shared client for token endpoint requests, created on first use
+        self._token_client: Optional[httpx.AsyncClient] = None
+        # Credential resolvers keyed by the auth config's "type" discriminator
+        self._resolvers_by_auth_type = {
+            "none": self._resolve_no_auth_credentials,
+            "api_key": self._resolve_api_key_credentials,
+            "oauth2_client_credentials": self._resolve_oauth2_credentials,
+        }
+
+    def _get_token_client(self) -> httpx.AsyncClient:
+        """Get the shared client for OAuth2 token requests, creating it on first use or after it was closed."""
+        if self._token_client is None or self._token_client.is_closed:
+            self._token_client = httpx.AsyncClient()
+        return self._token_client
+
+    async def aclose(self) -> None:
+        """Cancel background token refreshes and close the shared OAuth2 token client."""
+        for task in list(self._oauth_refresh_tasks.values()):
+            task.cancel()
+        if self._token_client is not None:
+            await self._token_client.aclose()
+            self._token_client = None
 
     async def resolve_credentials(self, tool: ConnectorTool, connector_name: str) -> ResolvedCredentials:
         """
@@ -78,24 +119,24 @@ class CredentialResolver:
             CredentialResolutionError: If credential resolution fails
         """
         try:
-            if tool.auth.type == "none":
-                return ResolvedCredentials(
-                    auth_type="none",
-                    headers={},
-                    query_params={},
-                    cookies={}
-                )
-            elif tool.auth.type == "api_key":
-                return await self._resolve_api_key_credentials(tool, connector_name)
-            elif tool.auth.type == "oauth2_client_credentials":
-                return await self._resolve_oauth2_credentials(tool, connector_name)
-            else:
+            resolve = self._resolvers_by_auth_type.get(tool.auth.type)
+            if resolve is None:
                 raise CredentialResolutionError(f"Unsupported auth type: {tool.auth.type}")
+            return await resolve(tool, connector_name)
                 
         except Exception as e:
             logger.error(f"Failed to resolve credentials for tool '{tool.name}': {e}")
             raise CredentialResolutionError(f"Credential resolution failed: {str(e)}")
 
+    async def _resolve_no_auth_credentials(self, tool: ConnectorTool, connector_name: str) -> ResolvedCredentials:
+        """Resolve credentials for a tool that needs no authentication."""
+        return ResolvedCredentials(
+            auth_type="none",
+            headers={},
+            query_params={},
+            cookies={}
+        )
+
     async def _resolve_api_key_credentials(self, tool: ConnectorTool, connector_name: str) -> ResolvedCredentials:
         """Resolve API key credentials."""
         if not isinstance(tool.auth, ApiKeyAuth):
@@ -154,28 +195,13 @@ class CredentialResolver:
             raise CredentialResolutionError("Tool auth is not OAuth2 client credentials type")
 
         try:
-            # Check if we have a cached access token
-            cache_key = f"{connector_name}:oauth2"
-            if cache_key in self._oauth_token_cache:
-                access_token = self._oauth_token_cache[cache_key]
-                logger.info(f"Using cached OAuth2 token for connector '{connector_name}'")
-                
-                return ResolvedCredentials(
-                    auth_type="oauth2_client_credentials",
-                    headers={"Authorization": f"Bearer {access_token}"},
-                    query_params={},
-                    cookies={},
-                    oauth_token=access_token
-                )
-            
             # Get OAuth2 credentials from storage
             storage = await get_secret_storage()
-            client_id_name = generate_secret_name(connector_name, SecretType.OAUTH2_CLIENT_ID)
-            client_secret_name = generate_secret_name(connector_name, SecretType.OAUTH2_CLIENT_SECRET)
             
             try:
-                client_id_secret = await storage.get_secret(client_id_name)
-                client_secret_secret = await storage.get_secret(client_secret_name)
+                client_id_secret, client_secret_secret = await self._get_oauth2_client_secrets(
+                    storage, connector_name
+                )
                 
                 client_id = client_id_secret.value
                 client_secret = client_secret_secret.value
@@ -189,17 +215,15 @@ class CredentialResolver:
                 if not token_url:
                     raise CredentialResolutionError("OAuth2 token URL not configured")
                 
-                # Request access token
-                access_token = await self._request_oauth2_token(
+                # Get an access token, reusing a cached one while it is still valid
+                access_token = await self._get_oauth2_token(
+                    connector_name=connector_name,
                     token_url=token_url,
                     client_id=client_id,
                     client_secret=client_secret,
                     scopes=scopes
                 )
                 
-                # Cache the token (simple in-memory cache without expiration for MVP)
-                self._oauth_token_cache[cache_key] = access_token
-                
                 logger.info(f"Resolved OAuth2 credentials for connector '{connector_name}' tool '{tool.name}'")
                 
                 return ResolvedCredentials(
@@ -216,10 +240,121 @@ class CredentialResolver:
         except SecretStorageError as e:
             raise CredentialResolutionError(f"Failed to retrieve OAuth2 credentials: {str(e)}")
 
-    async def _request_oauth2_token(self, token_url: str, client_id: str, client_secret: str, scopes: List[str]) -> str:
-        """Request an OAuth2 access token using client credentials flow."""
-        import httpx
+    @staticmethod
+    async def _get_oauth2_client_secrets(
+        storage: SecretStorageInterface, connector_name: str
+    ) -> Tuple[SecretValue, SecretValue]:
+        """Fetch a connector's OAuth2 client ID and client secret concurrently."""
+        client_id_name = generate_secret_name(connector_name, SecretType.OAUTH2_CLIENT_ID)
+        client_secret_name = generate_secret_name(connector_name, SecretType.OAUTH2_CLIENT_SECRET)
+        
+        client_id_secret, client_secret_secret = await asyncio.gather(
+            storage.get_secret(client_id_name),
+            storage.get_secret(client_secret_name)
+        )
+        return client_id_secret, client_secret_secret
+
+    @staticmethod
+    def _oauth_cache_key(
+        connector_name: str, token_url: str, client_id: str, client_secret: str, scopes: List[str]
+    ) -> str:
+        """
+        Build the token cache key for a connector's OAuth2 configuration.
+        
+        The credentials are hashed so rotated secrets or changed scopes miss the
+        cache, without keeping the client secret itself as a dictionary key.
+        """
+        digest = hashlib.sha256(
+            f"{token_url}|{client_id}|{client_secret}|{','.join(sorted(scopes))}".encode()
+        ).hexdigest()
+        return f"{connector_name}:oauth2:{digest}"
+
+    async def _get_oauth2_token(
+        self, connector_name: str, token_url: str, client_id: str, client_secret: str, scopes: List[str]
+    ) -> str:
+        """
+        Get an OAuth2 access token from the cache, requesting a new one when missing or expired.
+        
+        Args:
+            connector_name: Name of the connector the token belongs to
+            token_url: OAuth2 token endpoint
+            client_id: OAuth2 client ID
+            client_secret: OAuth2 client secret
+            scopes: Requested scopes
+            
+        Returns:
+            Access token
+        """
+        cache_key = self._oauth_cache_key(connector_name, token_url, client_id, client_secret, scopes)
+        
+        def fetch_token() -> Awaitable[Tuple[str, int]]:
+            return self._request_oauth2_token(
+                token_url=token_url,
+                client_id=client_id,
+                client_secret=client_secret,
+                scopes=scopes
+            )
+        
+        cached = self._oauth_token_cache.get(cache_key)
+        if cached and cached[1] > time.monotonic():
+            logger.info(f"Using cached OAuth2 token for connector '{connector_name}'")
+            self._maybe_schedule_refresh(cache_key, cached[1], fetch_token)
+            return cached[0]
+        
+        async with self._oauth_token_locks[cache_key]:
+            # Another task may have refreshed the token while we waited for the lock
+            cached = self._oauth_token_cache.get(cache_key)
+            if cached and cached[1] > time.monotonic():
+                return cached[0]
+            
+            access_token, expires_in = await fetch_token()
+            self._store_oauth2_token(cache_key, access_token, expires_in)
+            return access_token
+
+    def _store_oauth2_token(self, cache_key: str, access_token: str, expires_in: int) -> None:
+        """Cache an access token until shortly before the IdP-reported expiry."""
+        expires_at = time.monotonic() + max(expires_in - OAUTH_TOKEN_EXPIRY_MARGIN_SECONDS, 0)
+        self._oauth_token_cache[cache_key] = (access_token, expires_at)
+
+    def _maybe_schedule_refresh(
+        self, cache_key: str, expires_at: float, fetch_coro_factory: Callable[[], Awaitable[Tuple[str, int]]]
+    ) -> None:
+        """
+        Start a background token refresh when a cached token is about to expire.
         
+        The caller keeps using the still-valid cached token; at most one refresh
+        runs per cache key at a time.
+        
+        Args:
+            cache_key: OAuth token cache key
+            expires_at: Monotonic expiry time of the cached token
+            fetch_coro_factory: Callable returning a coroutine that yields (token, expires_in)
+        """
+        if cache_key in self._oauth_refresh_tasks:
+            return
+        if expires_at - time.monotonic() >= OAUTH_TOKEN_REFRESH_WINDOW_SECONDS:
+            return
+        
+        task = asyncio.create_task(self._refresh_oauth2_token(cache_key, fetch_coro_factory))
+        self._oauth_refresh_tasks[cache_key] = task
+        task.add_done_callback(lambda _: self._oauth_refresh_tasks.pop(cache_key, None))
+
+    async def _refresh_oauth2_token(
+        self, cache_key: str, fetch_coro_factory: Callable[[], Awaitable[Tuple[str, int]]]
+    ) -> None:
+        """Fetch a fresh token and swap it into the cache, leaving the old entry on failure."""
+        try:
+            async with self._oauth_token_locks[cache_key]:
+                access_token, expires_in = await fetch_coro_factory()
+                self._store_oauth2_token(cache_key, access_token, expires_in)
+            logger.info("Refreshed OAuth2 token in the background")
+        except CredentialResolutionError as e:
+            logger.warning(f"Background OAuth2 token refresh failed: {e}")
+
+    async def _request_oauth2_token(
+        self, token_url: str, client_id: str, client_secret: str, scopes: List[str]
+    ) -> Tuple[str, int]:
+        """Request an OAuth2 access token using client credentials flow, returning it with its lifetime in seconds."""
         try:
             data = {
                 "grant_type": "client_credentials",
@@ -230,26 +365,27 @@ class CredentialResolver:
             if scopes:
                 data["scope"] = " ".join(scopes)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    token_url,
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"}
+            response = await self._get_token_client().post(
+                token_url,
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            
+            if response.status_code != 200:
+                raise CredentialResolutionError(
+                    f"OAuth2 token request failed: {response.status_code} {response.text}"
                 )
-                
-                if response.status_code != 200:
-                    raise CredentialResolutionError(
-                        f"OAuth2 token request failed: {response.status_code} {response.text}"
-                    )
-                
-                token_data = response.json()
-                access_token = token_data.get("access_token")
-                
-                if not access_token:
-                    raise CredentialResolutionError("No access token in OAuth2 response")
-                
-                logger.info(f"Successfully obtained OAuth2 access token from {token_url}")
-                return access_token
+            
+            token_data = response.json()
+            access_token = token_data.get("access_token")
+            
+            if not access_token:
+                raise CredentialResolutionError("No access token in OAuth2 response")
+            
+            expires_in = int(token_data.get("expires_in") or DEFAULT_OAUTH_TOKEN_LIFETIME_SECONDS)
+            
+            logger.info(f"Successfully obtained OAuth2 access token from {token_url}")
+            return access_token, expires_in
                 
         except httpx.RequestError as e:
             raise CredentialResolutionError(f"Failed to request OAuth2 token: {str(e)}")
@@ -265,11 +401,17 @@ class CredentialResolver:
                           If None, clear all cached tokens.
         """
         if connector_name:
-            cache_key = f"{connector_name}:oauth2"
-            self._oauth_token_cache.pop(cache_key, None)
+            prefix = f"{connector_name}:oauth2:"
+            for cache_key in [key for key in self._oauth_token_cache if key.startswith(prefix)]:
+                del self._oauth_token_cache[cache_key]
+            for cache_key, task in list(self._oauth_refresh_tasks.items()):
+                if cache_key.startswith(prefix):
+                    task.cancel()
             logger.info(f"Cleared OAuth token cache for connector '{connector_name}'")
         else:
             self._oauth_token_cache.clear()
+            for task in list(self._oauth_refresh_tasks.values()):
+                task.cancel()
             logger.info("Cleared all OAuth token cache")
 
     async def validate_credentials(self, tool: ConnectorTool, connector_name: str) -> bool:
@@ -292,6 +434,7 @@ class CredentialResolver:
 
 # Global credential resolver instance
 _credential_resolver: Optional[CredentialResolver] = None
+_credential_resolver_lock = threading.Lock()
 
 
 def get_credential_resolver() -> CredentialResolver:
@@ -303,8 +446,12 @@ def get_credential_resolver() -> CredentialResolver:
     """
     global _credential_resolver
     
+    # Double-checked so the common path takes no lock and threads racing on
+    # first use still build a single instance
     if _credential_resolver is None:
-        _credential_resolver = CredentialResolver()
+        with _credential_resolver_lock:
+            if _credential_resolver is None:
+                _credential_resolver = CredentialResolver()
     
     return _credential_resolver
 
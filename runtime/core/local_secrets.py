@@ -6,12 +6,14 @@ encrypted local files. Suitable for development and testing environments.
 """
 
 import asyncio
-import json
 import os
 import base64
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
+from functools import lru_cache
+
+import orjson
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -20,12 +22,21 @@ from .secrets import (
     SecretStorageInterface,
     SecretType,
     SecretMetadata,
+    SecretRecord,
     SecretValue,
     SecretStorageError,
     SecretNotFoundError
 )
 
 
+@lru_cache(maxsize=512)
+def _secret_file_name(name: str) -> str:
+    """Map a secret name to its file name; the mapping is pure, so it never needs invalidating."""
+    # Use base64 encoding to handle special characters in names
+    safe_name = base64.urlsafe_b64encode(name.encode()).decode().rstrip('=')
+    return f"{safe_name}.secret"
+
+
 class LocalSecretStorage(SecretStorageInterface):
     """
     Local file-based secret storage with encryption.
@@ -57,6 +68,17 @@ class LocalSecretStorage(SecretStorageInterface):
         # Metadata file path
         self.metadata_file = self.storage_dir / "secrets_metadata.json"
         self.metadata = self._load_metadata()
+        
+        # Decrypted values of secrets written or read by this instance, keyed
+        # by name with the signature of the file they came from; a value is
+        # reused only while the file is unchanged, so rotations done by another
+        # process (e.g. the credentials CLI) are picked up on the next read
+        self._value_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        
+        # File I/O runs in worker threads, but self.metadata and the value
+        # cache are only changed on the event loop thread. Writers hold this
+        # lock so their changes and metadata saves never interleave.
+        self._write_lock = asyncio.Lock()
 
     def _get_or_create_key(self) -> bytes:
         """Get existing encryption key or create a new one."""
@@ -84,26 +106,112 @@ class LocalSecretStorage(SecretStorageInterface):
             return {}
         
         try:
-            with open(self.metadata_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(self.metadata_file, 'rb') as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError):
             return {}
 
-    def _save_metadata(self) -> None:
-        """Save metadata to the metadata file."""
+    def _save_metadata(self, metadata: Optional[Dict[str, Dict]] = None) -> None:
+        """
+        Save metadata to the metadata file, replacing it atomically.
+        
+        Args:
+            metadata: Snapshot to save; defaults to the live metadata, which is
+                only safe to pass from the event loop thread
+        """
+        if metadata is None:
+            metadata = self.metadata
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
-            # Set restrictive permissions on metadata file
-            os.chmod(self.metadata_file, 0o600)
+            temp_file = self.metadata_file.with_name(self.metadata_file.name + ".tmp")
+            with open(temp_file, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            # Set restrictive permissions before the file becomes visible
+            os.chmod(temp_file, 0o600)
+            os.replace(temp_file, self.metadata_file)
         except IOError as e:
             raise SecretStorageError(f"Failed to save metadata: {e}")
 
     def _get_secret_file_path(self, name: str) -> Path:
         """Get the file path for a secret."""
-        # Use base64 encoding to handle special characters in names
-        safe_name = base64.urlsafe_b64encode(name.encode()).decode().rstrip('=')
-        return self.storage_dir / f"{safe_name}.secret"
+        return self.storage_dir / _secret_file_name(name)
+
+    def _file_signature(self, name: str) -> Tuple[int, int]:
+        """Modification time and size of a secret's file; raises FileNotFoundError if it is missing."""
+        stat = self._get_secret_file_path(name).stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _write_secret_file(self, record: SecretRecord) -> Tuple[int, int]:
+        """Encrypt a secret and write its file, returning the file signature (blocking; touches no shared state)."""
+        # Encrypt the secret value
+        encrypted_value = self.fernet.encrypt(record.value.encode())
+        
+        # Store encrypted value to file
+        secret_file = self._get_secret_file_path(record.name)
+        with open(secret_file, 'wb') as f:
+            f.write(encrypted_value)
+        
+        # Set restrictive permissions
+        os.chmod(secret_file, 0o600)
+        return self._file_signature(record.name)
+
+    def _write_secret_files(self, records: List[SecretRecord]) -> List[Tuple[int, int]]:
+        """Write the encrypted files for several secrets, returning their signatures (blocking)."""
+        return [self._write_secret_file(record) for record in records]
+
+    def _remove_files(self, name: str, metadata: Dict[str, Dict]) -> None:
+        """Delete a secret's file, then save a metadata snapshot (blocking)."""
+        secret_file = self._get_secret_file_path(name)
+        if secret_file.exists():
+            secret_file.unlink()
+        self._save_metadata(metadata)
+
+    def _record_metadata(self, record: SecretRecord) -> Dict:
+        """Build the stored metadata entry for a secret."""
+        now = datetime.now(timezone.utc).isoformat()
+        return {
+            "secret_type": record.secret_type.value,
+            "connector_name": record.connector_name,
+            "description": record.description,
+            "tags": record.tags or {},
+            "expires_at": record.expires_at,
+            "created_at": now,
+            "updated_at": now
+        }
+
+    def _apply_records(self, records: List[SecretRecord], signatures: List[Tuple[int, int]]) -> None:
+        """Record secrets in the in-memory metadata and value cache."""
+        for record, signature in zip(records, signatures):
+            self.metadata[record.name] = self._record_metadata(record)
+            self._value_cache[record.name] = (signature, record.value)
+
+    def _ensure_no_write_in_progress(self) -> None:
+        """Refuse a synchronous write while an async writer holds the write lock."""
+        # Synchronous writers never yield to the event loop, so if the lock is
+        # free now no async writer can start before they finish
+        if self._write_lock.locked():
+            raise SecretStorageError("Cannot write secrets synchronously while a write is in progress")
+
+    async def _store_records(self, records: List[SecretRecord]) -> None:
+        """Write secrets in a worker thread, then record them and save the metadata."""
+        async with self._write_lock:
+            # Files first, so a reader never sees metadata for a missing file
+            signatures = await asyncio.to_thread(self._write_secret_files, records)
+            self._apply_records(records, signatures)
+            await asyncio.to_thread(self._save_metadata, dict(self.metadata))
+
+    def _read_secret_file(
+        self, name: str, cached_signature: Optional[Tuple[int, int]] = None
+    ) -> Tuple[Tuple[int, int], Optional[bytes]]:
+        """Read a secret's encrypted file along with its signature (blocking).
+
+        The contents are None when the file still matches ``cached_signature``.
+        """
+        with open(self._get_secret_file_path(name), 'rb') as f:
+            stat = os.fstat(f.fileno())
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == cached_signature:
+                return signature, None
+            return signature, f.read()
 
     async def store_secret(
         self,
@@ -116,56 +224,101 @@ class LocalSecretStorage(SecretStorageInterface):
         expires_at: Optional[str] = None
     ) -> None:
         """Store a secret in encrypted local file."""
+        record = SecretRecord(
+            name=name,
+            value=value,
+            secret_type=secret_type,
+            connector_name=connector_name,
+            description=description,
+            tags=tags,
+            expires_at=expires_at
+        )
         try:
-            # Encrypt the secret value
-            encrypted_value = self.fernet.encrypt(value.encode())
-            
-            # Store encrypted value to file
-            secret_file = self._get_secret_file_path(name)
-            with open(secret_file, 'wb') as f:
-                f.write(encrypted_value)
-            
-            # Set restrictive permissions
-            os.chmod(secret_file, 0o600)
+            await self._store_records([record])
             
-            # Store metadata
-            self.metadata[name] = {
-                "secret_type": secret_type.value,
-                "connector_name": connector_name,
-                "description": description,
-                "tags": tags or {},
-                "expires_at": expires_at,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            }
+        except Exception as e:
+            raise SecretStorageError(f"Failed to store secret locally: {e}")
+
+    async def store_secrets_bulk(self, records: List[SecretRecord]) -> None:
+        """Store several secrets, saving the metadata file once for the whole batch."""
+        try:
+            await self._store_records(records)
             
+        except Exception as e:
+            raise SecretStorageError(f"Failed to store secrets locally: {e}")
+
+    def store_secrets_blocking(self, records: List[SecretRecord]) -> None:
+        """
+        Store several secrets synchronously on the calling thread (test and tooling use).
+        
+        Must be called from the event loop thread, or with no loop running; it
+        refuses to run while an async write holds the write lock.
+        """
+        self._ensure_no_write_in_progress()
+        try:
+            signatures = self._write_secret_files(records)
+            self._apply_records(records, signatures)
             self._save_metadata()
             
+        except Exception as e:
+            raise SecretStorageError(f"Failed to store secrets locally: {e}")
+
+    async def upsert_secret(self, record: SecretRecord) -> None:
+        """Store a secret, merging with its existing metadata in a single metadata write."""
+        try:
+            async with self._write_lock:
+                signature = await asyncio.to_thread(self._write_secret_file, record)
+                
+                entry = self._record_metadata(record)
+                existing = self.metadata.get(record.name)
+                if existing is not None:
+                    if record.description is None:
+                        entry["description"] = existing.get("description")
+                    if record.tags is None:
+                        entry["tags"] = existing.get("tags", {})
+                    if record.expires_at is None:
+                        entry["expires_at"] = existing.get("expires_at")
+                    entry["created_at"] = existing.get("created_at", entry["created_at"])
+                
+                self.metadata[record.name] = entry
+                self._value_cache[record.name] = (signature, record.value)
+                await asyncio.to_thread(self._save_metadata, dict(self.metadata))
+            
         except Exception as e:
             raise SecretStorageError(f"Failed to store secret locally: {e}")
 
     async def get_secret(self, name: str) -> SecretValue:
         """Retrieve a secret from encrypted local file."""
         try:
-            if name not in self.metadata:
+            # Entries are replaced, never mutated, so this stays consistent
+            # even if the secret is changed or deleted while the file is read
+            meta_data = self.metadata.get(name)
+            if meta_data is None:
                 raise SecretNotFoundError(f"Secret '{name}' not found")
             
-            # Check if secret file exists
-            secret_file = self._get_secret_file_path(name)
-            if not secret_file.exists():
+            # The file is checked against the cached signature in the worker
+            # thread, so no stat() runs on the event loop
+            cached = self._value_cache.get(name)
+            try:
+                signature, encrypted_value = await asyncio.to_thread(
+                    self._read_secret_file, name, cached[0] if cached is not None else None
+                )
+            except FileNotFoundError:
                 raise SecretNotFoundError(f"Secret file for '{name}' not found")
             
-            # Read and decrypt the secret value
-            with open(secret_file, 'rb') as f:
-                encrypted_value = f.read()
-            
-            try:
-                decrypted_value = self.fernet.decrypt(encrypted_value).decode()
-            except Exception as e:
-                raise SecretStorageError(f"Failed to decrypt secret '{name}': {e}")
+            if encrypted_value is None:
+                decrypted_value = cached[1]
+            else:
+                # Decrypt the secret value
+                try:
+                    decrypted_value = self.fernet.decrypt(encrypted_value).decode()
+                except Exception as e:
+                    raise SecretStorageError(f"Failed to decrypt secret '{name}': {e}")
+                # Only cache if the secret was not replaced or deleted meanwhile
+                if self.metadata.get(name) is meta_data:
+                    self._value_cache[name] = (signature, decrypted_value)
             
             # Build metadata
-            meta_data = self.metadata[name]
             try:
                 secret_type = SecretType(meta_data["secret_type"])
             except (ValueError, KeyError):
@@ -190,17 +343,14 @@ class LocalSecretStorage(SecretStorageInterface):
     async def delete_secret(self, name: str) -> None:
         """Delete a secret from local storage."""
         try:
-            if name not in self.metadata:
-                raise SecretNotFoundError(f"Secret '{name}' not found")
-            
-            # Delete the secret file
-            secret_file = self._get_secret_file_path(name)
-            if secret_file.exists():
-                secret_file.unlink()
-            
-            # Remove from metadata
-            del self.metadata[name]
-            self._save_metadata()
+            async with self._write_lock:
+                if name not in self.metadata:
+                    raise SecretNotFoundError(f"Secret '{name}' not found")
+                
+                # Drop the entry on the loop thread, then delete the file
+                del self.metadata[name]
+                self._value_cache.pop(name, None)
+                await asyncio.to_thread(self._remove_files, name, dict(self.metadata))
             
         except SecretNotFoundError:
             raise
@@ -257,22 +407,26 @@ class LocalSecretStorage(SecretStorageInterface):
     ) -> None:
         """Update metadata for an existing secret."""
         try:
-            if name not in self.metadata:
-                raise SecretNotFoundError(f"Secret '{name}' not found")
-            
-            # Update metadata
-            if description is not None:
-                self.metadata[name]["description"] = description
-            
-            if tags is not None:
-                self.metadata[name]["tags"] = tags
-            
-            if expires_at is not None:
-                self.metadata[name]["expires_at"] = expires_at
-            
-            self.metadata[name]["updated_at"] = datetime.now(timezone.utc).isoformat()
-            
-            self._save_metadata()
+            async with self._write_lock:
+                if name not in self.metadata:
+                    raise SecretNotFoundError(f"Secret '{name}' not found")
+                
+                # Update a copy and swap it in, so saved snapshots and
+                # in-flight readers never see a half-updated entry
+                entry = dict(self.metadata[name])
+                if description is not None:
+                    entry["description"] = description
+                
+                if tags is not None:
+                    entry["tags"] = tags
+                
+                if expires_at is not None:
+                    entry["expires_at"] = expires_at
+                
+                entry["updated_at"] = datetime.now(timezone.utc).isoformat()
+                self.metadata[name] = entry
+                
+                await asyncio.to_thread(self._save_metadata, dict(self.metadata))
             
         except SecretNotFoundError:
             raise
@@ -285,10 +439,14 @@ class LocalSecretStorage(SecretStorageInterface):
 
     def clear_all_secrets(self) -> None:
         """
-        Clear all secrets (useful for testing).
+        Clear all secrets synchronously (test-only).
+        
+        Like store_secrets_blocking, it refuses to run while an async write
+        holds the write lock.
         
         WARNING: This will permanently delete all stored secrets!
         """
+        self._ensure_no_write_in_progress()
         try:
             # Delete all secret files
             for name in self.metadata.keys():
@@ -298,6 +456,7 @@ class LocalSecretStorage(SecretStorageInterface):
             
             # Clear metadata
             self.metadata.clear()
+            self._value_cache.clear()
             self._save_metadata()
             
         except Exception as e:
@@ -6,6 +6,7 @@ connector descriptors to their loaded tool definitions, maintaining version
 information and supporting hot-reload capabilities.
 """
 
+import json
 import logging
 from typing import Any, Dict, List, Optional, Set
 from dataclasses import dataclass, field
@@ -16,7 +17,7 @@ from pathlib import Path
 import yaml
 from pydantic import ValidationError
 
-from models.manifest import ConnectorManifest, ConnectorTool
+from models.manifest import YAML_LOADER, ConnectorManifest, ConnectorTool
 from core.config import get_settings
 from core.exceptions import MCPRuntimeException
 
@@ -254,9 +255,12 @@ class InternalRegistry:
                     status_code=404
                 )
             
-            # Read and parse YAML
+            # Read and parse the descriptor (JSON descriptors skip the YAML parser)
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                if file_path.suffix.lower() == '.json':
+                    data = json.load(f)
+                else:
+                    data = yaml.load(f, Loader=YAML_LOADER)
             
             # Validate and create manifest
             manifest = ConnectorManifest.from_yaml_dict(data)
@@ -317,6 +321,12 @@ class InternalRegistry:
                 error_type="YAML_ERROR",
                 status_code=400
             )
+        except json.JSONDecodeError as e:
+            raise MCPRuntimeException(
+                message=f"Invalid JSON in connector descriptor: {e}",
+                error_type="JSON_ERROR",
+                status_code=400
+            )
         except Exception as e:
             logger.exception("Unexpected error loading connector from file")
             raise MCPRuntimeException(
@@ -425,6 +435,30 @@ class InternalRegistry:
             registry.add_connector(connector)
             return True
     
+    def install_connectors(
+        self,
+        project_id: str,
+        connectors: List[LoadedConnector],
+        replace_existing: bool = True
+    ) -> List[str]:
+        """
+        Install several connectors into a project registry under a single lock.
+        
+        Args:
+            project_id: The project ID to install the connectors in
+            connectors: LoadedConnectors to install
+            replace_existing: Whether to replace existing connectors with the same name
+            
+        Returns:
+            Names of the connectors that were installed
+        """
+        installed = []
+        with self._lock:
+            for connector in connectors:
+                if self.install_connector(project_id, connector, replace_existing):
+                    installed.append(connector.name)
+        return installed
+    
     def uninstall_connector(self, project_id: str, connector_name: str) -> bool:
         """
         Uninstall a connector from a project registry.
@@ -119,6 +119,71 @@ class RegistryService:
                 status_code=500
             )
     
+    def install_connectors_from_paths(
+        self,
+        project_id: str,
+        tenant_id: str,
+        file_paths: List[Path],
+        config: Optional[Dict[str, Any]] = None,
+        enabled: bool = True
+    ) -> List[LoadedConnector]:
+        """
+        Install connectors from several descriptor files in one batch.
+        
+        All files are loaded and validated first, then the resulting connectors
+        are installed under a single registry lock. Files that fail to load are
+        logged and skipped.
+        
+        Args:
+            project_id: The project ID
+            tenant_id: The tenant ID
+            file_paths: Paths to the connector descriptor files
+            config: Optional configuration override applied to every connector
+            enabled: Whether the connectors should be enabled
+            
+        Returns:
+            List of installed LoadedConnector instances
+        """
+        self.ensure_project_registry(project_id, tenant_id)
+        
+        connectors = []
+        for file_path in file_paths:
+            try:
+                connector = self.registry.load_connector_from_file(
+                    project_id,
+                    file_path,
+                    config
+                )
+            except MCPRuntimeException as e:
+                logger.warning(
+                    "Failed to load connector from file",
+                    extra={
+                        "project_id": project_id,
+                        "file_path": str(file_path),
+                        "error": e.message
+                    }
+                )
+                continue
+            connector.enabled = enabled
+            connectors.append(connector)
+        
+        installed_names = set(
+            self.registry.install_connectors(project_id, connectors, replace_existing=True)
+        )
+        installed = [c for c in connectors if c.name in installed_names]
+        
+        logger.info(
+            "Connectors installed successfully",
+            extra={
+                "project_id": project_id,
+                "tenant_id": tenant_id,
+                "connector_names": [c.name for c in installed],
+                "enabled": enabled
+            }
+        )
+        
+        return installed
+    
     def install_connector_from_manifest(
         self,
         project_id: str,
@@ -500,29 +565,27 @@ class RegistryService:
         Returns:
             List of installed connector names
         """
-        installed = []
         samples_dir = Path(__file__).parent.parent / "samples"
         
-        for sample_file in samples_dir.glob("*.yaml"):
-            try:
-                connector = self.install_connector_from_file(
-                    project_id=project_id,
-                    tenant_id=tenant_id,
-                    file_path=sample_file,
-                    enabled=True
-                )
-                installed.append(connector.name)
-            except Exception as e:
-                logger.warning(
-                    "Failed to install sample connector",
-                    extra={
-                        "project_id": project_id,
-                        "sample_file": str(sample_file),
-                        "error": str(e)
-                    }
-                )
+        try:
+            connectors = self.install_connectors_from_paths(
+                project_id=project_id,
+                tenant_id=tenant_id,
+                file_paths=sorted(samples_dir.glob("*.yaml")),
+                enabled=True
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to install sample connectors",
+                extra={
+                    "project_id": project_id,
+                    "samples_dir": str(samples_dir),
+                    "error": str(e)
+                }
+            )
+            return []
         
-        return installed
+        return [connector.name for connector in connectors]
 
 
 # Global service instance
@@ -8,6 +8,7 @@ secret storage backends based on configuration.
 import os
 from typing import Optional
 from enum import Enum
+from functools import lru_cache
 
 from .config import get_settings
 from .secrets import SecretStorageInterface
@@ -21,6 +22,19 @@ class SecretStorageType(Enum):
     AZURE_KEYVAULT = "azure_keyvault"
 
 
+@lru_cache(maxsize=8)
+def _storage_type_for(azure_key_vault_url: Optional[str], is_development: bool) -> SecretStorageType:
+    """Pick the storage type for a configuration; keyed on every input, so it never goes stale."""
+    # If Azure Key Vault URL is configured and we're not in development, use Azure
+    if (azure_key_vault_url and
+        not is_development and
+        azure_key_vault_url.startswith("https://")):
+        return SecretStorageType.AZURE_KEYVAULT
+    
+    # Default to local storage for development or when Azure is not configured
+    return SecretStorageType.LOCAL
+
+
 class SecretStorageFactory:
     """Factory for creating secret storage instances."""
     
@@ -42,8 +56,6 @@ class SecretStorageFactory:
         Raises:
             ValueError: If storage type is invalid or configuration is missing
         """
-        settings = get_settings()
-        
         if storage_type is None:
             storage_type = SecretStorageFactory._detect_storage_type()
         
@@ -63,15 +75,7 @@ class SecretStorageFactory:
             SecretStorageType based on available configuration
         """
         settings = get_settings()
-        
-        # If Azure Key Vault URL is configured and we're not in development, use Azure
-        if (settings.AZURE_KEY_VAULT_URL and 
-            not settings.is_development() and 
-            settings.AZURE_KEY_VAULT_URL.startswith("https://")):
-            return SecretStorageType.AZURE_KEYVAULT
-        
-        # Default to local storage for development or when Azure is not configured
-        return SecretStorageType.LOCAL
+        return _storage_type_for(settings.AZURE_KEY_VAULT_URL, settings.is_development())
     
     @staticmethod
     def _create_local_storage(**kwargs) -> SecretStorageInterface:
@@ -7,6 +7,8 @@ storage for development.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from enum import Enum
 import asyncio
@@ -57,6 +59,19 @@ class SecretValue:
         return self.__str__()
 
 
+@dataclass
+class SecretRecord:
+    """A secret and its metadata, as passed to SecretStorageInterface.store_secrets_bulk."""
+    
+    name: str
+    value: str
+    secret_type: SecretType
+    connector_name: str
+    description: Optional[str] = None
+    tags: Optional[Dict[str, str]] = None
+    expires_at: Optional[str] = None
+
+
 class SecretStorageError(Exception):
     """Base exception for secret storage operations."""
     pass
@@ -103,6 +118,67 @@ class SecretStorageInterface(ABC):
         """
         pass
 
+    async def store_secrets_bulk(self, records: List[SecretRecord]) -> None:
+        """
+        Store several secrets at once.
+        
+        The default implementation issues the store_secret calls concurrently;
+        backends that can persist a batch in one write should override it.
+        
+        Args:
+            records: Secrets to store
+            
+        Raises:
+            SecretStorageError: If any storage operation fails
+        """
+        await asyncio.gather(*(
+            self.store_secret(
+                name=record.name,
+                value=record.value,
+                secret_type=record.secret_type,
+                connector_name=record.connector_name,
+                description=record.description,
+                tags=record.tags,
+                expires_at=record.expires_at
+            )
+            for record in records
+        ))
+
+    async def upsert_secret(self, record: SecretRecord) -> None:
+        """
+        Store a secret, keeping existing metadata the record leaves unset.
+        
+        Replaces the value of an existing secret; description, tags and
+        expires_at that are None on the record keep their stored values. The
+        default implementation reads the existing metadata and calls
+        store_secret; backends that can merge in one write should override it.
+        
+        Args:
+            record: Secret to create or update
+            
+        Raises:
+            SecretStorageError: If storage operation fails
+        """
+        description, tags, expires_at = record.description, record.tags, record.expires_at
+        if await self.secret_exists(record.name):
+            existing = (await self.get_secret(record.name)).metadata
+            if description is None:
+                description = existing.description
+            if tags is None:
+                tags = existing.tags
+            if expires_at is None:
+                expires_at = existing.expires_at
+        
+        await self.store_secret(
+            name=record.name,
+            value=record.value,
+            secret_type=record.secret_type,
+            connector_name=record.connector_name,
+            description=description,
+            tags=tags,
+            expires_at=expires_at
+        )
+
     @abstractmethod
     async def get_secret(self, name: str) -> SecretValue:
         """
@@ -212,10 +288,14 @@ class SecretStorageInterface(ABC):
         await self.close()
 
 
+@lru_cache(maxsize=1024)
 def generate_secret_name(connector_name: str, secret_type: SecretType, suffix: Optional[str] = None) -> str:
     """
     Generate a standardized secret name.
     
+    Results are memoized: the same few connector/type pairs are looked up on
+    every credential resolution.
+    
     Args:
         connector_name: Name of the connector
         secret_type: Type of secret
@@ -8,8 +8,9 @@ retries, rate limiting, and observability.
 
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -26,6 +27,15 @@ from core.middleware import (
 )
 from core.exceptions import MCPRuntimeException
 from core.registry import get_registry
+from core.authenticated_client import get_tool_execution_client
+from core.credential_resolver import get_credential_resolver
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 @asynccontextmanager
@@ -51,6 +61,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     logger.info("Shutting down MCP Runtime Orchestrator")
+    await get_tool_execution_client().http_client.aclose()
+    await get_credential_resolver().aclose()
 
 
 async def load_sample_connectors(registry, logger):
@@ -123,9 +135,13 @@ async def load_sample_connectors(registry, logger):
         )
 
 
-def create_app() -> FastAPI:
+def create_app(testing: bool = False) -> FastAPI:
     """
     Create and configure the FastAPI application.
+    
+    Args:
+        testing: Build a lighter app for the test suite, without the OpenAPI and
+            docs routes or per-request access logging
     """
     settings = get_settings()
     
@@ -138,8 +154,10 @@ def create_app() -> FastAPI:
         version=settings.VERSION,
         debug=settings.DEBUG,
         lifespan=lifespan,
-        docs_url="/docs" if settings.DEBUG else None,
-        redoc_url="/redoc" if settings.DEBUG else None,
+        default_response_class=ORJSONResponse,
+        openapi_url=None if testing else "/openapi.json",
+        docs_url="/docs" if settings.DEBUG and not testing else None,
+        redoc_url="/redoc" if settings.DEBUG and not testing else None,
     )
     
     # Security middleware
@@ -159,7 +177,8 @@ def create_app() -> FastAPI:
     
     # Custom middleware (order matters - added in reverse order of execution)
     app.add_middleware(ErrorHandlingMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
+    if not testing:
+        app.add_middleware(RequestLoggingMiddleware)
     app.add_middleware(TenantIsolationMiddleware)
     
     # Include routers
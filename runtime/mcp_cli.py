@@ -16,7 +16,8 @@ from pathlib import Path
 
 # Add current directory to path for imports
 current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+if str(current_dir) not in sys.path:
+    sys.path.insert(0, str(current_dir))
 
 from cli.main import cli
 
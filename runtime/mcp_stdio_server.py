@@ -18,7 +18,8 @@ from typing import Any, Dict, List, Optional
 
 # Add current directory to path for imports
 current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+if str(current_dir) not in sys.path:
+    sys.path.insert(0, str(current_dir))
 
 from core.config import get_settings
 from core.builtin_tools import builtin_tool_handler
@@ -6,14 +6,35 @@ MCP + "npm of APIs" platform. The models provide validation and serialization
 for connector manifests in P0-1 phase.
 """
 
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field, field_validator
+import copy
+import sys
+from typing import Annotated, Any, Dict, Iterable, List, Literal, Optional, Set, Tuple, Union
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
 import re
-from jsonschema import Draft7Validator, ValidationError as JSONSchemaValidationError
+import orjson
+import yaml
+from jsonschema import Draft7Validator, SchemaError, ValidationError as JSONSchemaValidationError
+
+
+# Constrained string types shared across models so each length constraint
+# is declared (and compiled) once instead of once per field.
+NameStr = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+DescriptionStr = Annotated[str, StringConstraints(min_length=1, max_length=1000)]
+EndpointStr = Annotated[str, StringConstraints(min_length=1, max_length=200)]
 
 
 class ApiKeyAuth(BaseModel):
     """API key authentication configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
     type: Literal["api_key"] = Field(
         default="api_key",
         description="API key authentication type"
@@ -34,6 +55,8 @@ class ApiKeyAuth(BaseModel):
 
 class OAuth2ClientCredentialsAuth(BaseModel):
     """OAuth2 client credentials flow authentication."""
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
     type: Literal["oauth2_client_credentials"] = Field(
         default="oauth2_client_credentials",
         description="OAuth2 client credentials flow"
@@ -50,12 +73,171 @@ class OAuth2ClientCredentialsAuth(BaseModel):
 
 class NoAuth(BaseModel):
     """No authentication required."""
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
     type: Literal["none"] = Field(
         default="none",
         description="No authentication required"
     )
 
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with them;
+# every module that reads or writes manifests imports these
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Naming patterns, compiled once at import instead of on every validation
+_TOOL_NAME_RE = re.compile(r'^[a-z][a-z0-9_]*$')
+_DOT_ENDPOINT_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*(?:\.[a-zA-Z0-9][a-zA-Z0-9_-]*)*$')
+# Allow scoped names like @org/connector-name; must start with letter or @
+_CONNECTOR_NAME_RE = re.compile(r'^(@[a-z][a-z0-9-._~]*/)?[a-z][a-z0-9-._~]*$')
+
+# Characters allowed in semver pre-release and build identifiers
+_SEMVER_ID_CHARS = frozenset(
+    '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-'
+)
+
+
+def _is_numeric_id(part: str) -> bool:
+    """Check for an ASCII number without leading zeros."""
+    return part.isascii() and part.isdigit() and (part == '0' or part[0] != '0')
+
+
+def _parse_semver(v: str) -> bool:
+    """
+    Check that a string is a valid semantic version.
+
+    Single pass over the string without a regex: major.minor.patch with
+    optional -prerelease and +build suffixes.
+
+    Args:
+        v: Version string to check
+
+    Returns:
+        True if the version follows semantic versioning
+    """
+    core, has_build, build = v.partition('+')
+    if has_build:
+        build_ids = build.split('.')
+        if not all(ident and _SEMVER_ID_CHARS.issuperset(ident) for ident in build_ids):
+            return False
+
+    core, has_pre, prerelease = core.partition('-')
+    if has_pre:
+        for ident in prerelease.split('.'):
+            if not ident or not _SEMVER_ID_CHARS.issuperset(ident):
+                return False
+            # Purely numeric identifiers must not have leading zeros
+            if ident.isdigit() and not _is_numeric_id(ident):
+                return False
+
+    parts = core.split('.')
+    return len(parts) == 3 and all(_is_numeric_id(part) for part in parts)
+
+
+# HTTP methods accepted in "METHOD /path" endpoints
+_HTTP_METHODS = frozenset({'GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS'})
+
+# Fingerprints of JSON Schemas that already passed Draft 7 meta-validation.
+# Manifests tend to repeat the same input/output schemas, so the (relatively
+# expensive) meta-schema check only runs once per distinct schema. The dict
+# keeps insertion order and is trimmed FIFO once it reaches the size limit.
+_SCHEMA_CHECK_CACHE: Dict[bytes, None] = {}
+_SCHEMA_CHECK_CACHE_MAX_SIZE = 4096
+
+
+def _schema_fingerprint(schema: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Canonical key for a schema's content, equal for equal schemas.
+
+    Args:
+        schema: JSON Schema to fingerprint
+
+    Returns:
+        Key-sorted JSON encoding of the schema, or None if it cannot be encoded
+    """
+    try:
+        return orjson.dumps(schema, default=str, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+
+
+# Draft 7 meta-schema validator, built once; Draft7Validator.check_schema
+# would construct a new one on every call
+_META_VALIDATOR = Draft7Validator(
+    Draft7Validator.META_SCHEMA,
+    format_checker=Draft7Validator.FORMAT_CHECKER,
+)
+
+
+def _check_schema(schema: Dict[str, Any]) -> None:
+    """Equivalent of Draft7Validator.check_schema using the shared meta-validator."""
+    # iter_errors is lazy, so this stops at the first error
+    for error in _META_VALIDATOR.iter_errors(schema):
+        raise SchemaError.create_from(error)
+
+
+def _check_schema_cached(schema: Dict[str, Any]) -> None:
+    """Run the meta-schema check unless this schema already passed."""
+    fingerprint = _schema_fingerprint(schema)
+    if fingerprint is None:
+        # Not canonically serializable; validate without caching
+        _check_schema(schema)
+        return
+
+    if fingerprint in _SCHEMA_CHECK_CACHE:
+        return
+
+    _check_schema(schema)
+
+    if len(_SCHEMA_CHECK_CACHE) >= _SCHEMA_CHECK_CACHE_MAX_SIZE:
+        del _SCHEMA_CHECK_CACHE[next(iter(_SCHEMA_CHECK_CACHE))]
+    _SCHEMA_CHECK_CACHE[fingerprint] = None
+
+
+# Compiled validators for tool input/output schemas, keyed by schema content
+# so equal schemas from separate manifests (or reloads) share one validator;
+# trimmed FIFO like the above. Each validator holds its own copy of the
+# schema, so mutating a caller's schema dict cannot change cached validators.
+_VALIDATOR_CACHE: Dict[bytes, Draft7Validator] = {}
+_VALIDATOR_CACHE_MAX_SIZE = 1024
+
+
+def get_schema_validator(schema: Dict[str, Any]) -> Draft7Validator:
+    """
+    Get the shared Draft 7 validator for a tool schema, building it on first use.
+
+    Args:
+        schema: JSON Schema to validate against
+
+    Returns:
+        Validator shared by every schema with the same content
+    """
+    fingerprint = _schema_fingerprint(schema)
+    if fingerprint is None:
+        # Not canonically serializable; build an uncached validator
+        return Draft7Validator(schema)
+
+    validator = _VALIDATOR_CACHE.get(fingerprint)
+    if validator is None:
+        validator = Draft7Validator(copy.deepcopy(schema))
+        if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_MAX_SIZE:
+            del _VALIDATOR_CACHE[next(iter(_VALIDATOR_CACHE))]
+        _VALIDATOR_CACHE[fingerprint] = validator
+    return validator
+
+
+# Tagged union of the supported auth models, declared once and reused by
+# every model that carries an ``auth`` field.
+AuthUnion = Annotated[
+    Union[NoAuth, ApiKeyAuth, OAuth2ClientCredentialsAuth],
+    Field(discriminator="type")
+]
+
+# Auth types whose credentials live in secret storage
+_CREDENTIAL_AUTH_TYPES = frozenset({"api_key", "oauth2_client_credentials"})
+
+
 class ToolAuth(BaseModel):
     """
     Authentication configuration for a tool.
@@ -65,9 +247,8 @@ class ToolAuth(BaseModel):
     - api_key: API key authentication (header, query, or cookie)
     - oauth2_client_credentials: OAuth2 client credentials flow
     """
-    auth: Union[NoAuth, ApiKeyAuth, OAuth2ClientCredentialsAuth] = Field(
+    auth: AuthUnion = Field(
         default_factory=NoAuth,
-        discriminator="type",
         description="Authentication configuration"
     )
 
@@ -82,7 +263,7 @@ class ToolAuth(BaseModel):
 
     def requires_credentials(self) -> bool:
         """Check if this auth type requires stored credentials."""
-        return self.auth.type in ["api_key", "oauth2_client_credentials"]
+        return self.auth.type in _CREDENTIAL_AUTH_TYPES
 
 
 class ConnectorTool(BaseModel):
@@ -92,17 +273,15 @@ class ConnectorTool(BaseModel):
     Each tool represents an API endpoint or logical operation that can be
     called by MCP clients (AI agents, LLMs).
     """
-    name: str = Field(
+    model_config = ConfigDict(defer_build=True)
+
+    name: NameStr = Field(
         ...,
-        min_length=1,
-        max_length=100,
         description="Unique name for this tool within the connector"
     )
     
-    description: str = Field(
+    description: DescriptionStr = Field(
         ...,
-        min_length=1,
-        max_length=1000,
         description="Human-readable description of what this tool does"
     )
     
@@ -116,16 +295,13 @@ class ConnectorTool(BaseModel):
         description="JSON Schema definition for tool output format"
     )
     
-    endpoint: str = Field(
+    endpoint: EndpointStr = Field(
         ...,
-        min_length=1,
-        max_length=200,
         description="Logical endpoint name; maps to handler in MVP"
     )
     
-    auth: Union[NoAuth, ApiKeyAuth, OAuth2ClientCredentialsAuth] = Field(
+    auth: AuthUnion = Field(
         default_factory=NoAuth,
-        discriminator="type",
         description="Authentication configuration for this tool"
     )
 
@@ -140,18 +316,18 @@ class ConnectorTool(BaseModel):
 
     def requires_credentials(self) -> bool:
         """Check if this auth type requires stored credentials."""
-        return self.auth.type in ["api_key", "oauth2_client_credentials"]
+        return self.auth.type in _CREDENTIAL_AUTH_TYPES
 
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate tool name follows naming conventions."""
-        if not re.match(r'^[a-z][a-z0-9_]*$', v):
+        if not _TOOL_NAME_RE.match(v):
             raise ValueError(
                 'Tool name must start with lowercase letter and contain only '
                 'lowercase letters, numbers, and underscores'
             )
-        return v
+        return sys.intern(v)
 
     @field_validator('endpoint')
     @classmethod
@@ -167,7 +343,7 @@ class ConnectorTool(BaseModel):
             if len(parts) == 2:
                 method, path = parts
                 # Validate HTTP method
-                if method.upper() not in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS']:
+                if method.upper() not in _HTTP_METHODS:
                     raise ValueError(
                         f'Invalid HTTP method "{method}". Must be one of: '
                         'GET, POST, PUT, PATCH, DELETE, HEAD, OPTIONS'
@@ -175,20 +351,20 @@ class ConnectorTool(BaseModel):
                 # Validate path starts with /
                 if not path.startswith('/'):
                     raise ValueError(f'API path "{path}" must start with "/"')
-                return v
+                return sys.intern(v)
         
         # Fall back to legacy dot notation validation
         # - Start with letter
         # - Can contain letters, numbers, underscores, hyphens
         # - Dots are allowed but not consecutive and not at the end
         # - Each segment separated by dots must start with letter/number
-        if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*(?:\.[a-zA-Z0-9][a-zA-Z0-9_-]*)*$', v):
+        if not _DOT_ENDPOINT_RE.match(v):
             raise ValueError(
                 'Endpoint must either be HTTP format ("GET /path") or dot notation '
                 '(start with letter, contain only letters, numbers, underscores, '
                 'hyphens, and dots. No consecutive dots or ending dots allowed.)'
             )
-        return v
+        return sys.intern(v)
 
     @field_validator('input_schema', 'output_schema')
     @classmethod
@@ -203,7 +379,7 @@ class ConnectorTool(BaseModel):
         
         try:
             # Validate it's a valid JSON Schema
-            Draft7Validator.check_schema(schema_dict)
+            _check_schema_cached(schema_dict)
             
             # Ensure it has required top-level properties
             # Allow $ref schemas (which don't require 'type') or schemas with 'type'
@@ -218,6 +394,17 @@ class ConnectorTool(BaseModel):
         return schema_dict
 
 
+def _find_duplicates(values: Iterable[str]) -> Set[str]:
+    """Return the values that occur more than once, in a single pass."""
+    seen: Set[str] = set()
+    duplicates: Set[str] = set()
+    for value in values:
+        if value in seen:
+            duplicates.add(value)
+        seen.add(value)
+    return duplicates
+
+
 class ConnectorManifest(BaseModel):
     """
     Complete connector manifest definition.
@@ -226,19 +413,19 @@ class ConnectorManifest(BaseModel):
     capabilities, tools, and metadata for the MCP platform.
     """
     
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(
         # Allow extra fields for future extensibility
-        extra = "forbid"
+        extra="forbid",
         # Use enum values for serialization
-        use_enum_values = True
+        use_enum_values=True,
         # Validate assignment
-        validate_assignment = True
+        validate_assignment=True,
+        # Build the core schema once, below, together with the nested models
+        defer_build=True,
+    )
 
-    name: str = Field(
+    name: NameStr = Field(
         ...,
-        min_length=1,
-        max_length=100,
         description="Unique name identifier for the connector"
     )
     
@@ -259,28 +446,30 @@ class ConnectorManifest(BaseModel):
         description="Base URL for the connector's API endpoints"
     )
 
+    # Tool names in declaration order and tool lookups by name and endpoint,
+    # rebuilt whenever the tools are validated (construction or assignment);
+    # edit tools by assigning a new list, in-place list edits are not seen
+    _tool_names: Tuple[str, ...] = PrivateAttr(default=())
+    _tools_by_name: Dict[str, ConnectorTool] = PrivateAttr(default_factory=dict)
+    _tools_by_endpoint: Dict[str, ConnectorTool] = PrivateAttr(default_factory=dict)
+
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate connector name follows npm-like naming conventions."""
-        # Allow scoped names like @org/connector-name
-        # Must start with letter or @, not number
-        pattern = r'^(@[a-z][a-z0-9-._~]*/)?[a-z][a-z0-9-._~]*$'
-        if not re.match(pattern, v):
+        if not _CONNECTOR_NAME_RE.match(v):
             raise ValueError(
                 'Connector name must follow npm naming conventions: '
                 'lowercase letters, numbers, hyphens, dots, underscores. '
                 'Must start with letter. May include scope like @org/name'
             )
-        return v
+        return sys.intern(v)
 
     @field_validator('version')
     @classmethod
     def validate_version(cls, v: str) -> str:
         """Validate version follows semantic versioning."""
-        # Basic semver pattern: major.minor.patch with optional pre-release/build
-        pattern = r'^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$'
-        if not re.match(pattern, v):
+        if not _parse_semver(v):
             raise ValueError(
                 'Version must follow semantic versioning (e.g., "1.0.0", "2.1.0-beta.1")'
             )
@@ -290,42 +479,41 @@ class ConnectorManifest(BaseModel):
     @classmethod
     def validate_unique_tool_names(cls, v: List[ConnectorTool]) -> List[ConnectorTool]:
         """Ensure all tool names are unique within the connector."""
-        names = [tool.name for tool in v]
-        if len(names) != len(set(names)):
-            duplicates = [name for name in names if names.count(name) > 1]
-            raise ValueError(f'Duplicate tool names found: {set(duplicates)}')
+        duplicates = _find_duplicates(tool.name for tool in v)
+        if duplicates:
+            raise ValueError(f'Duplicate tool names found: {duplicates}')
         return v
 
     @field_validator('tools')
     @classmethod
     def validate_unique_endpoints(cls, v: List[ConnectorTool]) -> List[ConnectorTool]:
         """Ensure all endpoints are unique within the connector."""
-        endpoints = [tool.endpoint for tool in v]
-        if len(endpoints) != len(set(endpoints)):
-            duplicates = [ep for ep in endpoints if endpoints.count(ep) > 1]
-            raise ValueError(f'Duplicate endpoints found: {set(duplicates)}')
+        duplicates = _find_duplicates(tool.endpoint for tool in v)
+        if duplicates:
+            raise ValueError(f'Duplicate endpoints found: {duplicates}')
         return v
 
+    @model_validator(mode='after')
+    def index_tools(self) -> "ConnectorManifest":
+        """Build the tool name list and the name/endpoint lookups."""
+        self._tool_names = tuple(tool.name for tool in self.tools)
+        self._tools_by_name = {tool.name: tool for tool in self.tools}
+        self._tools_by_endpoint = {tool.endpoint: tool for tool in self.tools}
+        return self
+
+    @classmethod
+    def model_construct(cls, _fields_set: Optional[Set[str]] = None, **values: Any) -> "ConnectorManifest":
+        """Construct without validation, still building the tool lookups."""
+        return super().model_construct(_fields_set, **values).index_tools()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert manifest to dictionary format."""
         return self.model_dump(by_alias=True, exclude_none=True)
 
     def to_yaml_dict(self) -> Dict[str, Any]:
         """Convert to dictionary suitable for YAML serialization."""
-        data = self.to_dict()
-        # Restructure for the expected YAML format
-        connector_dict = {
-            "name": data["name"],
-            "version": data["version"],
-            "tools": data["tools"]
-        }
-        
-        # Include base_url if present
-        if data.get("base_url"):
-            connector_dict["base_url"] = data["base_url"]
-            
         return {
-            "connector": connector_dict
+            "connector": self.model_dump(mode="json", by_alias=True, exclude_none=True)
         }
 
     @classmethod
@@ -335,25 +523,40 @@ class ConnectorManifest(BaseModel):
             raise ValueError("YAML must have top-level 'connector' key")
         
         connector_data = data["connector"]
-        return cls(**connector_data)
+        return cls.model_validate(connector_data)
+
+    @classmethod
+    def from_yaml_bytes(cls, content: bytes) -> "ConnectorManifest":
+        """
+        Create manifest from raw YAML (or JSON) document content.
+
+        Args:
+            content: Encoded YAML document with a top-level 'connector' key
+
+        Returns:
+            The validated manifest
+        """
+        data = yaml.load(content, Loader=YAML_LOADER)
+        if not isinstance(data, dict):
+            raise ValueError("YAML must have top-level 'connector' key")
+        return cls.from_yaml_dict(data)
 
     def get_tool_by_name(self, name: str) -> Optional[ConnectorTool]:
         """Get a tool by its name."""
-        for tool in self.tools:
-            if tool.name == name:
-                return tool
-        return None
+        return self._tools_by_name.get(name)
 
     def get_tool_by_endpoint(self, endpoint: str) -> Optional[ConnectorTool]:
         """Get a tool by its endpoint."""
-        for tool in self.tools:
-            if tool.endpoint == endpoint:
-                return tool
-        return None
+        return self._tools_by_endpoint.get(endpoint)
+
+    @property
+    def tool_names(self) -> Tuple[str, ...]:
+        """Tool names in declaration order, without copying."""
+        return self._tool_names
 
     def list_tool_names(self) -> List[str]:
         """Get list of all tool names in this connector."""
-        return [tool.name for tool in self.tools]
+        return list(self.tool_names)
 
     def validate_tool_input(self, tool_name: str, input_data: Dict[str, Any]) -> bool:
         """
@@ -374,8 +577,7 @@ class ConnectorManifest(BaseModel):
             raise ValueError(f"Tool '{tool_name}' not found in connector")
         
         try:
-            validator = Draft7Validator(tool.input_schema)
-            validator.validate(input_data) # type: ignore
+            get_schema_validator(tool.input_schema).validate(input_data) # type: ignore
             return True
         except JSONSchemaValidationError as e:
             raise ValueError(f"Input validation failed for tool '{tool_name}': {e.message}")
@@ -399,8 +601,12 @@ class ConnectorManifest(BaseModel):
             raise ValueError(f"Tool '{tool_name}' not found in connector")
         
         try:
-            validator = Draft7Validator(tool.output_schema)
-            validator.validate(output_data) # type: ignore
+            get_schema_validator(tool.output_schema).validate(output_data) # type: ignore
             return True
         except JSONSchemaValidationError as e:
             raise ValueError(f"Output validation failed for tool '{tool_name}': {e.message}")
+
+
+# Compile ConnectorManifest together with its nested tool and auth models in
+# a single build instead of one build per class at definition time
+ConnectorManifest.model_rebuild()
@@ -7,7 +7,9 @@ connectors and tools per project, including hot-reload capabilities.
 
 import asyncio
 import logging
+import sys
 from pathlib import Path
+from typing import List
 
 from core.registry import get_registry, reset_registry
 from core.registry_service import get_registry_service, reset_registry_service
@@ -19,6 +21,11 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def write_lines(lines: List[str]) -> None:
+    """Write a block of output lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 async def demonstrate_registry():
     """Demonstrate the registry functionality."""
     
@@ -47,37 +54,44 @@ async def demonstrate_registry():
     print(f"\n2. Looking for sample connectors in: {samples_dir}")
     
     # Install sample connectors
-    installed_connectors = []
-    for sample_file in samples_dir.glob("*.yaml"):
-        try:
-            print(f"   Installing: {sample_file.name}")
-            connector = registry_service.install_connector_from_file(
-                project_id=project_id,
-                tenant_id=tenant_id,
-                file_path=sample_file,
-                enabled=True
-            )
-            installed_connectors.append(connector)
-            print(f"   ✓ Installed {connector.name} v{connector.version} with {len(connector.tools)} tools")
-        except Exception as e:
-            print(f"   ✗ Failed to install {sample_file.name}: {e}")
+    sample_files = sorted(samples_dir.glob("*.yaml"))
+    write_lines([f"   Installing: {sample_file.name}" for sample_file in sample_files])
+    installed_connectors = registry_service.install_connectors_from_paths(
+        project_id=project_id,
+        tenant_id=tenant_id,
+        file_paths=sample_files,
+        enabled=True
+    )
+    lines = [
+        f"   ✓ Installed {connector.name} v{connector.version} with {len(connector.tools)} tools"
+        for connector in installed_connectors
+    ]
+    installed_paths = {connector.file_path for connector in installed_connectors}
+    lines.extend(
+        f"   ✗ Failed to install {sample_file.name} (see log for details)"
+        for sample_file in sample_files
+        if sample_file not in installed_paths
+    )
+    write_lines(lines)
     
     print(f"\n3. Installed {len(installed_connectors)} connectors")
     
     # List all connectors
-    print("\n4. Listing all connectors in project:")
+    lines = ["\n4. Listing all connectors in project:"]
     connectors = registry_service.get_project_connectors(project_id)
     for connector in connectors:
         status = "enabled" if connector["enabled"] else "disabled"
-        print(f"   - {connector['name']} v{connector['version']} ({status}) - {connector['tool_count']} tools")
+        lines.append(f"   - {connector['name']} v{connector['version']} ({status}) - {connector['tool_count']} tools")
+    write_lines(lines)
     
     # List all tools
-    print("\n5. Listing all available tools:")
+    lines = ["\n5. Listing all available tools:"]
     tools = registry_service.get_project_tools(project_id)
     for tool in tools:
-        print(f"   - {tool['name']} (from {tool['connector_name']})")
-        print(f"     Description: {tool['description']}")
-        print(f"     Endpoint: {tool['endpoint']}")
+        lines.append(f"   - {tool['name']} (from {tool['connector_name']})")
+        lines.append(f"     Description: {tool['description']}")
+        lines.append(f"     Endpoint: {tool['endpoint']}")
+    write_lines(lines)
     
     # Get a specific tool definition
     if tools:
@@ -128,25 +142,30 @@ async def demonstrate_registry():
             print(f"   Active tools after enable: {stats['tool_count']}")
     
     # Get project statistics
-    print("\n9. Project statistics:")
+    lines = ["\n9. Project statistics:"]
     stats = registry_service.get_project_stats(project_id)
     if stats:
-        print(f"   Project ID: {stats['project_id']}")
-        print(f"   Tenant ID: {stats['tenant_id']}")
-        print(f"   Created: {stats['created_at']}")
-        print(f"   Last updated: {stats['last_updated']}")
-        print(f"   Total connectors: {stats['connector_count']}")
-        print(f"   Total tools: {stats['tool_count']}")
-        print(f"   Enabled connectors: {stats['enabled_connectors']}")
-        print(f"   Disabled connectors: {stats['disabled_connectors']}")
+        lines.extend([
+            f"   Project ID: {stats['project_id']}",
+            f"   Tenant ID: {stats['tenant_id']}",
+            f"   Created: {stats['created_at']}",
+            f"   Last updated: {stats['last_updated']}",
+            f"   Total connectors: {stats['connector_count']}",
+            f"   Total tools: {stats['tool_count']}",
+            f"   Enabled connectors: {stats['enabled_connectors']}",
+            f"   Disabled connectors: {stats['disabled_connectors']}",
+        ])
+    write_lines(lines)
     
     # Get global registry statistics
-    print("\n10. Global registry statistics:")
     global_stats = registry_service.get_global_stats()
-    print(f"    Total projects: {global_stats['total_projects']}")
-    print(f"    Total connectors: {global_stats['total_connectors']}")
-    print(f"    Total tools: {global_stats['total_tools']}")
-    print(f"    Hot reload enabled: {global_stats['hot_reload_enabled']}")
+    write_lines([
+        "\n10. Global registry statistics:",
+        f"    Total projects: {global_stats['total_projects']}",
+        f"    Total connectors: {global_stats['total_connectors']}",
+        f"    Total tools: {global_stats['total_tools']}",
+        f"    Hot reload enabled: {global_stats['hot_reload_enabled']}",
+    ])
     
     # Test hot-reload check (if enabled)
     print("\n11. Testing hot-reload check:")
@@ -176,7 +195,7 @@ async def demonstrate_registry():
     print("\n=== Registry Demonstration Complete ===")
 
 
-async def demonstrate_manifest_loading():
+def demonstrate_manifest_loading():
     """Demonstrate loading connectors from manifest objects."""
     
     print("\n=== Manifest Loading Demonstration ===")
@@ -266,7 +285,12 @@ async def demonstrate_manifest_loading():
     print("=== Manifest Loading Complete ===")
 
 
+async def main():
+    """Run all demonstrations on a single event loop."""
+    await demonstrate_registry()
+    demonstrate_manifest_loading()
+
+
 if __name__ == "__main__":
     # Run the demonstrations
-    asyncio.run(demonstrate_registry())
-    asyncio.run(demonstrate_manifest_loading())
+    asyncio.run(main())
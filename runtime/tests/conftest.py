@@ -0,0 +1,166 @@
+"""Shared pytest fixtures for the runtime test suite."""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+import pytest_asyncio
+import yaml
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+# Import app modules by the same top-level names the app uses (core.*, models.*),
+# so classes and exceptions are the same objects on both sides
+from main import create_app
+from models.manifest import YAML_LOADER, ConnectorManifest
+from core.builtin_tools import BuiltinToolHandler
+from core.secrets import (
+    SecretMetadata,
+    SecretNotFoundError,
+    SecretStorageInterface,
+    SecretType,
+    SecretValue,
+)
+
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "samples"
+PETSTORE_YAML = SAMPLES_DIR / "swagger-petstore.yaml"
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application under test in its lighter testing configuration, created once per session."""
+    return create_app(testing=True)
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """API test client shared across the session; lifespan startup runs once."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient(app):
+    """In-loop async client shared by tests that run on the session event loop."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="session")
+def handler():
+    """Built-in tool handler shared across the session (it holds no per-call state)."""
+    return BuiltinToolHandler()
+
+
+@pytest.fixture(scope="session")
+def petstore_path() -> Path:
+    """Path of the bundled samples/swagger-petstore.yaml manifest."""
+    return PETSTORE_YAML
+
+
+def _load_sample(path: Path):
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+@pytest.fixture(scope="session")
+def petstore_manifest_dict():
+    """Parsed samples/swagger-petstore.yaml, loaded once per session."""
+    return _load_sample(PETSTORE_YAML)
+
+
+_WARMUP_MANIFEST = {
+    "connector": {
+        "name": "warmup",
+        "version": "0.0.0",
+        "tools": [{
+            "name": "ping",
+            "description": "Warm-up tool",
+            "input_schema": {"type": "object"},
+            "output_schema": {"type": "object"},
+            "endpoint": "warmup.ping",
+        }],
+    }
+}
+
+
+@pytest.fixture(scope="session")
+def meta_validator():
+    """Draft 7 meta-schema validator, built once per session."""
+    from jsonschema import Draft7Validator
+    return Draft7Validator(Draft7Validator.META_SCHEMA)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_manifest_models():
+    """Validate one manifest up front so the first manifest test does not pay first-use costs."""
+    ConnectorManifest.from_yaml_dict(_WARMUP_MANIFEST)
+
+
+class InMemorySecretStorage(SecretStorageInterface):
+    """Dict-backed secret storage for tests that do not need LocalSecretStorage's disk behaviour."""
+    
+    def __init__(self):
+        self._secrets: Dict[str, Tuple[str, SecretMetadata]] = {}
+    
+    async def store_secret(
+        self,
+        name: str,
+        value: str,
+        secret_type: SecretType,
+        connector_name: str,
+        description: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+        expires_at: Optional[str] = None
+    ) -> None:
+        metadata = SecretMetadata(name, secret_type, connector_name, description, tags, expires_at)
+        self._secrets[name] = (value, metadata)
+    
+    async def get_secret(self, name: str) -> SecretValue:
+        try:
+            value, metadata = self._secrets[name]
+        except KeyError:
+            raise SecretNotFoundError(f"Secret '{name}' not found")
+        return SecretValue(value=value, metadata=metadata)
+    
+    async def delete_secret(self, name: str) -> None:
+        if self._secrets.pop(name, None) is None:
+            raise SecretNotFoundError(f"Secret '{name}' not found")
+    
+    async def list_secrets(
+        self,
+        connector_name: Optional[str] = None,
+        secret_type: Optional[SecretType] = None
+    ) -> List[SecretMetadata]:
+        return [
+            metadata for _, metadata in self._secrets.values()
+            if (not connector_name or metadata.connector_name == connector_name)
+            and (not secret_type or metadata.secret_type == secret_type)
+        ]
+    
+    async def secret_exists(self, name: str) -> bool:
+        return name in self._secrets
+    
+    async def update_secret_metadata(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+        expires_at: Optional[str] = None
+    ) -> None:
+        metadata = (await self.get_secret(name)).metadata
+        if description is not None:
+            metadata.description = description
+        if tags is not None:
+            metadata.tags = tags
+        if expires_at is not None:
+            metadata.expires_at = expires_at
+    
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def make_memory_secret_storage():
+    """Factory for empty InMemorySecretStorage instances; session-scoped so session fixtures can use it."""
+    return InMemorySecretStorage
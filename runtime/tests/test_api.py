@@ -1,36 +1,36 @@
-"""Basic API surface tests."""
+"""Basic API surface tests.
 
-from fastapi.testclient import TestClient
-import sys
-import os
+The ``client`` and ``aclient`` fixtures are provided by ``conftest.py``.
+"""
 
-# Add the parent directory to the path and set up package imports
-runtime_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(runtime_dir)
-sys.path.insert(0, parent_dir)
-# Ensure the runtime package root itself is also on the path so intra-package absolute imports (core.*, api.*) resolve
-if runtime_dir not in sys.path:
-    sys.path.insert(0, runtime_dir)
+import asyncio
 
-# Import the app from the runtime package
-from runtime.main import app
+import orjson
+import pytest
 
-client = TestClient(app)
+# Async tests share the session event loop that owns the session-scoped aclient
+session_loop = pytest.mark.asyncio(scope="session")
 
+# Request bodies are serialized once at import and sent as raw bytes
+_JSON_HEADERS = {"content-type": "application/json"}
+_ECHO_BODY = orjson.dumps({"name": "echo", "arguments": {"text": "Hello, MCP!"}})
 
-def test_health_check():
-    """Test the basic health check endpoint."""
-    response = client.get("/health/")
+
+def _invoke_body(tool_name, parameters):
+    return orjson.dumps({"tool_name": tool_name, "parameters": parameters})
+
+
+def _check_health(response):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
     assert "version" in data
     assert "environment" in data
+    # The middleware should add correlation ID header
+    assert "X-Correlation-ID" in response.headers
 
 
-def test_mcp_capabilities():
-    """Test the MCP capabilities endpoint."""
-    response = client.get("/v1/mcp/capabilities")
+def _check_capabilities(response):
     assert response.status_code == 200
     data = response.json()
     assert "capabilities" in data
@@ -38,31 +38,14 @@ def test_mcp_capabilities():
     assert data["serverInfo"]["name"] == "MCP Runtime Orchestrator"
 
 
-def test_mcp_tools_list():
-    """Test the MCP tools listing endpoint."""
-    response = client.get("/v1/mcp/tools")
+def _check_tools_list(response):
     assert response.status_code == 200
     data = response.json()
     assert "tools" in data
     assert isinstance(data["tools"], list)
 
 
-def test_mcp_tool_execution():
-    """Test the MCP tool execution endpoint."""
-    response = client.post("/v1/mcp/tools/call", json={
-        "name": "echo",
-        "arguments": {"text": "Hello, MCP!"}
-    })
-    assert response.status_code == 200
-    data = response.json()
-    assert "content" in data
-    assert "isError" in data
-    assert data["isError"] is False
-
-
-def test_projects_list():
-    """Test the projects listing endpoint."""
-    response = client.get("/v1/projects/")
+def _check_projects_list(response):
     assert response.status_code == 200
     data = response.json()
     assert "projects" in data
@@ -71,25 +54,7 @@ def test_projects_list():
     assert "page_size" in data
 
 
-def test_cors_headers():
-    """Test that CORS headers are properly set."""
-    response = client.options("/health/")
-    # Note: In test mode, CORS middleware may not add headers
-    # This test would be more relevant in a full integration test
-    assert response.status_code in [200, 405]  # OPTIONS may not be implemented
-
-
-def test_correlation_id_header():
-    """Test that correlation ID is added to response headers."""
-    response = client.get("/health/")
-    assert response.status_code == 200
-    # The middleware should add correlation ID header
-    assert "X-Correlation-ID" in response.headers
-
-
-def test_project_runtime_manifest():
-    """Test the project runtime manifest endpoint."""
-    response = client.get("/v1/projects/project-1/runtime/manifest")
+def _check_runtime_manifest(response):
     assert response.status_code == 200
     data = response.json()
     assert "tools" in data
@@ -100,45 +65,103 @@ def test_project_runtime_manifest():
     assert isinstance(data["tools"], list)
 
 
-def test_tool_invocation_invalid_format():
-    """Test tool invocation with invalid tool name format."""
-    response = client.post("/v1/projects/project-1/runtime/invoke", json={
-        "tool_name": "invalid_tool_name",
-        "parameters": {}
-    })
-    assert response.status_code == 400
-    data = response.json()
-    assert "Invalid tool name format" in data["detail"]
+# Read-only endpoints fetched together, each with its own checks
+_READONLY_CHECKS = {
+    "/health/": _check_health,
+    "/v1/mcp/capabilities": _check_capabilities,
+    "/v1/mcp/tools": _check_tools_list,
+    "/v1/projects/": _check_projects_list,
+    "/v1/projects/project-1/runtime/manifest": _check_runtime_manifest,
+}
 
 
-def test_tool_invocation_disabled_connector():
-    """Test tool invocation with disabled connector."""
-    response = client.post("/v1/projects/project-1/runtime/invoke", json={
-        "tool_name": "task-manager.create_task",
-        "parameters": {"title": "Test Task"}
-    })
-    assert response.status_code == 403
-    data = response.json()
-    assert "not enabled for this project" in data["detail"]
+@session_loop
+async def test_readonly_endpoints(aclient):
+    """Test the read-only health, MCP and projects endpoints in one concurrent batch.
+    
+    Every endpoint is checked and all failures are reported together, so a
+    failing endpoint does not hide the others.
+    """
+    responses = await asyncio.gather(
+        *(aclient.get(path) for path in _READONLY_CHECKS),
+        return_exceptions=True,
+    )
 
+    failures = {}
+    for (path, check), response in zip(_READONLY_CHECKS.items(), responses):
+        if isinstance(response, BaseException):
+            failures[path] = repr(response)
+            continue
+        try:
+            check(response)
+        except AssertionError as exc:
+            failures[path] = str(exc) or "assertion failed"
 
-def test_tool_invocation_nonexistent_project():
-    """Test tool invocation with non-existent project."""
-    response = client.post("/v1/projects/invalid-project/runtime/invoke", json={
-        "tool_name": "calculator.add",
-        "parameters": {"a": 1, "b": 2}
-    })
-    assert response.status_code == 404
-    data = response.json()
-    assert "Project not found" in data["detail"]
+    assert not failures, failures
+
+
+def test_mcp_capabilities_cached(client):
+    """Test that repeated capabilities requests reuse the serialized body."""
+    from api.mcp import _capabilities_body
+
+    first = client.get("/v1/mcp/capabilities")
+    hits = _capabilities_body.cache_info().hits
+    second = client.get("/v1/mcp/capabilities")
+
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert _capabilities_body.cache_info().hits == hits + 1
+
+
+def test_mcp_builtin_tools_cached(client):
+    """Test that tool listings reuse the cached built-in definitions without handing them out."""
+    from api.mcp import _builtin_mcp_tools
 
+    first = client.get("/v1/mcp/tools")
+    hits = _builtin_mcp_tools.cache_info().hits
+    second = client.get("/v1/mcp/tools")
 
-def test_tool_invocation_nonexistent_connector():
-    """Test tool invocation with non-existent connector."""
-    response = client.post("/v1/projects/project-1/runtime/invoke", json={
-        "tool_name": "nonexistent.tool",
-        "parameters": {}
-    })
-    assert response.status_code == 403
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert _builtin_mcp_tools.cache_info().hits == hits + 1
+
+
+@session_loop
+async def test_mcp_tool_execution(aclient):
+    """Test the MCP tool execution endpoint."""
+    response = await aclient.post("/v1/mcp/tools/call", content=_ECHO_BODY, headers=_JSON_HEADERS)
+    assert response.status_code == 200
     data = response.json()
-    assert "not enabled for this project" in data["detail"]
+    assert "content" in data
+    assert "isError" in data
+    assert data["isError"] is False
+
+
+def test_cors_headers(client):
+    """Test that CORS headers are properly set."""
+    # Only the status line matters here, so the body is never read
+    with client.stream("OPTIONS", "/health/") as response:
+        # Note: In test mode, CORS middleware may not add headers
+        # This test would be more relevant in a full integration test
+        assert response.status_code in [200, 405]  # OPTIONS may not be implemented
+
+
+@session_loop
+@pytest.mark.parametrize(
+    "project_id, body, status_code, error_code",
+    [
+        ("project-1", _invoke_body("invalid_tool_name", {}), 400, "INVALID_TOOL_NAME"),
+        ("project-1", _invoke_body("task-manager.create_task", {"title": "Test Task"}), 403, "CONNECTOR_NOT_ENABLED"),
+        ("invalid-project", _invoke_body("calculator.add", {"a": 1, "b": 2}), 404, "PROJECT_NOT_FOUND"),
+        ("project-1", _invoke_body("nonexistent.tool", {}), 403, "CONNECTOR_NOT_ENABLED"),
+    ],
+    ids=["invalid_format", "disabled_connector", "nonexistent_project", "nonexistent_connector"],
+)
+async def test_tool_invocation_errors(aclient, project_id, body, status_code, error_code):
+    """Test tool invocation error responses."""
+    response = await aclient.post(
+        f"/v1/projects/{project_id}/runtime/invoke", content=body, headers=_JSON_HEADERS
+    )
+    assert response.status_code == status_code
+    assert response.headers["X-Error-Code"] == error_code
+    assert isinstance(response.json()["detail"], str)
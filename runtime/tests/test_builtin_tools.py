@@ -6,14 +6,7 @@ parameter validation, and execution results.
 """
 
 import pytest
-import datetime
-from unittest.mock import patch
-
-# Add the parent directory to the path for imports
-import sys
-import os
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, parent_dir)
+from unittest.mock import MagicMock, patch
 
 from core.builtin_tools import (
     BuiltinToolHandler,
@@ -27,9 +20,8 @@ from core.builtin_tools import (
 class TestBuiltinToolHandler:
     """Test cases for the BuiltinToolHandler class."""
     
-    def test_initialization(self):
+    def test_initialization(self, handler):
         """Test that handler initializes with expected tools."""
-        handler = BuiltinToolHandler()
         tools = handler.list_tools()
         
         assert len(tools) >= 3  # echo, hello, get_time
@@ -37,19 +29,21 @@ class TestBuiltinToolHandler:
         assert "echo" in tool_names
         assert "hello" in tool_names
         assert "get_time" in tool_names
+        
+        # Listings are an immutable snapshot shared between calls
+        assert isinstance(tools, tuple)
+        assert handler.list_tools() is tools
     
-    def test_has_tool(self):
+    def test_has_tool(self, handler):
         """Test tool existence checking."""
-        handler = BuiltinToolHandler()
         
         assert handler.has_tool("echo")
         assert handler.has_tool("hello")
         assert handler.has_tool("get_time")
         assert not handler.has_tool("nonexistent_tool")
     
-    def test_get_tool(self):
+    def test_get_tool(self, handler):
         """Test getting tool definitions."""
-        handler = BuiltinToolHandler()
         
         echo_tool = handler.get_tool("echo")
         assert echo_tool.name == "echo"
@@ -69,9 +63,8 @@ class TestBuiltinToolHandler:
             handler.get_tool("nonexistent")
     
     @pytest.mark.asyncio
-    async def test_echo_tool_execution(self):
+    async def test_echo_tool_execution(self, handler):
         """Test echo tool execution."""
-        handler = BuiltinToolHandler()
         
         # Test normal execution
         result = await handler.execute_tool("echo", {"text": "Hello, World!"})
@@ -97,9 +90,8 @@ class TestBuiltinToolHandler:
         assert "must be a string" in result.content[0]["text"]
     
     @pytest.mark.asyncio
-    async def test_hello_tool_execution(self):
+    async def test_hello_tool_execution(self, handler):
         """Test hello tool execution."""
-        handler = BuiltinToolHandler()
         
         # Test with default name
         result = await handler.execute_tool("hello", {})
@@ -124,9 +116,8 @@ class TestBuiltinToolHandler:
         assert "Hello, World!" in result.content[0]["text"]
     
     @pytest.mark.asyncio
-    async def test_get_time_tool_execution(self):
+    async def test_get_time_tool_execution(self, handler):
         """Test get_time tool execution."""
-        handler = BuiltinToolHandler()
         
         # Test default ISO format
         result = await handler.execute_tool("get_time", {})
@@ -159,11 +150,21 @@ class TestBuiltinToolHandler:
         result = await handler.execute_tool("get_time", {"format": "invalid"})
         assert result.is_error
         assert "Invalid time format" in result.content[0]["text"]
+        
+        # Only the formatter for the requested format should run
+        human_formatter = MagicMock(return_value="formatted")
+        with patch.dict(BuiltinToolHandler._TIME_FORMATTERS, {"human": human_formatter}):
+            result = await handler.execute_tool("get_time", {"format": "iso"})
+            assert not result.is_error
+            human_formatter.assert_not_called()
+            
+            result = await handler.execute_tool("get_time", {"format": "human"})
+            assert result.content[0]["text"] == "Current time (human): formatted"
+            human_formatter.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_nonexistent_tool_execution(self):
+    async def test_nonexistent_tool_execution(self, handler):
         """Test execution of non-existent tool."""
-        handler = BuiltinToolHandler()
         
         result = await handler.execute_tool("nonexistent", {})
         assert result.is_error
@@ -173,21 +174,13 @@ class TestBuiltinToolHandler:
     @pytest.mark.asyncio
     async def test_execution_timing(self):
         """Test that execution time is properly measured."""
-        handler = BuiltinToolHandler()
         
-        # Mock datetime to control timing
-        mock_times = [
-            datetime.datetime(2023, 1, 1, 12, 0, 0, 0),      # start
-            datetime.datetime(2023, 1, 1, 12, 0, 0, 50000)  # end (50ms later)
-        ]
+        # Start and end readings 50ms apart
+        readings = iter([0, 50_000_000])
+        timed_handler = BuiltinToolHandler(clock=lambda: next(readings))
         
-        with patch('core.builtin_tools.datetime') as mock_datetime:
-            mock_datetime.datetime.now.side_effect = mock_times
-            # Also need to patch for the actual time formatting in get_time
-            mock_datetime.datetime.side_effect = lambda *args, **kwargs: datetime.datetime(*args, **kwargs)
-            
-            result = await handler.execute_tool("echo", {"text": "test"})
-            assert result.execution_time_ms == 50
+        result = await timed_handler.execute_tool("echo", {"text": "test"})
+        assert result.execution_time_ms == 50
     
     def test_global_instance(self):
         """Test that global instance is available and functional."""
@@ -271,6 +264,9 @@ class TestToolModels:
         result2 = ToolExecutionResult(content=content)
         assert not result2.is_error  # Default is False
         assert result2.execution_time_ms == 0  # Default is 0
+        
+        # Internal result type carries no per-instance __dict__
+        assert not hasattr(result, "__dict__")
 
 
 if __name__ == "__main__":
@@ -4,105 +4,241 @@ Tests for MCP CLI commands - Phase 0-2
 This module tests the CLI commands for importing and validating MCP connector manifests.
 """
 
-import sys
+import copy
+import io
+from contextlib import redirect_stdout
 from pathlib import Path
-import tempfile
-import json
+import orjson
 import yaml
 import pytest
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+import click
 from click.testing import CliRunner
 
-# Add parent directory to path for imports
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
-
 from cli.main import cli
-from cli.commands.validate_cmd import validate_command
-from cli.commands.import_cmd import import_command
-from models.manifest import ConnectorManifest
+from cli.commands import import_cmd
+from cli.commands.import_cmd import compile_path_filter, import_command
+from cli.commands.validate_cmd import load_manifest_yaml, validate_command, _parse_manifest_yaml
+from models.manifest import YAML_DUMPER, YAML_LOADER, ConnectorManifest
+
+# Invalid name, non-semver version and an empty tools array
+_INVALID_MANIFEST_YAML = """\
+connector:
+  name: 'invalid-name-with-@-in-wrong-place@'
+  version: not-semver
+  tools: []
+"""
+
+
+@pytest.fixture(scope="class")
+def runner():
+    """Click test runner shared by the tests of a class; it keeps no state between invocations."""
+    return CliRunner()
+
+
+@pytest.fixture
+def workdir(tmp_path):
+    """Per-test output directory; tmp_path is unique per test and per xdist worker."""
+    return tmp_path
+
+
+def run_direct(command: click.Command, **params: Any) -> Tuple[int, str]:
+    """
+    Invoke a command callback in-process, skipping argv parsing and CliRunner isolation.
+    
+    Only for tests that do not exercise option parsing; parameters are passed
+    already converted (e.g. tuples of Paths) and are not re-validated by Click.
+    
+    Returns:
+        Tuple of (exit code, captured stdout)
+    """
+    buffer = io.StringIO()
+    exit_code = 0
+    with redirect_stdout(buffer):
+        try:
+            with click.Context(command, obj={"verbose": False}) as ctx:
+                ctx.invoke(command, **params)
+        except SystemExit as exc:
+            exit_code = exc.code or 0
+    return exit_code, buffer.getvalue()
+
+
+def load_generated_manifest(path: Path) -> ConnectorManifest:
+    """Parse a manifest written by the import command, as JSON when it has a .json suffix."""
+    if path.suffix == '.json':
+        manifest_data = orjson.loads(path.read_bytes())
+    else:
+        with open(path, 'r') as manifest_file:
+            manifest_data = yaml.load(manifest_file, Loader=YAML_LOADER)
+    return ConnectorManifest.from_yaml_dict(manifest_data)
+
+
+def create_test_openapi_spec() -> Dict[str, Any]:
+    """Create a test OpenAPI specification."""
+    return {
+        "openapi": "3.0.1",
+        "info": {
+            "title": "Test API",
+            "description": "A test API for validation",
+            "version": "1.0.0"
+        },
+        "paths": {
+            "/items": {
+                "get": {
+                    "operationId": "listItems",
+                    "summary": "List all items",
+                    "responses": {
+                        "200": {
+                            "description": "List of items",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "array",
+                                        "items": {
+                                            "type": "object",
+                                            "properties": {
+                                                "id": {"type": "integer"},
+                                                "name": {"type": "string"}
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "post": {
+                    "operationId": "createItem",
+                    "summary": "Create new item",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "name": {"type": "string"},
+                                        "description": {"type": "string"}
+                                    },
+                                    "required": ["name"]
+                                }
+                            }
+                        }
+                    },
+                    "responses": {
+                        "201": {
+                            "description": "Created item",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "id": {"type": "integer"},
+                                            "name": {"type": "string"}
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def base_openapi_spec(tmp_path_factory) -> Tuple[Dict[str, Any], Path]:
+    """Canonical test OpenAPI spec and the JSON file it is written to, built once.
+    
+    Tests that need a variant must deepcopy the dict before mutating it.
+    """
+    spec = create_test_openapi_spec()
+    path = tmp_path_factory.mktemp("specs") / "base.json"
+    path.write_bytes(orjson.dumps(spec))
+    return spec, path
 
 
 class TestValidateCommand:
     """Test the MCP validate command."""
     
-    def test_validate_valid_manifest(self):
-        """Test validation of a valid manifest file."""
-        runner = CliRunner()
-        
+    @pytest.mark.parametrize(
+        "strict, output_format, expected",
+        [
+            (False, "text", ["✓ VALID", "All manifests are valid!"]),
+            # Strict mode should still pass but might add warnings
+            (True, "text", ["✓ VALID"]),
+            (False, "json", ['"overall_valid": true', '"validated_count": 1']),
+        ],
+        ids=["default", "strict", "json"],
+    )
+    def test_validate_valid_manifest(self, petstore_path, strict, output_format, expected):
+        """Test validation of a valid manifest file across output modes."""
         # Use existing valid manifest
-        manifest_path = parent_dir / "samples" / "calculator.yaml"
-        result = runner.invoke(cli, ["validate", str(manifest_path)])
+        exit_code, output = run_direct(
+            validate_command, manifest_files=(petstore_path,), strict=strict, format=output_format
+        )
         
-        assert result.exit_code == 0
-        assert "✓ VALID" in result.output
-        assert "All manifests are valid!" in result.output
+        assert exit_code == 0
+        for text in expected:
+            assert text in output
+    
+    def test_petstore_sample_parses(self, petstore_manifest_dict):
+        """Test that the cached petstore sample validates in-process."""
+        manifest = ConnectorManifest.from_yaml_dict(petstore_manifest_dict)
+        assert manifest.tools
     
-    def test_validate_multiple_manifests(self):
+    def test_validate_multiple_manifests(self, petstore_path, tmp_path):
         """Test validation of multiple manifest files."""
-        runner = CliRunner()
+        second_path = tmp_path / "petstore-copy.yaml"
+        second_path.write_text(petstore_path.read_text(encoding="utf-8"), encoding="utf-8")
+        exit_code, output = run_direct(
+            validate_command, manifest_files=(petstore_path, second_path), strict=False, format="text"
+        )
         
-        manifest1 = parent_dir / "samples" / "calculator.yaml"
-        manifest2 = parent_dir / "samples" / "weather-api.yaml"
+        assert exit_code == 0
+        assert "Total files: 2" in output
+        assert "Valid files: 2" in output
+        assert "Invalid files: 0" in output
+    
+    def test_validate_invalid_manifest(self, runner, tmp_path):
+        """Test validation of an invalid manifest."""
+        manifest_path = tmp_path / "invalid.yaml"
+        manifest_path.write_text(_INVALID_MANIFEST_YAML)
         
-        result = runner.invoke(cli, ["validate", str(manifest1), str(manifest2)])
+        result = runner.invoke(cli, ["validate", str(manifest_path)])
         
-        assert result.exit_code == 0
-        assert "Total files: 2" in result.output
-        assert "Valid files: 2" in result.output
-        assert "Invalid files: 0" in result.output
+        assert result.exit_code == 1
+        assert "✗ INVALID" in result.output
+        assert "Validation error" in result.output
     
-    def test_validate_strict_mode(self):
-        """Test validation with strict mode."""
-        runner = CliRunner()
+    def test_validate_reuses_unchanged_parse(self, tmp_path):
+        """Test that validating an unchanged file twice parses it only once."""
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text(yaml.dump({"connector": {"name": "x"}}, Dumper=YAML_DUMPER))
         
-        manifest_path = parent_dir / "samples" / "calculator.yaml"
-        result = runner.invoke(cli, ["validate", "--strict", str(manifest_path)])
+        run_direct(validate_command, manifest_files=(manifest_path,), strict=False, format="text")
+        hits = _parse_manifest_yaml.cache_info().hits
+        run_direct(validate_command, manifest_files=(manifest_path,), strict=False, format="text")
         
-        assert result.exit_code == 0
-        # Should still pass but might have warnings
+        assert _parse_manifest_yaml.cache_info().hits == hits + 1
     
-    def test_validate_json_output(self):
-        """Test validation with JSON output format."""
-        runner = CliRunner()
-        
-        manifest_path = parent_dir / "samples" / "calculator.yaml"
-        result = runner.invoke(cli, ["validate", "--format", "json", str(manifest_path)])
+    def test_load_manifest_yaml_shares_parse_but_not_data(self, tmp_path, monkeypatch):
+        """Test that relative and absolute paths share one parse and each caller gets its own copy."""
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text(yaml.dump({"connector": {"name": "x"}}, Dumper=YAML_DUMPER))
+        monkeypatch.chdir(tmp_path)
         
-        assert result.exit_code == 0
+        first = load_manifest_yaml(manifest_path)
+        hits = _parse_manifest_yaml.cache_info().hits
+        first["connector"]["name"] = "mutated"
+        second = load_manifest_yaml(Path("manifest.yaml"))
         
-        # Parse JSON output
-        output_data = json.loads(result.output)
-        assert output_data["overall_valid"] is True
-        assert output_data["validated_count"] == 1
-        assert len(output_data["results"]) == 1
-    
-    def test_validate_invalid_manifest(self):
-        """Test validation of an invalid manifest."""
-        runner = CliRunner()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            # Create invalid manifest
-            invalid_manifest = {
-                "connector": {
-                    "name": "invalid-name-with-@-in-wrong-place@",  # Invalid name
-                    "version": "not-semver",  # Invalid version
-                    "tools": []  # Empty tools array (invalid)
-                }
-            }
-            yaml.dump(invalid_manifest, f)
-            f.flush()
-            
-            result = runner.invoke(cli, ["validate", f.name])
-            
-            assert result.exit_code == 1
-            assert "✗ INVALID" in result.output
-            assert "Validation error" in result.output
+        assert _parse_manifest_yaml.cache_info().hits == hits + 1
+        assert second == {"connector": {"name": "x"}}
     
-    def test_validate_nonexistent_file(self):
+    def test_validate_nonexistent_file(self, runner):
         """Test validation of nonexistent file."""
-        runner = CliRunner()
-        
         result = runner.invoke(cli, ["validate", "/nonexistent/file.yaml"])
         
         assert result.exit_code == 1
@@ -112,147 +248,58 @@ class TestValidateCommand:
 class TestImportCommand:
     """Test the MCP import command."""
     
-    def create_test_openapi_spec(self) -> Dict[str, Any]:
-        """Create a test OpenAPI specification."""
-        return {
-            "openapi": "3.0.1",
-            "info": {
-                "title": "Test API",
-                "description": "A test API for validation",
-                "version": "1.0.0"
-            },
-            "paths": {
-                "/items": {
-                    "get": {
-                        "operationId": "listItems",
-                        "summary": "List all items",
-                        "responses": {
-                            "200": {
-                                "description": "List of items",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "array",
-                                            "items": {
-                                                "type": "object",
-                                                "properties": {
-                                                    "id": {"type": "integer"},
-                                                    "name": {"type": "string"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "post": {
-                        "operationId": "createItem",
-                        "summary": "Create new item",
-                        "requestBody": {
-                            "required": True,
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "name": {"type": "string"},
-                                            "description": {"type": "string"}
-                                        },
-                                        "required": ["name"]
-                                    }
-                                }
-                            }
-                        },
-                        "responses": {
-                            "201": {
-                                "description": "Created item",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object",
-                                            "properties": {
-                                                "id": {"type": "integer"},
-                                                "name": {"type": "string"}
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    
-    def test_import_valid_openapi_file(self):
-        """Test importing a valid OpenAPI file."""
-        runner = CliRunner()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.create_test_openapi_spec(), f)
-            f.flush()
-            
-            with tempfile.TemporaryDirectory() as tmpdir:
-                output_path = Path(tmpdir) / "test-connector.yaml"
-                
-                result = runner.invoke(cli, [
-                    "import",
-                    f.name,
-                    "--output", str(output_path),
-                    "--validate"
-                ])
-                
-                assert result.exit_code == 0
-                assert "Successfully generated MCP connector manifest" in result.output
-                assert "Tools generated: 2" in result.output
-                
-                # Check that output file was created
-                assert output_path.exists()
-                
-                # Validate the generated manifest
-                with open(output_path, 'r') as manifest_file:
-                    manifest_data = yaml.safe_load(manifest_file)
-                    manifest = ConnectorManifest.from_yaml_dict(manifest_data)
-                    assert len(manifest.tools) == 2
-                    assert manifest.name == "test-api"
-                    assert manifest.version == "1.0.0"
+    @pytest.mark.slow
+    def test_import_valid_openapi_file(self, runner, workdir, base_openapi_spec):
+        """Test importing a valid OpenAPI file to the default YAML output format."""
+        _, spec_path = base_openapi_spec
+        output_path = workdir / "test-connector.yaml"
+        
+        result = runner.invoke(cli, [
+            "import",
+            str(spec_path),
+            "--output", str(output_path),
+            "--validate"
+        ])
+        
+        assert result.exit_code == 0
+        assert "Successfully generated MCP connector manifest" in result.output
+        assert "Tools generated: 2" in result.output
+        
+        # Check that output file was created
+        assert output_path.exists()
+        
+        # Validate the generated manifest
+        manifest = load_generated_manifest(output_path)
+        assert len(manifest.tools) == 2
+        assert manifest.name == "test-api"
+        assert manifest.version == "1.0.0"
     
-    def test_import_with_name_override(self):
-        """Test importing with custom name and version."""
-        runner = CliRunner()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.create_test_openapi_spec(), f)
-            f.flush()
-            
-            with tempfile.TemporaryDirectory() as tmpdir:
-                output_path = Path(tmpdir) / "custom-connector.yaml"
-                
-                result = runner.invoke(cli, [
-                    "import",
-                    f.name,
-                    "--output", str(output_path),
-                    "--name", "@myorg/custom-api",
-                    "--version", "2.1.0",
-                    "--validate"
-                ])
-                
-                assert result.exit_code == 0
-                
-                # Check generated manifest has custom values
-                with open(output_path, 'r') as manifest_file:
-                    manifest_data = yaml.safe_load(manifest_file)
-                    manifest = ConnectorManifest.from_yaml_dict(manifest_data)
-                    assert manifest.name == "@myorg/custom-api"
-                    assert manifest.version == "2.1.0"
+    def test_import_with_name_override(self, runner, workdir, base_openapi_spec):
+        """Test importing from stdin with custom name and version."""
+        spec, _ = base_openapi_spec
+        output_path = workdir / "custom-connector.json"
+        
+        result = runner.invoke(cli, [
+            "import",
+            "-",
+            "--output", str(output_path),
+            "--name", "@myorg/custom-api",
+            "--version", "2.1.0",
+            "--validate"
+        ], input=orjson.dumps(spec))
+        
+        assert result.exit_code == 0
+        
+        # Check generated manifest has custom values
+        manifest = load_generated_manifest(output_path)
+        assert manifest.name == "@myorg/custom-api"
+        assert manifest.version == "2.1.0"
     
-    def test_import_with_path_filters(self):
+    @pytest.mark.slow
+    def test_import_with_path_filters(self, runner, workdir, base_openapi_spec):
         """Test importing with path include/exclude filters."""
-        runner = CliRunner()
-        
         # Create OpenAPI spec with multiple paths
-        spec = self.create_test_openapi_spec()
+        spec = copy.deepcopy(base_openapi_spec[0])
         spec["paths"]["/admin/users"] = {
             "get": {
                 "operationId": "getAdminUsers",
@@ -270,85 +317,72 @@ class TestImportCommand:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(spec, f)
-            f.flush()
-            
-            with tempfile.TemporaryDirectory() as tmpdir:
-                output_path = Path(tmpdir) / "filtered-connector.yaml"
-                
-                result = runner.invoke(cli, [
-                    "import",
-                    f.name,
-                    "--output", str(output_path),
-                    "--exclude-path", "/admin/*",
-                    "--validate"
-                ])
-                
-                assert result.exit_code == 0
-                
-                # Check that admin paths were excluded
-                with open(output_path, 'r') as manifest_file:
-                    manifest_data = yaml.safe_load(manifest_file)
-                    manifest = ConnectorManifest.from_yaml_dict(manifest_data)
-                    tool_names = [tool.name for tool in manifest.tools]
-                    assert "get_admin_users" not in tool_names
-                    assert "list_items" in tool_names
-                    assert "create_item" in tool_names
+        output_path = workdir / "filtered-connector.json"
+        
+        result = runner.invoke(cli, [
+            "import",
+            "-",
+            "--output", str(output_path),
+            "--exclude-path", "/admin/*",
+            "--validate"
+        ], input=orjson.dumps(spec))
+        
+        assert result.exit_code == 0
+        
+        # Check that admin paths were excluded
+        manifest = load_generated_manifest(output_path)
+        tool_names = [tool.name for tool in manifest.tools]
+        assert "get_admin_users" not in tool_names
+        assert "list_items" in tool_names
+        assert "create_item" in tool_names
+    
+    @pytest.mark.parametrize("patterns,path,expected", [
+        (["(?i)/USERS"], "/users", True),
+        (["/admin", "(?i)/USERS"], "/Users/1", True),
+        (["/(a)\\1", "/(b)\\1"], "/bb", True),
+        (["/(a)\\1", "/(b)\\1"], "/ab", False),
+    ])
+    def test_compile_path_filter_keeps_pattern_semantics(self, patterns, path, expected):
+        """Test that each filter pattern keeps its own flags and groups."""
+        compiled = compile_path_filter(patterns)
+        assert any(p.search(path) for p in compiled) is expected
     
-    def test_import_invalid_openapi(self):
+    def test_import_invalid_openapi(self, runner):
         """Test importing an invalid OpenAPI specification."""
-        runner = CliRunner()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            # Create invalid OpenAPI spec
-            invalid_spec = {
-                "openapi": "3.0.1",
-                # Missing required 'info' field
-                "paths": {}
-            }
-            json.dump(invalid_spec, f)
-            f.flush()
-            
-            result = runner.invoke(cli, ["import", f.name])
-            
-            assert result.exit_code == 1
-            assert "Import failed" in result.output
+        # Create invalid OpenAPI spec
+        invalid_spec = {
+            "openapi": "3.0.1",
+            # Missing required 'info' field
+            "paths": {}
+        }
+        result = runner.invoke(cli, ["import", "-"], input=orjson.dumps(invalid_spec))
+        
+        assert result.exit_code == 1
+        assert "Import failed" in result.output
     
-    def test_import_auto_generated_filename(self):
+    def test_import_auto_generated_filename(self, runner, tmp_path, base_openapi_spec, monkeypatch):
         """Test import with auto-generated output filename."""
-        runner = CliRunner()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.create_test_openapi_spec(), f)
-            f.flush()
-            
-            # Run in temp directory to control output location
-            with tempfile.TemporaryDirectory() as tmpdir:
-                import os
-                original_cwd = os.getcwd()
-                try:
-                    os.chdir(tmpdir)
-                    
-                    result = runner.invoke(cli, ["import", f.name, "--validate"])
-                    
-                    assert result.exit_code == 0
-                    assert "Successfully generated MCP connector manifest" in result.output
-                    
-                    # Check that file was created with expected name
-                    expected_file = Path(tmpdir) / "test-api.yaml"
-                    assert expected_file.exists()
-                    
-                finally:
-                    os.chdir(original_cwd)
+        spec, _ = base_openapi_spec
+        
+        # The default output goes to the samples directory; point it at this
+        # test's own temp dir so nothing lands in the source tree
+        monkeypatch.setattr(import_cmd, "DEFAULT_OUTPUT_DIR", tmp_path)
+        
+        result = runner.invoke(cli, ["import", "-", "--validate"], input=orjson.dumps(spec))
+        
+        assert result.exit_code == 0
+        assert "Successfully generated MCP connector manifest" in result.output
+        
+        # Check that file was created with expected name
+        expected_file = tmp_path / "test-api.yaml"
+        assert expected_file.exists()
 
 
 class TestCLIIntegration:
     """Test CLI integration and end-to-end workflows."""
     
-    def test_cli_main_help(self):
+    def test_cli_main_help(self, runner):
         """Test main CLI help command."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--help"])
         
         assert result.exit_code == 0
@@ -356,18 +390,16 @@ class TestCLIIntegration:
         assert "import" in result.output
         assert "validate" in result.output
     
-    def test_cli_version(self):
+    def test_cli_version(self, runner):
         """Test CLI version command."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--version"])
         
         assert result.exit_code == 0
         assert "0.2.0" in result.output
     
-    def test_end_to_end_import_and_validate(self):
+    @pytest.mark.slow
+    def test_end_to_end_import_and_validate(self, workdir):
         """Test complete workflow: import OpenAPI then validate result."""
-        runner = CliRunner()
-        
         # Create test OpenAPI spec
         test_spec = {
             "openapi": "3.0.1",
@@ -400,41 +432,45 @@ class TestCLIIntegration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as spec_file:
-            json.dump(test_spec, spec_file)
-            spec_file.flush()
-            
-            with tempfile.TemporaryDirectory() as tmpdir:
-                output_path = Path(tmpdir) / "e2e-test.yaml"
-                
-                # Step 1: Import
-                import_result = runner.invoke(cli, [
-                    "import",
-                    spec_file.name,
-                    "--output", str(output_path),
-                    "--validate"
-                ])
-                
-                assert import_result.exit_code == 0
-                assert output_path.exists()
-                
-                # Step 2: Validate with strict mode
-                validate_result = runner.invoke(cli, [
-                    "validate",
-                    "--strict",
-                    "--format", "json",
-                    str(output_path)
-                ])
-                
-                assert validate_result.exit_code == 0
-                
-                # Parse validation results
-                validation_data = json.loads(validate_result.output)
-                assert validation_data["overall_valid"] is True
-                assert validation_data["validated_count"] == 1
-                
-                result = validation_data["results"][0]
-                assert result["valid"] is True
-                assert result["manifest"]["name"] == "e2e-test-api"
-                assert len(result["manifest"]["tools"]) == 1
-                assert result["manifest"]["tools"][0]["name"] == "test_operation"
\ No newline at end of file
+        spec_path = workdir / "spec.json"
+        spec_path.write_bytes(orjson.dumps(test_spec))
+        
+        output_path = workdir / "e2e-test.yaml"
+        
+        # Step 1: Import
+        import_exit_code, _ = run_direct(
+            import_command,
+            openapi_source=str(spec_path),
+            output=output_path,
+            name=None,
+            version=None,
+            include_path=(),
+            exclude_path=(),
+            max_tools=50,
+            force=False,
+            validate=True
+        )
+        
+        assert import_exit_code == 0
+        assert output_path.exists()
+        
+        # Step 2: Validate with strict mode
+        validate_exit_code, validate_output = run_direct(
+            validate_command,
+            manifest_files=(output_path,),
+            strict=True,
+            format="json"
+        )
+        
+        assert validate_exit_code == 0
+        
+        # Parse validation results
+        validation_data = orjson.loads(validate_output)
+        assert validation_data["overall_valid"] is True
+        assert validation_data["validated_count"] == 1
+        
+        result = validation_data["results"][0]
+        assert result["valid"] is True
+        assert result["manifest"]["name"] == "e2e-test-api"
+        assert len(result["manifest"]["tools"]) == 1
+        assert result["manifest"]["tools"][0]["name"] == "test_operation"
\ No newline at end of file
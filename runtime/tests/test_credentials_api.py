@@ -6,348 +6,260 @@ including storing, retrieving, listing, and deleting connector credentials.
 """
 
 import pytest
-import json
-import tempfile
-import shutil
-import sys
-import os
-from unittest.mock import patch, AsyncMock
-from fastapi.testclient import TestClient
+import orjson
+from urllib.parse import quote
 
-# Add the parent directory to the path for package imports
-runtime_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(runtime_dir)
-sys.path.insert(0, parent_dir)
+# Import through the same top-level packages as the app (see conftest) so the
+# seeded SecretType is the one the credentials router compares against
+from core.secrets import SecretRecord, SecretType, generate_secret_name
 
-from runtime.main import create_app
-from runtime.core.secret_factory import reset_secret_storage
-from runtime.core.local_secrets import LocalSecretStorage
+# Request bodies are sent as orjson-encoded bytes and responses parsed with orjson
+_JSON_HEADERS = {"content-type": "application/json"}
+_INVALID_AUTH_TYPE_BODY = orjson.dumps({
+    "connector_name": "test-connector",
+    "auth_type": "invalid_type",
+    "credentials": {"value": "test"}
+})
+_MISSING_FIELDS_BODY = orjson.dumps({
+    "connector_name": "test-connector",
+    "auth_type": "api_key",
+    "credentials": {}  # Missing 'value' field
+})
 
 
+def _json(response):
+    return orjson.loads(response.content)
+
+
+class _RaisingStorage:
+    """Storage double whose listing fails, for the API's error path."""
+    
+    async def list_secrets(self, connector_name=None, secret_type=None):
+        raise Exception("Storage unavailable")
+
+
+# URL-encoded connector names for the per-connector endpoints
+GITHUB_ENC = quote("@github/api")
+SLACK_ENC = quote("@slack/api")
+NONEXISTENT_ENC = quote("nonexistent-connector")
+
+# (auth_type, credentials, connector name, encoded connector name) per supported auth type
+CREDENTIAL_CASES = [
+    pytest.param(
+        "api_key",
+        {"value": "ghp_1234567890abcdef", "key_name": "authorization", "location": "header", "scheme": "Bearer"},
+        "@github/api",
+        GITHUB_ENC,
+        id="api_key"
+    ),
+    pytest.param(
+        "oauth2_client_credentials",
+        {
+            "client_id": "slack_client_123",
+            "client_secret": "slack_secret_456",
+            "token_url": "https://slack.com/api/oauth.v2.access",
+            "scopes": ["chat:write", "channels:read"]
+        },
+        "@slack/api",
+        SLACK_ENC,
+        id="oauth2"
+    ),
+]
+
+
+# Requests go through the in-loop aclient, which lives on the session event loop
+@pytest.mark.asyncio(scope="session")
 class TestCredentialsAPI:
-    """Tests for the credentials API endpoints."""
+    """
+    Tests for the credentials API endpoints.
+    
+    Safe under pytest-xdist: every test gets its own in-memory storage on
+    ``app.state``, so no secret storage singleton or files on disk are shared
+    between tests or workers.
+    """
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create a temporary directory for secret storage."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+    @pytest.fixture(autouse=True)
+    def memory_storage(self, app, make_memory_secret_storage):
+        """Back the shared app's credentials API with a fresh in-memory secret store per test."""
+        storage = make_memory_secret_storage()
+        app.state.secret_storage = storage
+        self._storage = storage
+        yield storage
+        del app.state.secret_storage
 
-    @pytest.fixture
-    def client(self, temp_storage_dir):
-        """Create a test client with local secret storage."""
-        # Reset global storage
-        reset_secret_storage()
-        
-        # Mock the get_secret_storage function to use local storage
-        async def mock_get_storage():
-            return LocalSecretStorage(temp_storage_dir)
-        
-        with patch('runtime.api.credentials.get_secret_storage', mock_get_storage):
-            app = create_app()
-            with TestClient(app) as test_client:
-                yield test_client
+    async def _seed(self, connector_name, auth_type, credentials, description=None):
+        """Store credentials directly in the backing storage, laid out as the POST endpoint stores them."""
+        if auth_type == "api_key":
+            records = [
+                SecretRecord(
+                    name=generate_secret_name(connector_name, SecretType.API_KEY),
+                    value=credentials["value"],
+                    secret_type=SecretType.API_KEY,
+                    connector_name=connector_name,
+                    description=description,
+                    tags={
+                        "key_name": credentials.get("key_name", ""),
+                        "location": credentials.get("location", "header"),
+                        "scheme": credentials.get("scheme", "")
+                    }
+                )
+            ]
+        else:
+            tags = {
+                "token_url": credentials.get("token_url", ""),
+                "scopes": ",".join(credentials.get("scopes", []))
+            }
+            records = [
+                SecretRecord(
+                    name=generate_secret_name(connector_name, secret_type),
+                    value=credentials[field],
+                    secret_type=secret_type,
+                    connector_name=connector_name,
+                    description=f"{label} - {description or ''}".strip(),
+                    tags=tags
+                )
+                for secret_type, field, label in [
+                    (SecretType.OAUTH2_CLIENT_ID, "client_id", "OAuth2 Client ID"),
+                    (SecretType.OAUTH2_CLIENT_SECRET, "client_secret", "OAuth2 Client Secret"),
+                ]
+            ]
+        
+        await self._storage.store_secrets_bulk(records)
 
-    def test_store_api_key_credentials(self, client):
-        """Test storing API key credentials."""
+    @pytest.mark.parametrize("auth_type,credentials,connector_name,encoded_name", CREDENTIAL_CASES)
+    async def test_store_credentials(self, aclient, auth_type, credentials, connector_name, encoded_name):
+        """Test storing credentials for each supported auth type."""
         request_data = {
-            "connector_name": "@github/api",
-            "auth_type": "api_key",
-            "credentials": {
-                "value": "ghp_1234567890abcdef",
-                "key_name": "authorization",
-                "location": "header",
-                "scheme": "Bearer"
-            },
-            "description": "GitHub personal access token",
+            "connector_name": connector_name,
+            "auth_type": auth_type,
+            "credentials": credentials,
+            "description": "Test credentials",
             "tags": {"env": "test"},
             "expires_at": "2024-12-31T23:59:59Z"
         }
         
-        response = client.post("/v1/credentials/", json=request_data)
+        response = await aclient.post("/v1/credentials/", content=orjson.dumps(request_data), headers=_JSON_HEADERS)
         
         assert response.status_code == 201
-        data = response.json()
-        assert data["connector_name"] == "@github/api"
-        assert data["auth_type"] == "api_key"
-        assert data["description"] == "GitHub personal access token"
+        data = _json(response)
+        assert data["connector_name"] == connector_name
+        assert data["auth_type"] == auth_type
+        assert data["description"] == "Test credentials"
         assert data["tags"] == {"env": "test"}
         assert data["expires_at"] == "2024-12-31T23:59:59Z"
         assert data["has_credentials"] is True
 
-    def test_store_oauth2_credentials(self, client):
-        """Test storing OAuth2 client credentials."""
-        request_data = {
-            "connector_name": "@slack/api",
-            "auth_type": "oauth2_client_credentials",
-            "credentials": {
-                "client_id": "slack_client_123",
-                "client_secret": "slack_secret_456",
-                "token_url": "https://slack.com/api/oauth.v2.access",
-                "scopes": ["chat:write", "channels:read"]
-            },
-            "description": "Slack OAuth2 credentials"
-        }
-        
-        response = client.post("/v1/credentials/", json=request_data)
-        
-        assert response.status_code == 201
-        data = response.json()
-        assert data["connector_name"] == "@slack/api"
-        assert data["auth_type"] == "oauth2_client_credentials"
-        assert data["description"] == "Slack OAuth2 credentials"
-        assert data["has_credentials"] is True
-
-    def test_store_credentials_invalid_auth_type(self, client):
+    async def test_store_credentials_invalid_auth_type(self, aclient):
         """Test storing credentials with invalid auth type."""
-        request_data = {
-            "connector_name": "test-connector",
-            "auth_type": "invalid_type",
-            "credentials": {"value": "test"}
-        }
-        
-        response = client.post("/v1/credentials/", json=request_data)
+        response = await aclient.post("/v1/credentials/", content=_INVALID_AUTH_TYPE_BODY, headers=_JSON_HEADERS)
         
         assert response.status_code == 422  # Validation error
 
-    def test_store_credentials_missing_required_fields(self, client):
+    async def test_store_credentials_missing_required_fields(self, aclient):
         """Test storing credentials with missing required fields."""
-        request_data = {
-            "connector_name": "test-connector",
-            "auth_type": "api_key",
-            "credentials": {}  # Missing 'value' field
-        }
-        
-        response = client.post("/v1/credentials/", json=request_data)
+        response = await aclient.post("/v1/credentials/", content=_MISSING_FIELDS_BODY, headers=_JSON_HEADERS)
         
         assert response.status_code == 422  # Validation error
 
-    def test_list_credentials_empty(self, client):
+    async def test_list_credentials_empty(self, aclient):
         """Test listing credentials when none exist."""
-        response = client.get("/v1/credentials/")
+        response = await aclient.get("/v1/credentials/")
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["credentials"] == []
         assert data["total"] == 0
 
-    def test_list_credentials_with_data(self, client):
-        """Test listing credentials with stored data."""
-        # Store some credentials first
-        api_key_request = {
-            "connector_name": "@github/api",
-            "auth_type": "api_key",
-            "credentials": {"value": "ghp_test"},
-            "description": "GitHub token"
-        }
-        client.post("/v1/credentials/", json=api_key_request)
-        
-        oauth_request = {
-            "connector_name": "@slack/api",
-            "auth_type": "oauth2_client_credentials",
-            "credentials": {
-                "client_id": "slack_id",
-                "client_secret": "slack_secret"
-            },
-            "description": "Slack OAuth2"
-        }
-        client.post("/v1/credentials/", json=oauth_request)
+    async def test_list_credentials_behaviors(self, aclient):
+        """Test listing stored credentials, unfiltered and filtered by connector and auth type."""
+        # Store one credential of each auth type
+        await self._seed("@github/api", "api_key", {"value": "ghp_test"}, description="GitHub token")
+        await self._seed(
+            "@slack/api",
+            "oauth2_client_credentials",
+            {"client_id": "slack_id", "client_secret": "slack_secret"},
+            description="Slack OAuth2"
+        )
         
         # List all credentials
-        response = client.get("/v1/credentials/")
+        response = await aclient.get("/v1/credentials/")
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["total"] == 2
-        
-        credentials = data["credentials"]
-        connector_names = [cred["connector_name"] for cred in credentials]
+        connector_names = [cred["connector_name"] for cred in data["credentials"]]
         assert "@github/api" in connector_names
         assert "@slack/api" in connector_names
-
-    def test_list_credentials_filtered_by_connector(self, client):
-        """Test listing credentials filtered by connector name."""
-        # Store credentials for multiple connectors
-        for connector in ["@github/api", "@slack/api"]:
-            request_data = {
-                "connector_name": connector,
-                "auth_type": "api_key",
-                "credentials": {"value": f"token_{connector}"}
-            }
-            client.post("/v1/credentials/", json=request_data)
         
         # Filter by connector name
-        response = client.get("/v1/credentials/?connector_name=@github/api")
+        response = await aclient.get("/v1/credentials/?connector_name=@github/api")
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["total"] == 1
         assert data["credentials"][0]["connector_name"] == "@github/api"
-
-    def test_list_credentials_filtered_by_auth_type(self, client):
-        """Test listing credentials filtered by auth type."""
-        # Store different types of credentials
-        api_key_request = {
-            "connector_name": "@github/api",
-            "auth_type": "api_key",
-            "credentials": {"value": "ghp_test"}
-        }
-        client.post("/v1/credentials/", json=api_key_request)
-        
-        oauth_request = {
-            "connector_name": "@slack/api",
-            "auth_type": "oauth2_client_credentials",
-            "credentials": {
-                "client_id": "slack_id",
-                "client_secret": "slack_secret"
-            }
-        }
-        client.post("/v1/credentials/", json=oauth_request)
         
         # Filter by auth type
-        response = client.get("/v1/credentials/?auth_type=api_key")
+        response = await aclient.get("/v1/credentials/?auth_type=api_key")
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert data["total"] == 1
         assert data["credentials"][0]["auth_type"] == "api_key"
 
-    def test_get_credentials_api_key(self, client):
-        """Test getting credentials for a specific connector with API key."""
-        from urllib.parse import quote
-        
-        # Store API key credentials
-        request_data = {
-            "connector_name": "@github/api",
-            "auth_type": "api_key",
-            "credentials": {"value": "ghp_test"},
-            "description": "GitHub token"
-        }
-        client.post("/v1/credentials/", json=request_data)
-        
-        # Get credentials (URL encode the connector name)
-        encoded_name = quote("@github/api")
-        response = client.get(f"/v1/credentials/{encoded_name}")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["connector_name"] == "@github/api"
-        assert data["auth_type"] == "api_key"
-        assert data["description"] == "GitHub token"
-        assert data["has_credentials"] is True
-
-    def test_get_credentials_oauth2(self, client):
-        """Test getting credentials for a specific connector with OAuth2."""
-        from urllib.parse import quote
-        
-        # Store OAuth2 credentials
-        request_data = {
-            "connector_name": "@slack/api",
-            "auth_type": "oauth2_client_credentials",
-            "credentials": {
-                "client_id": "slack_id",
-                "client_secret": "slack_secret"
-            },
-            "description": "Slack OAuth2"
-        }
-        client.post("/v1/credentials/", json=request_data)
+    @pytest.mark.parametrize("auth_type,credentials,connector_name,encoded_name", CREDENTIAL_CASES)
+    async def test_get_credentials(self, aclient, auth_type, credentials, connector_name, encoded_name):
+        """Test getting credentials for a specific connector."""
+        await self._seed(connector_name, auth_type, credentials, description="Test credentials")
         
-        # Get credentials (URL encode the connector name)
-        encoded_name = quote("@slack/api")
-        response = client.get(f"/v1/credentials/{encoded_name}")
+        response = await aclient.get(f"/v1/credentials/{encoded_name}")
         
         assert response.status_code == 200
-        data = response.json()
-        assert data["connector_name"] == "@slack/api"
-        assert data["auth_type"] == "oauth2_client_credentials"
-        assert data["description"] == "Slack OAuth2"
+        data = _json(response)
+        assert data["connector_name"] == connector_name
+        assert data["auth_type"] == auth_type
+        # OAuth2 secrets are stored with a "OAuth2 Client ID - " label in front
+        assert data["description"].endswith("Test credentials")
         assert data["has_credentials"] is True
 
-    def test_get_credentials_not_found(self, client):
+    async def test_get_credentials_not_found(self, aclient):
         """Test getting credentials for a non-existent connector."""
-        from urllib.parse import quote
-        
-        encoded_name = quote("nonexistent-connector")
-        response = client.get(f"/v1/credentials/{encoded_name}")
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    def test_delete_credentials_api_key(self, client):
-        """Test deleting API key credentials."""
-        from urllib.parse import quote
-        
-        # Store credentials first
-        request_data = {
-            "connector_name": "@github/api",
-            "auth_type": "api_key",
-            "credentials": {"value": "ghp_test"}
-        }
-        client.post("/v1/credentials/", json=request_data)
-        
-        # Verify credentials exist
-        encoded_name = quote("@github/api")
-        response = client.get(f"/v1/credentials/{encoded_name}")
-        assert response.status_code == 200
-        
-        # Delete credentials
-        response = client.delete(f"/v1/credentials/{encoded_name}")
-        assert response.status_code == 204
+        response = await aclient.get(f"/v1/credentials/{NONEXISTENT_ENC}")
         
-        # Verify credentials are gone
-        response = client.get(f"/v1/credentials/{encoded_name}")
         assert response.status_code == 404
+        data = _json(response)
+        assert "no credentials found" in data["detail"].lower()
 
-    def test_delete_credentials_oauth2(self, client):
-        """Test deleting OAuth2 credentials."""
-        from urllib.parse import quote
-        
-        # Store credentials first
-        request_data = {
-            "connector_name": "@slack/api",
-            "auth_type": "oauth2_client_credentials",
-            "credentials": {
-                "client_id": "slack_id",
-                "client_secret": "slack_secret"
-            }
-        }
-        client.post("/v1/credentials/", json=request_data)
+    @pytest.mark.parametrize("auth_type,credentials,connector_name,encoded_name", CREDENTIAL_CASES)
+    async def test_delete_credentials(self, aclient, auth_type, credentials, connector_name, encoded_name):
+        """Test deleting credentials for a specific connector."""
+        await self._seed(connector_name, auth_type, credentials)
         
         # Verify credentials exist
-        encoded_name = quote("@slack/api")
-        response = client.get(f"/v1/credentials/{encoded_name}")
+        response = await aclient.get(f"/v1/credentials/{encoded_name}")
         assert response.status_code == 200
         
         # Delete credentials
-        response = client.delete(f"/v1/credentials/{encoded_name}")
+        response = await aclient.delete(f"/v1/credentials/{encoded_name}")
         assert response.status_code == 204
         
         # Verify credentials are gone
-        response = client.get(f"/v1/credentials/{encoded_name}")
+        response = await aclient.get(f"/v1/credentials/{encoded_name}")
         assert response.status_code == 404
 
-    def test_delete_credentials_not_found(self, client):
+    async def test_delete_credentials_not_found(self, aclient):
         """Test deleting credentials for a non-existent connector."""
-        from urllib.parse import quote
-        
-        encoded_name = quote("nonexistent-connector")
-        response = client.delete(f"/v1/credentials/{encoded_name}")
+        response = await aclient.delete(f"/v1/credentials/{NONEXISTENT_ENC}")
         
         assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        data = _json(response)
+        assert "no credentials found" in data["detail"].lower()
 
-    def test_credentials_api_error_handling(self, client):
+    async def test_credentials_api_error_handling(self, app, aclient):
         """Test error handling in credentials API."""
-        # Mock storage error
-        async def mock_get_storage_error():
-            raise Exception("Storage unavailable")
+        app.state.secret_storage = _RaisingStorage()
+        response = await aclient.get("/v1/credentials/")
         
-        with patch('runtime.api.credentials.get_secret_storage', mock_get_storage_error):
-            response = client.get("/v1/credentials/")
-            
-            assert response.status_code == 500
-            data = response.json()
-            assert "Unexpected error" in data["detail"]
\ No newline at end of file
+        assert response.status_code == 500
+        data = _json(response)
+        assert "Unexpected error" in data["detail"]
@@ -5,19 +5,16 @@ This module contains comprehensive tests for the Pydantic models
 used to validate and process connector manifests.
 """
 
-from typing import Dict, Any
+import math
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+import orjson
 import pytest
-import sys
-import os
+import yaml
 # Import the specific ValidationError type that's actually raised
 from pydantic_core import ValidationError
 
-# Add the parent directory to the path for package imports
-runtime_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(runtime_dir)
-sys.path.insert(0, parent_dir)
-
-from runtime.models.manifest import (
+from models.manifest import (
     ConnectorManifest, 
     ConnectorTool, 
     NoAuth, 
@@ -26,6 +23,12 @@ from runtime.models.manifest import (
 )
 
 
+def _fresh(template: Mapping[str, Any]) -> Dict[str, Any]:
+    """Deep-copy a read-only fixture template into a dict a test may mutate."""
+    # Templates are plain JSON data, so an orjson round trip is a cheap deep copy
+    return orjson.loads(orjson.dumps(dict(template)))
+
+
 class TestToolAuth:
     """Tests for individual auth models."""
 
@@ -65,6 +68,17 @@ class TestToolAuth:
         assert auth.token_url == "https://api.example.com/oauth/token"
         assert auth.scopes == ["read", "write"]
 
+    def test_auth_models_are_frozen(self):
+        """Test that auth models reject mutation and unknown fields."""
+        auth = ApiKeyAuth(key_name="x-api-key")
+        with pytest.raises(ValidationError):
+            auth.key_name = "other"
+        assert auth == ApiKeyAuth(key_name="x-api-key")
+        assert hash(NoAuth()) == hash(NoAuth())
+
+        with pytest.raises(ValidationError):
+            NoAuth(token="unexpected")
+
 
 class TestConnectorToolAuth:
     """Tests for ConnectorTool auth functionality."""
@@ -124,10 +138,10 @@ class TestConnectorToolAuth:
 class TestConnectorTool:
     """Tests for ConnectorTool model."""
 
-    @pytest.fixture
-    def valid_tool_data(self) -> Dict[str, Any]:
-        """Valid tool data for testing."""
-        return {
+    @pytest.fixture(scope="module")
+    def valid_tool_data(self) -> Mapping[str, Any]:
+        """Valid tool data for testing; read-only and shared by the module, so copy it with _fresh() to mutate."""
+        return MappingProxyType({
             "name": "get_weather",
             "description": "Get current weather for a location",
             "input_schema": {
@@ -148,9 +162,9 @@ class TestConnectorTool:
                 "required": ["temperature", "description"]
             },
             "endpoint": "weather.get_current"
-        }
+        })
 
-    def test_valid_tool_creation(self, valid_tool_data: Dict[str, Any]):
+    def test_valid_tool_creation(self, valid_tool_data: Mapping[str, Any]):
         """Test creating a valid tool."""
         tool = ConnectorTool(**valid_tool_data)
         assert tool.name == "get_weather"
@@ -158,96 +172,92 @@ class TestConnectorTool:
         assert tool.endpoint == "weather.get_current"
         assert tool.auth.type == "none"
 
-    def test_tool_name_validation(self, valid_tool_data: Dict[str, Any]):
-        """Test tool name validation rules."""
-        # Valid names
-        valid_names = ["get_weather", "list_items", "create_user", "api_v2"]
-        for name in valid_names:
-            data = valid_tool_data.copy()
-            data["name"] = name
-            tool = ConnectorTool(**data)
-            assert tool.name == name
-
+    @pytest.mark.parametrize("name,valid", [
+        ("get_weather", True),
+        ("list_items", True),
+        ("create_user", True),
+        ("api_v2", True),
         # Invalid names - check against actual validator pattern
-        invalid_names = [
-            "GetWeather",  # uppercase
-            "get-weather",  # hyphen (not allowed in tool names)
-            "2get_weather",  # starts with number
-            "get weather",  # space
-            "",  # empty
-            "a" * 101  # too long
-        ]
-        for name in invalid_names:
-            data = valid_tool_data.copy()
-            data["name"] = name
+        ("GetWeather", False),  # uppercase
+        ("get-weather", False),  # hyphen (not allowed in tool names)
+        ("2get_weather", False),  # starts with number
+        ("get weather", False),  # space
+        ("", False),  # empty
+        ("a" * 101, False),  # too long
+    ])
+    def test_tool_name_validation(self, valid_tool_data: Mapping[str, Any], name: str, valid: bool):
+        """Test tool name validation rules."""
+        data = valid_tool_data | {"name": name}
+        if valid:
+            assert ConnectorTool(**data).name == name
+        else:
             with pytest.raises(ValidationError):
                 ConnectorTool(**data)
 
-    def test_endpoint_validation(self, valid_tool_data: Dict[str, Any]):
+    @pytest.mark.parametrize("endpoint,valid", [
+        ("weather.get", True),
+        ("api-v1.users", True),
+        ("service_name.action", True),
+        ("simple", True),
+        ("Complex.Multi-Part.endpoint_name", True),
+        ("1weather", False),  # starts with number
+        ("-weather", False),  # starts with hyphen
+        ("weather..get", False),  # double dot
+        ("weather.", False),  # ends with dot
+        ("", False),  # empty
+        ("a" * 201, False),  # too long
+    ])
+    def test_endpoint_validation(self, valid_tool_data: Mapping[str, Any], endpoint: str, valid: bool):
         """Test endpoint validation rules."""
-        # Valid endpoints
-        valid_endpoints = [
-            "weather.get",
-            "api-v1.users",
-            "service_name.action",
-            "simple",
-            "Complex.Multi-Part.endpoint_name"
-        ]
-        for endpoint in valid_endpoints:
-            data = valid_tool_data.copy()
-            data["endpoint"] = endpoint
-            tool = ConnectorTool(**data)
-            assert tool.endpoint == endpoint
-
-        # Invalid endpoints
-        invalid_endpoints = [
-            "1weather",  # starts with number
-            "-weather",  # starts with hyphen
-            "weather..get",  # double dot
-            "weather.",  # ends with dot
-            "",  # empty
-            "a" * 201  # too long
-        ]
-        for endpoint in invalid_endpoints:
-            data = valid_tool_data.copy()
-            data["endpoint"] = endpoint
+        data = valid_tool_data | {"endpoint": endpoint}
+        if valid:
+            assert ConnectorTool(**data).endpoint == endpoint
+        else:
             with pytest.raises(ValidationError):
                 ConnectorTool(**data)
 
-    def test_schema_validation(self, valid_tool_data: Dict[str, Any]):
+    def test_schema_validation(self, valid_tool_data: Mapping[str, Any], meta_validator):
         """Test JSON schema validation."""
         # Invalid schema - not an object
-        data = valid_tool_data.copy()
-        data["input_schema"] = "not a schema"
-        with pytest.raises(ValidationError) as exc_info:
+        data = valid_tool_data | {"input_schema": "not a schema"}
+        with pytest.raises(ValidationError, match="Schema must be a JSON object"):
             ConnectorTool(**data)
-        assert "Schema must be a JSON object" in str(exc_info.value)
 
         # Invalid schema - missing type
-        data = valid_tool_data.copy()
-        data["input_schema"] = {"properties": {}}
-        with pytest.raises(ValidationError) as exc_info:
+        data = valid_tool_data | {"input_schema": {"properties": {}}}
+        with pytest.raises(ValidationError, match="Schema must have a 'type' property"):
             ConnectorTool(**data)
-        assert "Schema must have a 'type' property" in str(exc_info.value)
 
         # Invalid JSON Schema
-        data = valid_tool_data.copy()
-        data["input_schema"] = {"type": "invalid_type"}
-        with pytest.raises(ValidationError) as exc_info:
+        data = valid_tool_data | {"input_schema": {"type": "invalid_type"}}
+        assert not meta_validator.is_valid(data["input_schema"])
+        with pytest.raises(ValidationError, match="Schema validation error"):
             ConnectorTool(**data)
-        assert "Schema validation error" in str(exc_info.value)
 
-    def test_description_length_validation(self, valid_tool_data: Dict[str, Any]):
+    def test_schema_check_cache(self, valid_tool_data: Mapping[str, Any]):
+        """Test that repeated schemas reuse the meta-validation result."""
+        from models.manifest import _SCHEMA_CHECK_CACHE
+
+        ConnectorTool(**valid_tool_data)
+        cached = len(_SCHEMA_CHECK_CACHE)
+        ConnectorTool(**valid_tool_data)
+        assert len(_SCHEMA_CHECK_CACHE) == cached
+
+        # Invalid schemas are never cached, so they keep failing
+        data = valid_tool_data | {"input_schema": {"type": "invalid_type"}}
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                ConnectorTool(**data)
+
+    def test_description_length_validation(self, valid_tool_data: Mapping[str, Any]):
         """Test description length validation."""
         # Empty description
-        data = valid_tool_data.copy()
-        data["description"] = ""
+        data = valid_tool_data | {"description": ""}
         with pytest.raises(ValidationError):
             ConnectorTool(**data)
 
         # Too long description
-        data = valid_tool_data.copy()
-        data["description"] = "a" * 1001
+        data = valid_tool_data | {"description": "a" * 1001}
         with pytest.raises(ValidationError):
             ConnectorTool(**data)
 
@@ -255,10 +265,10 @@ class TestConnectorTool:
 class TestConnectorManifest:
     """Tests for ConnectorManifest model."""
 
-    @pytest.fixture
-    def valid_manifest_data(self) -> Dict[str, Any]:
-        """Valid manifest data for testing."""
-        return {
+    @pytest.fixture(scope="module")
+    def valid_manifest_data(self) -> Mapping[str, Any]:
+        """Valid manifest data for testing; read-only and shared by the module, so copy it with _fresh() to mutate."""
+        return MappingProxyType({
             "name": "weather-api",
             "version": "1.0.0",
             "tools": [
@@ -311,134 +321,120 @@ class TestConnectorManifest:
                     "endpoint": "weather.forecast"
                 }
             ]
-        }
+        })
+
+    @pytest.fixture(scope="module")
+    def valid_manifest(self, valid_manifest_data: Mapping[str, Any]) -> ConnectorManifest:
+        """Manifest validated once per module; read-only, so build a new one to mutate."""
+        return ConnectorManifest(**valid_manifest_data)
 
-    def test_valid_manifest_creation(self, valid_manifest_data: Dict[str, Any]):
+    def test_valid_manifest_creation(self, valid_manifest: ConnectorManifest):
         """Test creating a valid manifest."""
-        manifest = ConnectorManifest(**valid_manifest_data)
+        manifest = valid_manifest
         assert manifest.name == "weather-api"
         assert manifest.version == "1.0.0"
         assert len(manifest.tools) == 2
         assert manifest.tools[0].name == "get_weather"
         assert manifest.tools[1].name == "get_forecast"
 
-    def test_connector_name_validation(self, valid_manifest_data: Dict[str, Any]):
+    @pytest.mark.parametrize("name,valid", [
+        ("weather-api", True),
+        ("weather_api", True),
+        ("weather.api", True),
+        ("api123", True),
+        ("@org/weather-api", True),
+        ("@my-org/weather.connector", True),
+        ("simple", True),
+        ("Weather-API", False),  # uppercase
+        ("weather API", False),  # space
+        ("", False),  # empty
+        ("123weather", False),  # starts with number
+        ("@/weather", False),  # invalid scope
+        ("@ORG/weather", False),  # uppercase in scope
+        ("a" * 101, False),  # too long
+    ])
+    def test_connector_name_validation(self, valid_manifest_data: Mapping[str, Any], name: str, valid: bool):
         """Test connector name validation rules."""
-        # Valid names
-        valid_names = [
-            "weather-api",
-            "weather_api",
-            "weather.api",
-            "api123",
-            "@org/weather-api",
-            "@my-org/weather.connector",
-            "simple"
-        ]
-        for name in valid_names:
-            data = valid_manifest_data.copy()
-            data["name"] = name
-            manifest = ConnectorManifest(**data)
-            assert manifest.name == name
-
-        # Invalid names
-        invalid_names = [
-            "Weather-API",  # uppercase
-            "weather API",  # space
-            "",  # empty
-            "123weather",  # starts with number
-            "@/weather",  # invalid scope
-            "@ORG/weather",  # uppercase in scope
-            "a" * 101  # too long
-        ]
-        for name in invalid_names:
-            data = valid_manifest_data.copy()
-            data["name"] = name
+        data = valid_manifest_data | {"name": name}
+        if valid:
+            assert ConnectorManifest(**data).name == name
+        else:
             with pytest.raises(ValidationError):
                 ConnectorManifest(**data)
 
-    def test_version_validation(self, valid_manifest_data: Dict[str, Any]):
+    @pytest.mark.parametrize("version,valid", [
+        ("1.0.0", True),
+        ("0.1.0", True),
+        ("10.20.30", True),
+        ("1.0.0-alpha", True),
+        ("1.0.0-alpha.1", True),
+        ("1.0.0-0.3.7", True),
+        ("1.0.0-x.7.z.92", True),
+        ("1.0.0+20130313144700", True),
+        ("1.0.0-beta+exp.sha.5114f85", True),
+        ("1", False),
+        ("1.0", False),
+        ("1.0.0.0", False),
+        ("v1.0.0", False),
+        ("1.0.0-", False),
+        ("1.0.0+", False),
+        ("01.0.0", False),
+        ("1.0.0-01", False),
+        ("1.0.0-alpha..1", False),
+        ("1.0.0+build+1", False),
+        ("", False),
+        ("not.a.version", False),
+    ])
+    def test_version_validation(self, valid_manifest_data: Mapping[str, Any], version: str, valid: bool):
         """Test semantic version validation."""
-        # Valid versions
-        valid_versions = [
-            "1.0.0",
-            "0.1.0",
-            "10.20.30",
-            "1.0.0-alpha",
-            "1.0.0-alpha.1",
-            "1.0.0-0.3.7",
-            "1.0.0-x.7.z.92",
-            "1.0.0+20130313144700",
-            "1.0.0-beta+exp.sha.5114f85"
-        ]
-        for version in valid_versions:
-            data = valid_manifest_data.copy()
-            data["version"] = version
-            manifest = ConnectorManifest(**data)
-            assert manifest.version == version
-
-        # Invalid versions
-        invalid_versions = [
-            "1",
-            "1.0",
-            "1.0.0.0",
-            "v1.0.0",
-            "1.0.0-",
-            "1.0.0+",
-            "",
-            "not.a.version"
-        ]
-        for version in invalid_versions:
-            data = valid_manifest_data.copy()
-            data["version"] = version
+        data = valid_manifest_data | {"version": version}
+        if valid:
+            assert ConnectorManifest(**data).version == version
+        else:
             with pytest.raises(ValidationError):
                 ConnectorManifest(**data)
 
-    def test_tools_validation(self, valid_manifest_data: Dict[str, Any]):
+    def test_tools_validation(self, valid_manifest_data: Mapping[str, Any]):
         """Test tools list validation."""
         # Empty tools list
-        data = valid_manifest_data.copy()
-        data["tools"] = []
-        with pytest.raises(ValidationError) as exc_info:
+        data = valid_manifest_data | {"tools": []}
+        with pytest.raises(ValidationError, match="at least 1 item"):
             ConnectorManifest(**data)
-        assert "at least 1 item" in str(exc_info.value)
-
-        # Too many tools
-        data = valid_manifest_data.copy()
-        tool_template = data["tools"][0].copy()
-        data["tools"] = []
-        for i in range(51):  # exceeds max of 50
-            tool = tool_template.copy()
-            tool["name"] = f"tool_{i}"
-            tool["endpoint"] = f"endpoint_{i}"
-            data["tools"].append(tool)
+
+        # Too many tools; model_construct skips per-tool validation since
+        # only the list length rule is under test here
+        tool_template = valid_manifest_data["tools"][0]
+        tools = [  # exceeds max of 50
+            ConnectorTool.model_construct(
+                **(tool_template | {"name": f"tool_{i}", "endpoint": f"endpoint_{i}"})
+            )
+            for i in range(51)
+        ]
         
-        with pytest.raises(ValidationError) as exc_info:
-            ConnectorManifest(**data)
-        assert "at most 50 items" in str(exc_info.value)
+        with pytest.raises(ValidationError, match="at most 50 items"):
+            ConnectorManifest(**(valid_manifest_data | {"tools": tools}))
 
     def test_unique_tool_names(self, valid_manifest_data):
         """Test that tool names must be unique."""
-        data = valid_manifest_data.copy()
+        data = _fresh(valid_manifest_data)
         # Make both tools have the same name
         data["tools"][1]["name"] = data["tools"][0]["name"]
         
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Duplicate tool names"):
             ConnectorManifest(**data)
-        assert "Duplicate tool names" in str(exc_info.value)
 
     def test_unique_endpoints(self, valid_manifest_data):
         """Test that endpoints must be unique."""
-        data = valid_manifest_data.copy()
+        data = _fresh(valid_manifest_data)
         # Make both tools have the same endpoint
         data["tools"][1]["endpoint"] = data["tools"][0]["endpoint"]
         
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Duplicate endpoints"):
             ConnectorManifest(**data)
-        assert "Duplicate endpoints" in str(exc_info.value)
 
-    def test_yaml_format_conversion(self, valid_manifest_data):
+    def test_yaml_format_conversion(self, valid_manifest: ConnectorManifest):
         """Test conversion to/from YAML format."""
-        manifest = ConnectorManifest(**valid_manifest_data)
+        manifest = valid_manifest
         
         # Convert to YAML format
         yaml_dict = manifest.to_yaml_dict()
@@ -453,17 +449,31 @@ class TestConnectorManifest:
         assert manifest2.version == manifest.version
         assert len(manifest2.tools) == len(manifest.tools)
 
+        # Round trip through YAML document content
+        manifest3 = ConnectorManifest.from_yaml_bytes(yaml.safe_dump(yaml_dict).encode())
+        assert manifest3.to_yaml_dict() == yaml_dict
+
+    def test_yaml_non_finite_floats_preserved(self, valid_manifest: ConnectorManifest):
+        """Test that YAML .inf/.nan values in schemas survive loading."""
+        yaml_dict = valid_manifest.to_yaml_dict()
+        properties = yaml_dict["connector"]["tools"][0]["input_schema"].setdefault("properties", {})
+        properties["limit"] = {"type": "number", "maximum": float("inf"), "default": float("nan")}
+
+        manifest = ConnectorManifest.from_yaml_dict(yaml_dict)
+        limit = manifest.tools[0].input_schema["properties"]["limit"]
+        assert limit["maximum"] == float("inf")
+        assert math.isnan(limit["default"])
+
     def test_yaml_format_invalid(self):
         """Test error handling for invalid YAML format."""
         invalid_yaml = {"invalid": "structure"}
         
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="YAML must have top-level 'connector' key"):
             ConnectorManifest.from_yaml_dict(invalid_yaml)
-        assert "YAML must have top-level 'connector' key" in str(exc_info.value)
 
-    def test_tool_lookup_methods(self, valid_manifest_data):
+    def test_tool_lookup_methods(self, valid_manifest: ConnectorManifest):
         """Test tool lookup methods."""
-        manifest = ConnectorManifest(**valid_manifest_data)
+        manifest = valid_manifest
         
         # Test get_tool_by_name
         tool = manifest.get_tool_by_name("get_weather")
@@ -484,10 +494,39 @@ class TestConnectorManifest:
         # Test list_tool_names
         names = manifest.list_tool_names()
         assert names == ["get_weather", "get_forecast"]
+        assert manifest.tool_names == ("get_weather", "get_forecast")
+        assert manifest.tool_names is manifest.tool_names
 
-    def test_input_validation(self, valid_manifest_data):
-        """Test tool input validation."""
+    def test_list_tool_names_refreshes_on_assignment(self, valid_manifest_data):
+        """Test that the cached tool names and lookups follow reassignment of tools."""
+        manifest = ConnectorManifest(**valid_manifest_data)
+        assert manifest.list_tool_names() == ["get_weather", "get_forecast"]
+
+        manifest.tools = manifest.tools[1:]
+        assert manifest.list_tool_names() == ["get_forecast"]
+        assert manifest.tool_names == ("get_forecast",)
+        assert manifest.get_tool_by_name("get_weather") is None
+        assert manifest.get_tool_by_endpoint("weather.forecast").name == "get_forecast"
+
+    def test_tool_lookups_follow_tools_assignment(self, valid_manifest_data):
+        """Test that assigning tools and model_construct both rebuild the lookups."""
         manifest = ConnectorManifest(**valid_manifest_data)
+        extra = ConnectorTool(**{**valid_manifest_data["tools"][0], "name": "get_alerts", "endpoint": "weather.alerts"})
+
+        manifest.tools = [manifest.tools[0], extra]
+        assert isinstance(manifest.tools, list)
+        assert manifest.tool_names == ("get_weather", "get_alerts")
+        assert manifest.get_tool_by_name("get_alerts") is extra
+        assert manifest.get_tool_by_endpoint("weather.alerts") is extra
+        assert manifest.get_tool_by_name("get_forecast") is None
+
+        constructed = ConnectorManifest.model_construct(name="weather-api", version="1.0.0", tools=[extra])
+        assert constructed.list_tool_names() == ["get_alerts"]
+        assert constructed.get_tool_by_name("get_alerts") is extra
+
+    def test_input_validation(self, valid_manifest: ConnectorManifest):
+        """Test tool input validation."""
+        manifest = valid_manifest
         
         # Valid input
         valid_input = {"location": "New York"}
@@ -495,18 +534,16 @@ class TestConnectorManifest:
         
         # Invalid input - missing required field
         invalid_input = {}
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Input validation failed"):
             manifest.validate_tool_input("get_weather", invalid_input)
-        assert "Input validation failed" in str(exc_info.value)
         
         # Nonexistent tool
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Tool 'nonexistent' not found"):
             manifest.validate_tool_input("nonexistent", valid_input)
-        assert "Tool 'nonexistent' not found" in str(exc_info.value)
 
-    def test_output_validation(self, valid_manifest_data):
+    def test_output_validation(self, valid_manifest: ConnectorManifest):
         """Test tool output validation."""
-        manifest = ConnectorManifest(**valid_manifest_data)
+        manifest = valid_manifest
         
         # Valid output
         valid_output = {"temperature": 25.5}
@@ -514,11 +551,40 @@ class TestConnectorManifest:
         
         # Invalid output - missing required field
         invalid_output = {"humidity": 60}
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Output validation failed"):
             manifest.validate_tool_output("get_weather", invalid_output)
-        assert "Output validation failed" in str(exc_info.value)
         
         # Nonexistent tool
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Tool 'nonexistent' not found"):
             manifest.validate_tool_output("nonexistent", valid_output)
-        assert "Tool 'nonexistent' not found" in str(exc_info.value)
+
+    def test_schema_validators_are_cached(self, valid_manifest: ConnectorManifest, valid_manifest_data):
+        """Test that repeated validations against a tool's schemas reuse one compiled validator."""
+        from models.manifest import get_schema_validator
+        
+        manifest = valid_manifest
+        tool = manifest.get_tool_by_name("get_weather")
+        
+        manifest.validate_tool_input("get_weather", {"location": "Paris"})
+        validator = get_schema_validator(tool.input_schema)
+        manifest.validate_tool_input("get_weather", {"location": "Oslo"})
+        
+        assert get_schema_validator(tool.input_schema) is validator
+        
+        # An equal schema from a separately loaded manifest shares the validator
+        reloaded = ConnectorManifest(**_fresh(valid_manifest_data))
+        reloaded_schema = reloaded.get_tool_by_name("get_weather").input_schema
+        assert reloaded_schema is not tool.input_schema
+        assert get_schema_validator(reloaded_schema) is validator
+
+    def test_schema_validator_ignores_later_schema_mutation(self):
+        """Test that mutating a schema after first use does not change the cached validator."""
+        from models.manifest import get_schema_validator
+        
+        schema = {"type": "object", "properties": {"n": {"type": "integer"}}, "required": ["n"]}
+        validator = get_schema_validator(schema)
+        schema["required"] = []
+        
+        same_content = {"type": "object", "properties": {"n": {"type": "integer"}}, "required": ["n"]}
+        assert get_schema_validator(same_content) is validator
+        assert not validator.is_valid({})
@@ -5,30 +5,40 @@ This module contains comprehensive tests for all secret storage backends
 including local file storage and Azure Key Vault integration.
 """
 
-import pytest
-import tempfile
-import shutil
+import asyncio
 import os
-import sys
+import shutil
+import tempfile
+import time
+import pytest
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch
-from typing import Dict, Any
-
-# Add the parent directory to the path for package imports
-runtime_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-parent_dir = os.path.dirname(runtime_dir)
-sys.path.insert(0, parent_dir)
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from runtime.core.secrets import (
+from core.secrets import (
     SecretType,
     SecretMetadata,
+    SecretRecord,
     SecretValue,
-    SecretStorageError,
     SecretNotFoundError,
+    SecretStorageError,
     generate_secret_name
 )
-from runtime.core.local_secrets import LocalSecretStorage
-from runtime.core.secret_factory import SecretStorageFactory, SecretStorageType
+from core.local_secrets import LocalSecretStorage, _secret_file_name
+from core.secret_factory import SecretStorageFactory, SecretStorageType
+
+# Memory-backed filesystem used for storage tests when available (Linux)
+_SHM_DIR = Path("/dev/shm")
+
+# Mean latency budget for one LocalSecretStorage store + get cycle
+_STORE_GET_BUDGET_SECONDS = 0.005
+
+# Shared read-only metadata for the SecretValue tests
+_API_KEY_META = SecretMetadata(
+    name="test-key",
+    secret_type=SecretType.API_KEY,
+    connector_name="test"
+)
 
 
 class TestSecretMetadata:
@@ -45,12 +55,14 @@ class TestSecretMetadata:
             expires_at="2024-12-31T23:59:59Z"
         )
         
-        assert metadata.name == "test-secret"
-        assert metadata.secret_type == SecretType.API_KEY
-        assert metadata.connector_name == "@github/api"
-        assert metadata.description == "GitHub API token"
-        assert metadata.tags == {"env": "prod", "team": "platform"}
-        assert metadata.expires_at == "2024-12-31T23:59:59Z"
+        assert vars(metadata) == {
+            "name": "test-secret",
+            "secret_type": SecretType.API_KEY,
+            "connector_name": "@github/api",
+            "description": "GitHub API token",
+            "tags": {"env": "prod", "team": "platform"},
+            "expires_at": "2024-12-31T23:59:59Z",
+        }
 
     def test_secret_metadata_minimal(self):
         """Test creating SecretMetadata with minimal fields."""
@@ -60,12 +72,14 @@ class TestSecretMetadata:
             connector_name="slack"
         )
         
-        assert metadata.name == "simple-secret"
-        assert metadata.secret_type == SecretType.OAUTH2_CLIENT_ID
-        assert metadata.connector_name == "slack"
-        assert metadata.description is None
-        assert metadata.tags == {}
-        assert metadata.expires_at is None
+        assert vars(metadata) == {
+            "name": "simple-secret",
+            "secret_type": SecretType.OAUTH2_CLIENT_ID,
+            "connector_name": "slack",
+            "description": None,
+            "tags": {},
+            "expires_at": None,
+        }
 
 
 class TestSecretValue:
@@ -73,24 +87,14 @@ class TestSecretValue:
 
     def test_secret_value_creation(self):
         """Test creating SecretValue."""
-        metadata = SecretMetadata(
-            name="test-key",
-            secret_type=SecretType.API_KEY,
-            connector_name="test"
-        )
-        secret_value = SecretValue("secret123", metadata)
+        secret_value = SecretValue("secret123", _API_KEY_META)
         
         assert secret_value.value == "secret123"
-        assert secret_value.metadata == metadata
+        assert secret_value.metadata == _API_KEY_META
 
     def test_secret_value_str_redaction(self):
         """Test that SecretValue redacts the actual value in string representation."""
-        metadata = SecretMetadata(
-            name="test-key",
-            secret_type=SecretType.API_KEY,
-            connector_name="test"
-        )
-        secret_value = SecretValue("secret123", metadata)
+        secret_value = SecretValue("secret123", _API_KEY_META)
         
         str_repr = str(secret_value)
         assert "secret123" not in str_repr
@@ -99,12 +103,7 @@ class TestSecretValue:
 
     def test_secret_value_repr_redaction(self):
         """Test that SecretValue redacts the actual value in repr."""
-        metadata = SecretMetadata(
-            name="test-key",
-            secret_type=SecretType.API_KEY,
-            connector_name="test"
-        )
-        secret_value = SecretValue("secret123", metadata)
+        secret_value = SecretValue("secret123", _API_KEY_META)
         
         repr_str = repr(secret_value)
         assert "secret123" not in repr_str
@@ -115,56 +114,92 @@ class TestSecretValue:
 class TestGenerateSecretName:
     """Tests for generate_secret_name utility function."""
 
-    def test_generate_secret_name_basic(self):
-        """Test basic secret name generation."""
-        name = generate_secret_name("@github/api", SecretType.API_KEY)
-        assert name == "github-api-api_key"
-
-    def test_generate_secret_name_with_suffix(self):
-        """Test secret name generation with suffix."""
-        name = generate_secret_name("slack", SecretType.OAUTH2_CLIENT_ID, "prod")
-        assert name == "slack-oauth2_client_id-prod"
-
-    def test_generate_secret_name_special_chars(self):
-        """Test secret name generation with special characters."""
-        name = generate_secret_name("@org/my-connector", SecretType.API_KEY)
-        assert name == "org-my-connector-api_key"
+    @pytest.mark.parametrize("connector,secret_type,suffix,expected", [
+        pytest.param("@github/api", SecretType.API_KEY, None, "github-api-api_key", id="basic"),
+        pytest.param("slack", SecretType.OAUTH2_CLIENT_ID, "prod", "slack-oauth2_client_id-prod", id="with_suffix"),
+        pytest.param("@org/my-connector", SecretType.API_KEY, None, "org-my-connector-api_key", id="special_chars"),
+    ])
+    def test_generate_secret_name(self, connector, secret_type, suffix, expected):
+        """Test secret name generation, including scoped names with special characters."""
+        name = generate_secret_name(connector, secret_type, suffix)
+        assert name == expected
         assert "@" not in name
         assert "/" not in name
 
+    def test_generate_secret_name_is_cached(self):
+        """Test that repeated secret name lookups are served from the cache."""
+        generate_secret_name("@org/cached-connector", SecretType.OAUTH2_CLIENT_ID)
+        hits_before = generate_secret_name.cache_info().hits
+        
+        name = generate_secret_name("@org/cached-connector", SecretType.OAUTH2_CLIENT_ID)
+        
+        assert name == "org-cached-connector-oauth2_client_id"
+        assert generate_secret_name.cache_info().hits == hits_before + 1
+
+    def test_secret_file_path_is_cached(self, tmp_path):
+        """Test that secret file names are derived once per name and stay stable."""
+        storage = LocalSecretStorage(str(tmp_path))
+        first_path = storage._get_secret_file_path("@github/api-api_key")
+        hits_before = _secret_file_name.cache_info().hits
+        
+        assert storage._get_secret_file_path("@github/api-api_key") == first_path
+        assert first_path.parent == tmp_path
+        assert _secret_file_name.cache_info().hits == hits_before + 1
 
-@pytest.mark.asyncio
+
+# Run every storage test on the session loop instead of a fresh loop per test;
+# LocalSecretStorage holds no loop-bound state, so sharing the loop is safe
+@pytest.mark.asyncio(scope="session")
 class TestLocalSecretStorage:
     """Tests for LocalSecretStorage implementation."""
 
-    @pytest.fixture
-    async def temp_storage(self):
-        """Create a temporary storage directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        storage = LocalSecretStorage(temp_dir)
+    @pytest.fixture(scope="module")
+    def temp_storage(self, tmp_path_factory):
+        """Storage over one temporary directory shared by the module; emptied before each test.
+        
+        The directory lives on the /dev/shm tmpfs when the platform has one, so
+        secret and metadata writes stay in memory.
+        """
+        if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK):
+            storage_dir = Path(tempfile.mkdtemp(prefix="secrets-", dir=_SHM_DIR))
+        else:
+            storage_dir = tmp_path_factory.mktemp("secrets")
+        storage = LocalSecretStorage(str(storage_dir))
         yield storage
-        await storage.close()
-        shutil.rmtree(temp_dir)
+        # No close(): it is a no-op for file storage, and running it through
+        # asyncio.run() here would reset the loop the session-scoped tests use
+        if storage_dir.parent == _SHM_DIR:
+            shutil.rmtree(storage_dir, ignore_errors=True)
+
+    @pytest.fixture(autouse=True)
+    def _reset_storage(self, temp_storage):
+        """Start every test from an empty store."""
+        temp_storage.clear_all_secrets()
 
     @pytest.fixture
-    async def storage_with_secrets(self, temp_storage):
-        """Create storage with some test secrets."""
-        await temp_storage.store_secret(
-            name="github-token",
-            value="ghp_1234567890abcdef",
-            secret_type=SecretType.API_KEY,
-            connector_name="@github/api",
-            description="GitHub personal access token",
-            tags={"env": "test"}
-        )
+    def storage_with_secrets(self, temp_storage):
+        """Create storage with some test secrets.
         
-        await temp_storage.store_secret(
-            name="slack-client-id",
-            value="client123",
-            secret_type=SecretType.OAUTH2_CLIENT_ID,
-            connector_name="@slack/api",
-            description="Slack OAuth client ID"
-        )
+        Seeds through the storage's blocking bulk write, so the fixture is
+        synchronous and needs no event loop of its own.
+        """
+        temp_storage.store_secrets_blocking([
+            SecretRecord(
+                name="github-token",
+                value="ghp_1234567890abcdef",
+                secret_type=SecretType.API_KEY,
+                connector_name="@github/api",
+                description="GitHub personal access token",
+                tags={"env": "test"}
+            ),
+            SecretRecord(
+                name="slack-client-id",
+                value="client123",
+                secret_type=SecretType.OAUTH2_CLIENT_ID,
+                connector_name="@slack/api",
+                description="Slack OAuth client ID"
+            ),
+        ])
         
         return temp_storage
 
@@ -183,12 +218,149 @@ class TestLocalSecretStorage:
         secret_value = await temp_storage.get_secret("test-secret")
         
         assert secret_value.value == "super-secret-value"
-        assert secret_value.metadata.name == "test-secret"
-        assert secret_value.metadata.secret_type == SecretType.API_KEY
-        assert secret_value.metadata.connector_name == "test-connector"
-        assert secret_value.metadata.description == "Test secret"
-        assert secret_value.metadata.tags == {"env": "test", "version": "1.0"}
-        assert secret_value.metadata.expires_at == "2024-12-31T23:59:59Z"
+        assert vars(secret_value.metadata) == {
+            "name": "test-secret",
+            "secret_type": SecretType.API_KEY,
+            "connector_name": "test-connector",
+            "description": "Test secret",
+            "tags": {"env": "test", "version": "1.0"},
+            "expires_at": "2024-12-31T23:59:59Z",
+        }
+
+    async def test_store_secrets_bulk(self, temp_storage):
+        """Test storing several secrets with a single metadata write."""
+        records = [
+            SecretRecord(
+                name="bulk-client-id",
+                value="client123",
+                secret_type=SecretType.OAUTH2_CLIENT_ID,
+                connector_name="@slack/api"
+            ),
+            SecretRecord(
+                name="bulk-client-secret",
+                value="secret456",
+                secret_type=SecretType.OAUTH2_CLIENT_SECRET,
+                connector_name="@slack/api",
+                tags={"token_url": "https://slack.com/api/oauth.v2.access"}
+            ),
+        ]
+        
+        with patch.object(temp_storage, '_save_metadata', wraps=temp_storage._save_metadata) as save_metadata:
+            await temp_storage.store_secrets_bulk(records)
+        
+        save_metadata.assert_called_once()
+        
+        # A fresh instance over the same directory sees both secrets
+        reloaded = LocalSecretStorage(str(temp_storage.storage_dir))
+        assert (await reloaded.get_secret("bulk-client-id")).value == "client123"
+        client_secret = await reloaded.get_secret("bulk-client-secret")
+        assert client_secret.value == "secret456"
+        assert client_secret.metadata.tags == {"token_url": "https://slack.com/api/oauth.v2.access"}
+
+    async def test_concurrent_stores_are_all_persisted(self, temp_storage):
+        """Test that overlapping store_secret calls do not lose metadata updates."""
+        await asyncio.gather(*(
+            temp_storage.store_secret(
+                name=f"concurrent-{i}",
+                value=f"value-{i}",
+                secret_type=SecretType.API_KEY,
+                connector_name="test-connector"
+            )
+            for i in range(10)
+        ))
+        
+        reloaded = LocalSecretStorage(str(temp_storage.storage_dir))
+        assert len(await reloaded.list_secrets(connector_name="test-connector")) == 10
+        assert (await reloaded.get_secret("concurrent-7")).value == "value-7"
+
+    @pytest.mark.perf
+    async def test_store_and_get_latency_budget(self, temp_storage):
+        """Test that a store_secret/get_secret cycle stays within its latency budget."""
+        rounds = 50
+        started = time.perf_counter()
+        for i in range(rounds):
+            await temp_storage.store_secret(
+                name=f"perf-{i}",
+                value="perf-value",
+                secret_type=SecretType.API_KEY,
+                connector_name="perf-connector"
+            )
+            await temp_storage.get_secret(f"perf-{i}")
+        mean = (time.perf_counter() - started) / rounds
+        
+        # Generous enough for loaded CI workers; catches regressions such as
+        # per-call fsyncs or re-deriving keys, which cost milliseconds each
+        assert mean < _STORE_GET_BUDGET_SECONDS
+
+    async def test_reads_overlapping_writes(self, temp_storage):
+        """Test that listing and reading stay consistent while writes are in flight."""
+        # A large index makes list_secrets slow enough to overlap the writes
+        for i in range(5000):
+            temp_storage.metadata[f"bulk-{i}"] = {"secret_type": "api_key", "connector_name": "bulk"}
+        
+        results = await asyncio.gather(*(
+            coro
+            for i in range(20)
+            for coro in (
+                temp_storage.store_secret(
+                    name=f"overlap-{i}",
+                    value=f"value-{i}",
+                    secret_type=SecretType.API_KEY,
+                    connector_name="overlap"
+                ),
+                temp_storage.list_secrets(connector_name="bulk"),
+            )
+        ))
+        assert all(len(listed) == 5000 for listed in results[1::2])
+        
+        # A read racing a delete either sees the secret or reports it missing
+        reloaded = LocalSecretStorage(str(temp_storage.storage_dir))
+        read, _ = await asyncio.gather(
+            reloaded.get_secret("overlap-3"),
+            reloaded.delete_secret("overlap-3"),
+            return_exceptions=True
+        )
+        assert isinstance(read, SecretNotFoundError) or read.value == "value-3"
+
+    async def test_get_secret_uses_value_cache(self, temp_storage):
+        """Test that reads after a write skip decryption and loop-side stat(), and deletes drop the cached value."""
+        await temp_storage.store_secret(
+            name="cached-secret",
+            value="cached-value",
+            secret_type=SecretType.API_KEY,
+            connector_name="test-connector"
+        )
+        
+        with patch.object(temp_storage.fernet, 'decrypt') as decrypt, \
+                patch.object(temp_storage, '_file_signature') as file_signature:
+            assert (await temp_storage.get_secret("cached-secret")).value == "cached-value"
+        decrypt.assert_not_called()
+        # The signature check happens inside the threaded read
+        file_signature.assert_not_called()
+        
+        await temp_storage.delete_secret("cached-secret")
+        with pytest.raises(SecretNotFoundError):
+            await temp_storage.get_secret("cached-secret")
+
+    async def test_get_secret_sees_rotation_by_another_instance(self, temp_storage):
+        """Test that a value rewritten through a second storage on the same directory is not served stale."""
+        await temp_storage.store_secret(
+            name="rotated-secret",
+            value="old-value",
+            secret_type=SecretType.API_KEY,
+            connector_name="test-connector"
+        )
+        assert (await temp_storage.get_secret("rotated-secret")).value == "old-value"
+
+        other = LocalSecretStorage(str(temp_storage.storage_dir))
+        await other.store_secret(
+            name="rotated-secret",
+            value="rotated-value",
+            secret_type=SecretType.API_KEY,
+            connector_name="test-connector"
+        )
+
+        assert (await temp_storage.get_secret("rotated-secret")).value == "rotated-value"
 
     async def test_get_nonexistent_secret(self, temp_storage):
         """Test retrieving a non-existent secret."""
@@ -257,6 +429,27 @@ class TestLocalSecretStorage:
         assert secret_value.metadata.tags == {"env": "prod", "updated": "true"}
         assert secret_value.metadata.expires_at == "2025-01-01T00:00:00Z"
 
+    async def test_upsert_secret(self, storage_with_secrets):
+        """Test that upserting replaces the value and merges metadata with one metadata write."""
+        created_at = storage_with_secrets.metadata["github-token"]["created_at"]
+        
+        with patch.object(storage_with_secrets, '_save_metadata', wraps=storage_with_secrets._save_metadata) as save_metadata:
+            await storage_with_secrets.upsert_secret(SecretRecord(
+                name="github-token",
+                value="ghp_rotated",
+                secret_type=SecretType.API_KEY,
+                connector_name="@github/api",
+                expires_at="2025-01-01T00:00:00Z"
+            ))
+        
+        save_metadata.assert_called_once()
+        secret_value = await storage_with_secrets.get_secret("github-token")
+        assert secret_value.value == "ghp_rotated"
+        assert secret_value.metadata.description == "GitHub personal access token"
+        assert secret_value.metadata.tags == {"env": "test"}
+        assert secret_value.metadata.expires_at == "2025-01-01T00:00:00Z"
+        assert storage_with_secrets.metadata["github-token"]["created_at"] == created_at
+
     async def test_update_nonexistent_secret_metadata(self, temp_storage):
         """Test updating metadata for non-existent secret."""
         with pytest.raises(SecretNotFoundError):
@@ -265,18 +458,23 @@ class TestLocalSecretStorage:
     async def test_clear_all_secrets(self, storage_with_secrets):
         """Test clearing all secrets."""
         # Verify secrets exist
-        secrets = await storage_with_secrets.list_secrets()
-        assert len(secrets) == 2
+        names = {secret.name for secret in await storage_with_secrets.list_secrets()}
+        assert names == {"github-token", "slack-client-id"}
         
         # Clear all secrets
         storage_with_secrets.clear_all_secrets()
         
-        # Verify all secrets are gone
-        secrets = await storage_with_secrets.list_secrets()
-        assert len(secrets) == 0
-        
-        assert await storage_with_secrets.secret_exists("github-token") is False
-        assert await storage_with_secrets.secret_exists("slack-client-id") is False
+        # Verify all secrets are gone, including their files on disk
+        assert await storage_with_secrets.list_secrets() == []
+        assert not any(storage_with_secrets.storage_dir.glob("*.secret"))
+
+    async def test_blocking_writes_refuse_while_write_lock_held(self, storage_with_secrets):
+        """Test that synchronous writes do not race an async writer holding the lock."""
+        async with storage_with_secrets._write_lock:
+            with pytest.raises(SecretStorageError, match="write is in progress"):
+                storage_with_secrets.clear_all_secrets()
+
+        assert len(await storage_with_secrets.list_secrets()) == 2
 
 
 class TestSecretStorageFactory:
@@ -296,24 +494,21 @@ class TestSecretStorageFactory:
         with pytest.raises(ValueError, match="Unsupported storage type"):
             SecretStorageFactory.create_storage(storage_type="invalid")
 
-    @patch('runtime.core.secret_factory.get_settings')
-    def test_detect_storage_type_development(self, mock_get_settings):
+    def test_detect_storage_type_development(self, monkeypatch):
         """Test auto-detection defaults to local in development."""
-        mock_settings = Mock()
-        mock_settings.is_development.return_value = True
-        mock_settings.AZURE_KEY_VAULT_URL = None
-        mock_get_settings.return_value = mock_settings
+        fake_settings = SimpleNamespace(is_development=lambda: True, AZURE_KEY_VAULT_URL=None)
+        monkeypatch.setattr('core.secret_factory.get_settings', lambda: fake_settings)
         
         storage_type = SecretStorageFactory._detect_storage_type()
         assert storage_type == SecretStorageType.LOCAL
 
-    @patch('runtime.core.secret_factory.get_settings')
-    def test_detect_storage_type_azure(self, mock_get_settings):
+    def test_detect_storage_type_azure(self, monkeypatch):
         """Test auto-detection chooses Azure when configured and not in dev."""
-        mock_settings = Mock()
-        mock_settings.is_development.return_value = False
-        mock_settings.AZURE_KEY_VAULT_URL = "https://test.vault.azure.net/"
-        mock_get_settings.return_value = mock_settings
+        fake_settings = SimpleNamespace(
+            is_development=lambda: False,
+            AZURE_KEY_VAULT_URL="https://test.vault.azure.net/"
+        )
+        monkeypatch.setattr('core.secret_factory.get_settings', lambda: fake_settings)
         
         storage_type = SecretStorageFactory._detect_storage_type()
-        assert storage_type == SecretStorageType.AZURE_KEYVAULT
\ No newline at end of file
+        assert storage_type == SecretStorageType.AZURE_KEYVAULT